@@ -7,10 +7,47 @@ For more information on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
 """
 
+import asyncio
 import os
 
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "linkedrants.settings")
+# Sync ORM calls run in a thread pool here, and persistent connections are
+# per thread, so they would pile up rather than be reused (see settings)
+os.environ.setdefault("DATABASE_CONN_MAX_AGE", "0")
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+from django.conf import settings  # noqa: E402
+
+from translator.ai_clients import awarm_up  # noqa: E402
+
+_background_tasks = set()
+
+
+async def lifespan(receive, send):
+    """
+    Django doesn't handle the ASGI lifespan protocol, so worker startup is
+    handled here: with TRANSLATOR_WARMUP on, translation provider
+    connections are opened on the worker's event loop (where the async
+    views reuse them) without holding up startup.
+    """
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            if settings.TRANSLATOR_WARMUP:
+                task = asyncio.ensure_future(awarm_up())
+                _background_tasks.add(task)
+                task.add_done_callback(_background_tasks.discard)
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def application(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        await lifespan(receive, send)
+    else:
+        await django_application(scope, receive, send)
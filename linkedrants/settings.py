@@ -71,12 +71,22 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "linkedrants.wsgi.application"
-
-# Database - use DATABASE_URL in production, SQLite in dev
+ASGI_APPLICATION = "linkedrants.asgi.application"
+
+# Database - use DATABASE_URL in production, SQLite in dev. Connections are
+# kept for CONN_MAX_AGE seconds in the sync processes (job worker,
+# scheduler). Under ASGI, Django runs sync ORM code on a pool of threads and
+# a persistent connection belongs to the thread that opened it, so kept
+# connections leak until Postgres runs out of slots; asgi.py sets
+# DATABASE_CONN_MAX_AGE=0 to close them after each request. Put a pooler
+# such as PgBouncer in front of the database if connection setup shows up.
 DATABASE_URL = os.getenv('DATABASE_URL')
 if DATABASE_URL:
     DATABASES = {
-        'default': dj_database_url.config(default=DATABASE_URL, conn_max_age=600)
+        'default': dj_database_url.config(
+            default=DATABASE_URL,
+            conn_max_age=int(os.getenv('DATABASE_CONN_MAX_AGE', '600')),
+        )
     }
 else:
     DATABASES = {
@@ -119,10 +129,103 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # Anthropic API for LinkedIn Translator
 ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY', '')
 
+# Translation share-page view counts: 0 writes each view immediately with an
+# atomic UPDATE; > 0 coalesces views in memory and flushes every N seconds.
+TRANSLATION_VIEW_COUNT_FLUSH_INTERVAL = float(os.getenv('TRANSLATION_VIEW_COUNT_FLUSH_INTERVAL', '0'))
+
+# Translator result cache: identical (normalized) input and mode is answered
+# from an in-process LRU of this many entries, backed by the
+# CachedTranslation table. Results older than the TTL (seconds) are ignored;
+# a TTL of 0 disables the cache.
+TRANSLATION_CACHE_SIZE = int(os.getenv('TRANSLATION_CACHE_SIZE', '1000'))
+TRANSLATION_CACHE_TTL = int(os.getenv('TRANSLATION_CACHE_TTL', str(7 * 24 * 3600)))
+
+# Build translator SDK clients and open their connections when a web worker
+# starts (the lifespan handler in asgi.py) instead of on the first
+# translation.
+TRANSLATOR_WARMUP = os.getenv('TRANSLATOR_WARMUP', 'False').lower() == 'true'
+
+# Hedged translations: when > 0 and several providers are enabled, a second
+# provider is started if the first hasn't answered within this many seconds
+# (about the primary's p90 latency) and the first answer wins. 0 tries
+# providers one at a time.
+TRANSLATOR_HEDGE_DELAY = float(os.getenv('TRANSLATOR_HEDGE_DELAY', '0'))
+
+# Adaptive provider routing: each worker tracks an EWMA (smoothing factor
+# ALPHA) of every provider's latency and error rate and routes more traffic
+# to the fastest healthy one. After BREAKER_THRESHOLD failures in a row a
+# provider gets no traffic for BREAKER_COOLDOWN seconds.
+TRANSLATOR_EWMA_ALPHA = float(os.getenv('TRANSLATOR_EWMA_ALPHA', '0.2'))
+TRANSLATOR_BREAKER_THRESHOLD = int(os.getenv('TRANSLATOR_BREAKER_THRESHOLD', '3'))
+TRANSLATOR_BREAKER_COOLDOWN = float(os.getenv('TRANSLATOR_BREAKER_COOLDOWN', '30'))
+
+# Translation time budget: a translation gives up after DEADLINE seconds in
+# total. This is what bounds a translation request: under UvicornWorker,
+# gunicorn's --timeout only checks that the worker process is alive and
+# never cuts off a slow request. Keep it under the time clients and any
+# proxy in front of the app will wait for a response. Each provider call
+# gets the remaining budget, at most ATTEMPT_TIMEOUT seconds, and transient
+# errors are retried RETRIES times per provider with jittered backoff.
+TRANSLATOR_DEADLINE = float(os.getenv('TRANSLATOR_DEADLINE', '25'))
+TRANSLATOR_ATTEMPT_TIMEOUT = float(os.getenv('TRANSLATOR_ATTEMPT_TIMEOUT', '10'))
+TRANSLATOR_RETRIES = int(os.getenv('TRANSLATOR_RETRIES', '1'))
+
+# Background translation jobs: when on, the translator views enqueue a
+# TranslationJob and clients poll for the result, which a
+# `manage.py run_translation_jobs` worker produces. Idle workers check for
+# work every POLL_INTERVAL seconds; jobs running longer than STALE_AFTER
+# seconds are assumed abandoned and requeued. Finished jobs are deleted
+# after RETENTION_DAYS (0 keeps them).
+TRANSLATOR_JOB_MODE = os.getenv('TRANSLATOR_JOB_MODE', 'False').lower() == 'true'
+TRANSLATOR_JOB_POLL_INTERVAL = float(os.getenv('TRANSLATOR_JOB_POLL_INTERVAL', '1'))
+TRANSLATOR_JOB_STALE_AFTER = float(os.getenv('TRANSLATOR_JOB_STALE_AFTER', '120'))
+TRANSLATOR_JOB_RETENTION_DAYS = float(os.getenv('TRANSLATOR_JOB_RETENTION_DAYS', '7'))
+
+# Cache for rendered card fragments ({% cache %} in the card partials) and
+# whole share pages. Per-process by default; the default 300 entries would
+# thrash on list pages. Set REDIS_URL when running more than one worker so
+# share page invalidations reach all of them.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'OPTIONS': {'MAX_ENTRIES': int(os.getenv('CACHE_MAX_ENTRIES', '10000'))},
+    }
+}
+if os.getenv('REDIS_URL'):
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.getenv('REDIS_URL'),
+    }
+
+# Anonymous /real/ and /vs/ responses are cached whole for this many seconds.
+# Edits and reactions invalidate them; the timeout bounds how stale the
+# relative timestamps and related rants can get.
+SHARE_PAGE_CACHE_TIMEOUT = int(os.getenv('SHARE_PAGE_CACHE_TIMEOUT', '600'))
+
 # Session settings (for anonymous reactions)
 SESSION_ENGINE = "django.contrib.sessions.backends.db"
 SESSION_COOKIE_AGE = 60 * 60 * 24 * 365  # 1 year
 
+# Share page view tracking: views are buffered in memory and bulk-inserted
+# when half this many are pending or every FLUSH_INTERVAL seconds. The buffer
+# size caps the views held (and lost if a worker crashes); views arriving
+# while it is full are dropped and counted. 1 writes synchronously.
+CONTENT_VIEW_BUFFER_SIZE = int(os.getenv('CONTENT_VIEW_BUFFER_SIZE', '100'))
+CONTENT_VIEW_FLUSH_INTERVAL = float(os.getenv('CONTENT_VIEW_FLUSH_INTERVAL', '5'))
+# Raw ContentView rows older than this are pruned after each rollup once
+# they have been folded into the hourly/daily rollups (0 keeps them).
+CONTENT_VIEW_RETENTION_DAYS = int(os.getenv('CONTENT_VIEW_RETENTION_DAYS', '90'))
+# Seconds between rollup and pruning runs in the `run_scheduler` clock process
+CONTENT_VIEW_ROLLUP_INTERVAL = float(os.getenv('CONTENT_VIEW_ROLLUP_INTERVAL', '300'))
+# Seconds between incremental Hall of Fame leaderboard refreshes (run_scheduler)
+LEADERBOARD_REFRESH_INTERVAL = float(os.getenv('LEADERBOARD_REFRESH_INTERVAL', '60'))
+# Seconds between trending (hotness) score updates (run_scheduler)
+TRENDING_UPDATE_INTERVAL = float(os.getenv('TRENDING_UPDATE_INTERVAL', '60'))
+
+# Seconds between checks for a changed company list in each worker's
+# autocomplete index (0 checks on every lookup).
+COMPANY_INDEX_CHECK_INTERVAL = float(os.getenv('COMPANY_INDEX_CHECK_INTERVAL', '30'))
+
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
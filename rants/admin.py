@@ -1,5 +1,17 @@
 from django.contrib import admin
-from .models import Category, Rant, SideBySide, GhostingStory, Reaction, ContentView
+from django.db.models import Sum
+from django.utils import timezone
+
+from . import companies, page_cache, search
+from .models import (
+    Category, Rant, SideBySide, GhostingStory, Reaction, ContentView,
+    HourlyContentViews, DailyContentViews, Watermark, LeaderboardEntry, Company,
+)
+
+
+def invalidate_share_pages(kind, queryset):
+    for share_slug in queryset.values_list('share_slug', flat=True):
+        page_cache.invalidate(kind, share_slug)
 
 
 @admin.register(Category)
@@ -11,20 +23,34 @@ class CategoryAdmin(admin.ModelAdmin):
 
 @admin.register(Rant)
 class RantAdmin(admin.ModelAdmin):
-    list_display = ['title', 'share_slug', 'category', 'is_anonymous', 'is_approved', 'is_featured', 'created_at']
+    list_display = ['title', 'share_slug', 'category', 'is_anonymous', 'is_approved', 'is_featured', 'view_total', 'created_at']
     list_filter = ['category', 'is_approved', 'is_featured', 'is_reported', 'created_at']
     search_fields = ['title', 'body', 'display_name', 'share_slug']
     readonly_fields = ['id', 'share_slug', 'created_at', 'updated_at']
     date_hierarchy = 'created_at'
     actions = ['approve_rants', 'feature_rants', 'unflag_rants']
 
+    def get_queryset(self, request):
+        # View totals come from the daily rollups, not the raw ContentView rows
+        return super().get_queryset(request).annotate(view_total=Sum('dailycontentviews__views'))
+
+    @admin.display(description='Views', ordering='view_total')
+    def view_total(self, obj):
+        return obj.view_total or 0
+
     @admin.action(description="Approve selected rants")
     def approve_rants(self, request, queryset):
-        queryset.update(is_approved=True)
+        # update() skips auto_now; updated_at is part of the cached card key
+        queryset.update(is_approved=True, updated_at=timezone.now())
+        # update() skips the save signals that keep search and the share
+        # page cache in sync
+        search.index_objects('rant', queryset)
+        invalidate_share_pages('rant', queryset)
 
     @admin.action(description="Feature selected rants")
     def feature_rants(self, request, queryset):
-        queryset.update(is_featured=True)
+        queryset.update(is_featured=True, updated_at=timezone.now())
+        invalidate_share_pages('rant', queryset)
 
     @admin.action(description="Clear reports on selected rants")
     def unflag_rants(self, request, queryset):
@@ -33,12 +59,19 @@ class RantAdmin(admin.ModelAdmin):
 
 @admin.register(SideBySide)
 class SideBySideAdmin(admin.ModelAdmin):
-    list_display = ['context', 'share_slug', 'is_anonymous', 'is_approved', 'is_featured', 'created_at']
+    list_display = ['context', 'share_slug', 'is_anonymous', 'is_approved', 'is_featured', 'view_total', 'created_at']
     list_filter = ['is_approved', 'is_featured', 'is_reported', 'created_at']
     search_fields = ['context', 'linkedin_version', 'reality_version', 'display_name', 'share_slug']
     readonly_fields = ['id', 'share_slug', 'created_at', 'updated_at']
     date_hierarchy = 'created_at'
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(view_total=Sum('dailycontentviews__views'))
+
+    @admin.display(description='Views', ordering='view_total')
+    def view_total(self, obj):
+        return obj.view_total or 0
+
 
 @admin.register(GhostingStory)
 class GhostingStoryAdmin(admin.ModelAdmin):
@@ -51,17 +84,31 @@ class GhostingStoryAdmin(admin.ModelAdmin):
 
     @admin.action(description="Approve selected stories")
     def approve_stories(self, request, queryset):
-        queryset.update(is_approved=True)
+        newly_approved = list(queryset.filter(is_approved=False))
+        queryset.update(is_approved=True, updated_at=timezone.now())
+        # update() skips the save signals that maintain these
+        for story in newly_approved:
+            story.is_approved = True
+        companies.apply_story_changes(added=[companies.counted_key(story) for story in newly_approved])
+        search.index_objects('ghosting', queryset)
 
     @admin.action(description="Feature selected stories")
     def feature_stories(self, request, queryset):
-        queryset.update(is_featured=True)
+        queryset.update(is_featured=True, updated_at=timezone.now())
 
     @admin.action(description="Clear reports on selected stories")
     def unflag_stories(self, request, queryset):
         queryset.update(is_reported=False, report_count=0)
 
 
+@admin.register(Company)
+class CompanyAdmin(admin.ModelAdmin):
+    list_display = ['name', 'slug', 'story_count', 'created_at']
+    search_fields = ['name', 'slug']
+    readonly_fields = ['slug', 'created_at']
+    ordering = ['-story_count']
+
+
 @admin.register(Reaction)
 class ReactionAdmin(admin.ModelAdmin):
     list_display = ['reaction_type', 'rant', 'sidebyside', 'ghosting_story', 'created_at']
@@ -85,3 +132,40 @@ class ContentViewAdmin(admin.ModelAdmin):
             return f"Ghosting: {obj.ghosting_story.company}"
         return "Unknown"
     get_content.short_description = 'Content'
+
+
+class ContentViewRollupAdmin(admin.ModelAdmin):
+    list_display = ['get_content', 'referrer', 'views']
+    list_filter = ['referrer']
+    list_select_related = ['rant', 'sidebyside', 'ghosting_story']
+    readonly_fields = ['rant', 'sidebyside', 'ghosting_story', 'referrer', 'views']
+
+    def get_content(self, obj):
+        return ContentViewAdmin.get_content(self, obj)
+    get_content.short_description = 'Content'
+
+
+@admin.register(HourlyContentViews)
+class HourlyContentViewsAdmin(ContentViewRollupAdmin):
+    list_display = ['get_content', 'referrer', 'views', 'hour']
+    date_hierarchy = 'hour'
+
+
+@admin.register(DailyContentViews)
+class DailyContentViewsAdmin(ContentViewRollupAdmin):
+    list_display = ['get_content', 'referrer', 'views', 'day']
+    date_hierarchy = 'day'
+
+
+@admin.register(Watermark)
+class WatermarkAdmin(admin.ModelAdmin):
+    list_display = ['name', 'value', 'updated_at']
+    readonly_fields = ['updated_at']
+
+
+@admin.register(LeaderboardEntry)
+class LeaderboardEntryAdmin(admin.ModelAdmin):
+    list_display = ['rank', 'kind', 'window', 'score', 'content', 'updated_at']
+    list_filter = ['kind', 'window']
+    list_select_related = ['rant', 'sidebyside', 'ghosting_story']
+    readonly_fields = ['kind', 'window', 'rank', 'score', 'rant', 'sidebyside', 'ghosting_story', 'updated_at']
@@ -0,0 +1,171 @@
+"""
+In-process prefix index for company autocomplete.
+
+Each worker keeps a sorted array of normalized company names (one entry
+per word, so "piper" finds "Pied Piper") and answers keystrokes with
+bisect, ranked by story count. Prefixes that match too many names to
+rank per keystroke have their suggestions precomputed.
+
+The index is built on first use. A 'company_index' Watermark is bumped
+whenever company counters change; a background thread checks it every
+COMPANY_INDEX_CHECK_INTERVAL seconds and rebuilds when it moved, so
+lookups themselves never touch the database. An interval of 0 checks the
+version on every lookup instead.
+"""
+
+import heapq
+import logging
+import threading
+import time
+from bisect import bisect_left
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import F
+
+from .models import Company, Watermark
+
+logger = logging.getLogger(__name__)
+
+VERSION_NAME = 'company_index'
+# Prefixes matching more entries than this have their suggestions precomputed
+SCAN_LIMIT = 64
+MAX_SUGGESTIONS = 8
+
+
+def normalize(text):
+    return ' '.join(text.lower().split())
+
+
+def bump_version():
+    """Tell every worker its company index is stale."""
+    if not Watermark.objects.filter(name=VERSION_NAME).update(value=F('value') + 1):
+        Watermark.objects.get_or_create(name=VERSION_NAME, defaults={'value': 1})
+
+
+def current_version():
+    return Watermark.objects.filter(name=VERSION_NAME).values_list('value', flat=True).first() or 0
+
+
+class PrefixIndex:
+    """Immutable prefix index over (name, story_count) pairs."""
+
+    def __init__(self, companies):
+        entries = []
+        for name, story_count in companies:
+            words = normalize(name).split()
+            for i in range(len(words)):
+                entries.append((' '.join(words[i:]), -story_count, name))
+        entries.sort()
+        self.entries = entries
+        self.keys = [key for key, _, _ in entries]
+
+        self.precomputed = self._precompute()
+
+    def _precompute(self):
+        """Suggestions for every prefix that matches more than SCAN_LIMIT entries."""
+        precomputed = {}
+        # Walk down from the empty prefix, one character at a time. Entries
+        # sharing a prefix are contiguous, and only ranges that are still
+        # too long to scan are split further.
+        stack = [('', 0, len(self.keys))]
+        while stack:
+            prefix, start, end = stack.pop()
+            depth = len(prefix) + 1
+            i = start
+            while i < end:
+                key = self.keys[i]
+                if len(key) < depth:
+                    i += 1
+                    continue
+                child = key[:depth]
+                j = bisect_left(self.keys, child + '\uffff', i, end)
+                if j - i > SCAN_LIMIT:
+                    matches = ((rank, name) for _, rank, name in self.entries[i:j])
+                    precomputed[child] = self._best(matches, MAX_SUGGESTIONS)
+                    stack.append((child, i, j))
+                i = j
+        return precomputed
+
+    def __len__(self):
+        return len(self.entries)
+
+    @staticmethod
+    def _best(matches, limit):
+        """Highest story counts first, each name once."""
+        # A name can match on more than one word, so take a few spares
+        best = []
+        for rank, name in heapq.nsmallest(limit * 3, matches):
+            if name not in best:
+                best.append(name)
+                if len(best) == limit:
+                    break
+        return best
+
+    def lookup(self, prefix, limit=MAX_SUGGESTIONS):
+        """Company names starting with `prefix` (at any word), best first."""
+        key = normalize(prefix)
+        if not key:
+            return []
+        if key in self.precomputed:
+            return self.precomputed[key][:limit]
+
+        # Not precomputed, so at most SCAN_LIMIT entries match
+        start = bisect_left(self.keys, key)
+        end = bisect_left(self.keys, key + '\uffff', lo=start)
+        return self._best(((rank, name) for _, rank, name in self.entries[start:end]), limit)
+
+
+class CompanyIndex:
+    """A worker's current PrefixIndex, rebuilt in the background when stale."""
+
+    def __init__(self, check_interval):
+        self.check_interval = check_interval
+        self._index = None
+        self._version = None
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def lookup(self, prefix, limit=MAX_SUGGESTIONS):
+        index = self._index
+        if index is None or (self.check_interval <= 0 and current_version() != self._version):
+            with self._lock:
+                if self._index is index:  # not rebuilt by another thread meanwhile
+                    if index is None:
+                        self._start_thread()
+                    self.rebuild()
+                index = self._index
+        return index.lookup(prefix, limit)
+
+    def rebuild(self):
+        # Read the version first so a change during the build is seen next time
+        version = current_version()
+        index = PrefixIndex(
+            Company.objects.filter(story_count__gt=0).values_list('name', 'story_count')
+        )
+        self._index, self._version = index, version
+        return index
+
+    def _start_thread(self):
+        # With no interval, lookup() checks the version itself
+        if self.check_interval <= 0:
+            return
+        self._thread = threading.Thread(target=self._run, name='company-index-refresher', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.check_interval)
+            try:
+                if current_version() != self._version:
+                    self.rebuild()
+            except Exception:
+                logger.exception("Company index refresh failed")
+            finally:
+                # Don't hold a DB connection open between checks
+                connection.close()
+
+
+company_index = CompanyIndex(
+    check_interval=getattr(settings, 'COMPANY_INDEX_CHECK_INTERVAL', 30),
+)
@@ -0,0 +1,161 @@
+"""
+Company canonicalization and the per-company story counters.
+
+Stories point at a canonical Company (see GhostingStory.canonical_company).
+Company counters cover approved stories only and are adjusted with F()
+updates as stories are created, edited, approved or deleted, so the worst
+offenders page never has to GROUP BY over the stories table.
+"""
+
+import hashlib
+import unicodedata
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils.text import slugify
+
+from .autocomplete import bump_version
+from .models import Company, GhostingStory
+
+# Trailing words that don't distinguish one employer from another
+LEGAL_SUFFIXES = {
+    'inc', 'incorporated', 'llc', 'llp', 'lp', 'ltd', 'limited', 'corp',
+    'corporation', 'co', 'company', 'plc', 'gmbh', 'ag', 'sa', 'bv', 'pty',
+}
+
+# Words that can't name a company on their own ("The Company" stays whole)
+GENERIC_WORDS = LEGAL_SUFFIXES | {'the', 'a', 'an', 'and', 'of'}
+
+
+def clean_company_name(name):
+    """Collapse whitespace in a submitted company name."""
+    return ' '.join(name.split())
+
+
+def _fold_accents(name):
+    """Strip accents from Latin letters only; other scripts are kept as written."""
+    folded = []
+    for char in unicodedata.normalize('NFKC', name):
+        base = ''.join(c for c in unicodedata.normalize('NFKD', char) if not unicodedata.combining(c))
+        folded.append(base if base.isascii() else char)
+    return ''.join(folded)
+
+
+def canonical_slug(name):
+    """
+    The canonical key for a company name.
+
+    Case, punctuation, accents and legal suffixes are ignored, so
+    "Google", "google " and "Google, LLC" all give "google". Non-Latin names
+    keep their own letters ("Яндекс" gives "яндекс"), and a name with no
+    letters or digits at all gets a key derived from its exact spelling.
+    """
+    words = [word for word in slugify(_fold_accents(name).casefold(), allow_unicode=True).split('-') if word]
+    if not words:
+        digest = hashlib.sha1(clean_company_name(name).casefold().encode()).hexdigest()[:12]
+        return f'company-{digest}'
+    while words[-1] in LEGAL_SUFFIXES and not GENERIC_WORDS.issuperset(words[:-1]):
+        words.pop()
+    return '-'.join(words)
+
+
+def company_for_name(name):
+    """Get or create the canonical Company for a submitted name."""
+    company, _ = Company.objects.get_or_create(
+        slug=canonical_slug(name)[:200],
+        defaults={'name': clean_company_name(name)[:200]},
+    )
+    return company
+
+
+def counted_key(story):
+    """
+    What a story contributes to the counters: (company_id, stage, platform),
+    or None if it isn't counted.
+    """
+    if not story.is_approved or story.canonical_company_id is None:
+        return None
+    return (story.canonical_company_id, story.stage, story.platform)
+
+
+def _deltas(keys, sign):
+    """Per-company {counter field: delta} for a list of counted keys."""
+    deltas = defaultdict(Counter)
+    for key in keys:
+        if key is None:
+            continue
+        company_id, stage, platform = key
+        deltas[company_id]['story_count'] += sign
+        deltas[company_id][Company.stage_field(stage)] += sign
+        deltas[company_id][Company.platform_field(platform)] += sign
+    return deltas
+
+
+def apply_story_changes(removed=(), added=()):
+    """
+    Adjust company counters for stories that stopped or started counting.
+
+    `removed` and `added` are counted_key() values; None entries are ignored.
+    """
+    deltas = _deltas(removed, -1)
+    for company_id, fields in _deltas(added, 1).items():
+        deltas[company_id].update(fields)
+
+    changed = False
+    with transaction.atomic():
+        for company_id, fields in deltas.items():
+            changes = {field: F(field) + delta for field, delta in fields.items() if delta}
+            if changes:
+                Company.objects.filter(pk=company_id).update(**changes)
+                changed = True
+        if changed:
+            # Autocomplete ranks by story count
+            bump_version()
+
+
+def counter_fields():
+    """Every counter column on Company."""
+    return (
+        ['story_count']
+        + [Company.stage_field(code) for code, _ in GhostingStory.STAGE_CHOICES]
+        + [Company.platform_field(code) for code, _ in GhostingStory.PLATFORM_CHOICES]
+    )
+
+
+def rebuild_company_counts(batch_size=500):
+    """
+    Recompute every company's counters from the approved stories.
+
+    Returns the number of companies whose counters were out of date.
+    """
+    fields = counter_fields()
+    counts = defaultdict(Counter)
+    rows = (
+        GhostingStory.objects.filter(is_approved=True, canonical_company__isnull=False)
+        .values_list('canonical_company', 'stage', 'platform')
+        .annotate(n=Count('id'))
+        .order_by()
+    )
+    for company_id, stage, platform, n in rows:
+        counts[company_id]['story_count'] += n
+        counts[company_id][Company.stage_field(stage)] += n
+        counts[company_id][Company.platform_field(platform)] += n
+
+    stale = []
+    for company in Company.objects.only('pk', *fields).iterator(chunk_size=batch_size):
+        expected = counts.get(company.pk, {})
+        changed = False
+        for field in fields:
+            value = expected.get(field, 0)
+            if getattr(company, field) != value:
+                setattr(company, field, value)
+                changed = True
+        if changed:
+            stale.append(company)
+
+    with transaction.atomic():
+        Company.objects.bulk_update(stale, fields, batch_size=batch_size)
+        if stale:
+            bump_version()
+    return len(stale)
@@ -0,0 +1,191 @@
+"""
+Precomputed Hall of Fame leaderboards (see LeaderboardEntry).
+
+The scheduler refreshes them incrementally. ReactView stamps `reacted_at`
+on content whenever a reaction is added or removed, so each run only
+rescores items reacted to since the previous run, plus (for the week and
+month boards) items whose reactions have since aged out of the window,
+and merges them into the stored board. A board is recomputed from scratch
+only when a full board loses score at the bottom, since an item that is
+not on it could then belong there.
+"""
+
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from .models import Reaction, LeaderboardEntry, Watermark
+from .reactions import CONTENT_TYPES
+
+# Entries kept per (kind, window)
+LEADERBOARD_SIZE = 500
+
+# Rolling window lengths; 'all' ranks by the denormalized reaction_count
+WINDOW_DAYS = {
+    'week': 7,
+    'month': 30,
+}
+WINDOWS = list(WINDOW_DAYS) + ['all']
+
+WATERMARK_NAME = 'leaderboards'
+# Reach back this far past the last run for reactions still committing then
+OVERLAP = timedelta(minutes=1)
+
+
+def compute_ranking(kind, window, ids=None):
+    """
+    Return [(object_id, score), ...] best first, for approved content only.
+
+    With `ids`, only those items are scored (and not truncated).
+    """
+    model, fk_name = CONTENT_TYPES[kind]
+
+    if window == 'all':
+        queryset = model.objects.filter(is_approved=True, reaction_count__gt=0)
+        if ids is not None:
+            return list(queryset.filter(pk__in=ids).values_list('pk', 'reaction_count'))
+        return list(
+            queryset.order_by('-reaction_count', '-created_at')
+            .values_list('pk', 'reaction_count')[:LEADERBOARD_SIZE]
+        )
+
+    # Only reactions inside the window are read, so the cost follows recent
+    # activity rather than the size of the reactions table.
+    since = timezone.now() - timedelta(days=WINDOW_DAYS[window])
+    queryset = Reaction.objects.filter(created_at__gte=since, **{f'{fk_name}__is_approved': True})
+    if ids is not None:
+        return list(
+            queryset.filter(**{f'{fk_name}__in': ids})
+            .values_list(fk_name)
+            .annotate(score=Count('id'))
+            .order_by()
+        )
+    return list(
+        queryset.values_list(fk_name)
+        .annotate(score=Count('id'))
+        .order_by('-score', f'-{fk_name}__created_at')[:LEADERBOARD_SIZE]
+    )
+
+
+def touched_ids(kind, window, since, now):
+    """Ids whose score in `window` may have changed between `since` and `now`."""
+    model, fk_name = CONTENT_TYPES[kind]
+    ids = set(model.objects.filter(reacted_at__gte=since).values_list('pk', flat=True))
+    if window != 'all':
+        days = timedelta(days=WINDOW_DAYS[window])
+        ids.update(
+            Reaction.objects.filter(
+                created_at__gte=since - days, created_at__lt=now - days,
+                **{f'{fk_name}__isnull': False}
+            ).values_list(fk_name, flat=True)
+        )
+    return ids
+
+
+def merge_ranking(kind, existing, touched, fresh):
+    """
+    Fold fresh scores for the touched items into the stored board.
+
+    `existing` maps object ids to their LeaderboardEntry and `fresh` maps
+    touched ids to their new score (a missing id now scores nothing).
+    Returns the new ranking, or None if it needs a full recompute.
+    """
+    model, _ = CONTENT_TYPES[kind]
+    scores = {object_id: entry.score for object_id, entry in existing.items()}
+    cutoff = min(scores.values()) if len(scores) >= LEADERBOARD_SIZE else 0
+    for object_id in touched:
+        scores[object_id] = fresh.get(object_id, 0)
+
+    created = dict(
+        model.objects.filter(pk__in=[pk for pk, score in scores.items() if score > 0])
+        .values_list('pk', 'created_at')
+    )
+    ranking = sorted(
+        ((object_id, scores[object_id]) for object_id in created),
+        key=lambda item: (item[1], created[item[0]]),
+        reverse=True,
+    )[:LEADERBOARD_SIZE]
+
+    # Items off a full board scored at most `cutoff` and haven't changed
+    # since; if the board now ends below that, one of them may belong on it.
+    if cutoff and (len(ranking) < LEADERBOARD_SIZE or ranking[-1][1] < cutoff):
+        return None
+    return ranking
+
+
+def refresh_leaderboard(kind, window, since=None, now=None):
+    """
+    Bring one leaderboard in line with the current ranking.
+
+    With `since`, only items touched since then are rescored; otherwise
+    the board is recomputed. Only entries whose rank or score changed are
+    written. Returns the number of entries created, updated or deleted.
+    """
+    _, fk_name = CONTENT_TYPES[kind]
+    touched = None
+    if since is not None:
+        touched = touched_ids(kind, window, since, now or timezone.now())
+        if not touched:
+            return 0
+
+    with transaction.atomic():
+        existing = {
+            getattr(entry, f'{fk_name}_id'): entry
+            for entry in LeaderboardEntry.objects.select_for_update().filter(kind=kind, window=window)
+        }
+
+        ranking = None
+        if touched is not None:
+            fresh = dict(compute_ranking(kind, window, ids=touched))
+            ranking = merge_ranking(kind, existing, touched, fresh)
+        if ranking is None:
+            ranking = compute_ranking(kind, window)
+
+        now = timezone.now()
+        to_create = []
+        to_update = []
+        for rank, (object_id, score) in enumerate(ranking, start=1):
+            entry = existing.pop(object_id, None)
+            if entry is None:
+                to_create.append(LeaderboardEntry(
+                    kind=kind, window=window, rank=rank, score=score,
+                    **{f'{fk_name}_id': object_id}
+                ))
+            elif (entry.rank, entry.score) != (rank, score):
+                entry.rank = rank
+                entry.score = score
+                entry.updated_at = now
+                to_update.append(entry)
+
+        if existing:
+            LeaderboardEntry.objects.filter(pk__in=[e.pk for e in existing.values()]).delete()
+        LeaderboardEntry.objects.bulk_update(to_update, ['rank', 'score', 'updated_at'])
+        LeaderboardEntry.objects.bulk_create(to_create)
+
+    return len(to_create) + len(to_update) + len(existing)
+
+
+def refresh_all_leaderboards(full=False):
+    """
+    Refresh every (kind, window) leaderboard from the changes since the
+    last run, or from scratch. Returns {(kind, window): changes}.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        # Locking the watermark keeps concurrent runs from interleaving
+        watermark, _ = Watermark.objects.select_for_update().get_or_create(name=WATERMARK_NAME)
+        since = None
+        if watermark.value and not full:
+            since = datetime.fromtimestamp(watermark.value, tz=dt_timezone.utc) - OVERLAP
+
+        results = {
+            (kind, window): refresh_leaderboard(kind, window, since, now)
+            for kind in CONTENT_TYPES
+            for window in WINDOWS
+        }
+
+        watermark.value = int(now.timestamp())
+        watermark.save(update_fields=['value', 'updated_at'])
+    return results
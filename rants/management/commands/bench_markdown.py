@@ -0,0 +1,95 @@
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import bleach
+import markdown
+from django.core.management.base import BaseCommand
+
+from rants import rendering
+
+
+OPENERS = [
+    "I'll never forget the day my manager called me into a 4:45pm Friday meeting.",
+    "Applied to **47 jobs** this week. Heard back from *two*. Both were rejections.",
+    "Hot take: \"unlimited PTO\" just means nobody takes any PTO.",
+    "The recruiter said the salary was *competitive*. Competitive with what, exactly?",
+    "Five rounds of interviews for an entry level role. Five.",
+]
+MIDDLES = [
+    "Things they actually asked me:\n\n- Where do you see yourself in 5 years?\n- Are you a culture fit?\n- Would you work weekends \"occasionally\"?",
+    "> We're a family here.\n\nFamilies don't do layoffs over Zoom, Karen.",
+    "Steps of the process:\n\n1. Apply\n2. Take-home project (12 hours)\n3. Never hear back",
+    "The job posting said `3-5 years experience` for a framework that has existed for two.",
+    "I asked about the budget and got a [link to their values page](https://example.com/values).",
+]
+CLOSERS = [
+    "Anyway, I'm *thrilled* to announce I'm still looking.",
+    "Agree? Thoughts? Please clap.",
+    "```\nwhile True:\n    apply()\n    get_ghosted()\n```",
+    "If you made it this far: no, I will not be attending the pizza party.",
+    "<script>alert('nice try')</script> **Reality check:** none of this is normal.",
+]
+
+
+def build_corpus(size, seed=0):
+    """Generate realistic rant bodies from the snippets above."""
+    rng = random.Random(seed)
+    return [
+        "\n\n".join([rng.choice(OPENERS), rng.choice(MIDDLES), rng.choice(CLOSERS)])
+        + f"\n\nUpdate #{i}: still unemployed."
+        for i in range(size)
+    ]
+
+
+def render_per_call(text):
+    """The old approach: a fresh Markdown and Cleaner on every call."""
+    html = markdown.markdown(text, extensions=rendering.MARKDOWN_EXTENSIONS)
+    return bleach.clean(html, tags=rendering.ALLOWED_TAGS, attributes=rendering.ALLOWED_ATTRIBUTES)
+
+
+class Command(BaseCommand):
+    help = "Benchmark the shared markdown renderer against per-call construction."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--corpus', type=int, default=500, help='Distinct documents (default: 500)')
+        parser.add_argument('--repeat', type=int, default=5, help='Passes over the corpus (default: 5)')
+        parser.add_argument('--threads', type=int, default=4, help='Threads for the concurrent run (default: 4)')
+
+    def handle(self, *args, **options):
+        corpus = build_corpus(options['corpus'])
+        workload = corpus * options['repeat']
+
+        # Sanity check: the shared renderer must produce identical output
+        for text in corpus[:50]:
+            if rendering.render_markdown_uncached(text) != render_per_call(text):
+                self.stderr.write(self.style.ERROR("Output mismatch between renderers"))
+                return
+
+        rendering.clear_cache()
+        results = [
+            ('per-call construction', self._time(render_per_call, workload)),
+            ('shared instances, no LRU', self._time(rendering.render_markdown_uncached, workload)),
+            ('shared instances + LRU', self._time(rendering.render_markdown, workload)),
+        ]
+
+        rendering.clear_cache()
+        with ThreadPoolExecutor(max_workers=options['threads']) as pool:
+            start = time.perf_counter()
+            list(pool.map(rendering.render_markdown, workload))
+            elapsed = time.perf_counter() - start
+        results.append((f"shared + LRU, {options['threads']} threads", elapsed))
+
+        baseline = results[0][1]
+        self.stdout.write(f"{len(workload)} renders of {len(corpus)} distinct documents\n")
+        for label, elapsed in results:
+            self.stdout.write(
+                f"{label:<32} {len(workload) / elapsed:>10.0f} docs/s  "
+                f"{baseline / elapsed:>6.1f}x"
+            )
+
+    def _time(self, func, workload):
+        start = time.perf_counter()
+        for text in workload:
+            func(text)
+        return time.perf_counter() - start
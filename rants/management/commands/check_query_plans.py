@@ -0,0 +1,152 @@
+import random
+import re
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import RequestFactory
+
+from rants import views
+from rants.companies import company_for_name, rebuild_company_counts
+from rants.leaderboards import refresh_all_leaderboards
+from rants.models import Category, Rant, SideBySide, GhostingStory, Reaction, LeaderboardEntry
+from rants.pagination import CursorPaginator
+
+
+COMPANIES = ['Google', 'Meta', 'Amazon', 'Initech', 'Hooli', 'Pied Piper', 'Globex', 'Umbrella']
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN the main query of each feed view against a seeded dataset and "
+        "fail if any of them needs a full table scan. The seed data is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rants', type=int, default=2000, help='Rants to seed (default: 2000)')
+
+    def handle(self, *args, **options):
+        if connection.vendor not in ('sqlite', 'postgresql'):
+            raise CommandError(f"Plan checks are not implemented for {connection.vendor}")
+
+        with transaction.atomic():
+            self.seed(options['rants'])
+            with connection.cursor() as cursor:
+                if connection.vendor == 'postgresql':
+                    # Small tables are cheap to scan; make the planner show
+                    # whether an index *can* serve the query.
+                    cursor.execute("SET LOCAL enable_seqscan = off")
+                cursor.execute("ANALYZE")
+
+            failures = []
+            for label, queryset in self.view_queries():
+                plan = queryset.explain()
+                scans = self.full_scans(plan)
+                if scans:
+                    failures.append(label)
+                    self.stdout.write(self.style.ERROR(f"FULL SCAN {label}: {', '.join(scans)}"))
+                else:
+                    self.stdout.write(f"ok        {label}")
+                if options['verbosity'] > 1 or scans:
+                    self.stdout.write(f"    {plan}".replace('\n', '\n    '))
+
+            transaction.set_rollback(True)
+
+        if failures:
+            raise CommandError(f"{len(failures)} query plan(s) fall back to a full table scan")
+        self.stdout.write(self.style.SUCCESS("All feed queries use an index."))
+
+    def seed(self, size):
+        rng = random.Random(0)
+        categories = list(Category.objects.all()) or [Category.objects.create(name='General', slug='general')]
+
+        def flags():
+            return {
+                'is_approved': rng.random() < 0.95,
+                'is_featured': rng.random() < 0.03,
+                'is_reported': rng.random() < 0.02,
+                'reaction_count': rng.randint(0, 50),
+                'hotness': rng.random() * 100,
+            }
+
+        rants = Rant.objects.bulk_create([
+            Rant(title=f"Rant {i}", body="Seeded.", category=categories[i % len(categories)], **flags())
+            for i in range(size)
+        ])
+        sidebysides = SideBySide.objects.bulk_create([
+            SideBySide(linkedin_version="Thrilled!", reality_version="Not thrilled.", **flags())
+            for _ in range(size // 4)
+        ])
+        companies = [company_for_name(name) for name in COMPANIES]
+        for i in range(size // 10):
+            companies.append(company_for_name(f"Seeded Company {i}"))
+        stories = GhostingStory.objects.bulk_create([
+            GhostingStory(
+                company=rng.choice(COMPANIES),
+                canonical_company=rng.choice(companies),
+                stage=rng.choice(GhostingStory.STAGE_CHOICES)[0],
+                platform=rng.choice(GhostingStory.PLATFORM_CHOICES)[0],
+                story="Seeded.",
+                **flags()
+            )
+            for _ in range(size // 2)
+        ])
+
+        reaction_types = [code for code, _ in Reaction.REACTION_TYPES]
+        reactions = []
+        for fk_name, objects in (('rant', rants), ('sidebyside', sidebysides), ('ghosting_story', stories)):
+            for i in range(len(objects) * 3):
+                reactions.append(Reaction(
+                    reaction_type=rng.choice(reaction_types),
+                    session_key=f"seed-{i}",
+                    **{fk_name: rng.choice(objects)}
+                ))
+        Reaction.objects.bulk_create(reactions, ignore_conflicts=True)
+        refresh_all_leaderboards()
+        rebuild_company_counts()
+
+    def view_queries(self):
+        """(label, queryset) for every list view variant, first and second page."""
+        factory = RequestFactory()
+        category = Category.objects.filter(rants__isnull=False).first()
+        stage = GhostingStory.STAGE_CHOICES[-2][0]
+
+        cases = [
+            (views.HomeView, '/', {}),
+            (views.HomeView, '/?sort=reactions', {}),
+            (views.HomeView, '/?sort=trending', {}),
+            (views.HomeView, '/?sort=featured', {}),
+            (views.HomeView, f'/?category={category.slug}', {}),
+            (views.CategoryView, f'/category/{category.slug}/', {'slug': category.slug}),
+            (views.WallOfShameView, '/wall-of-shame/', {}),
+            (views.WallOfShameView, f'/wall-of-shame/?stage={stage}', {}),
+            (views.WallOfShameView, '/wall-of-shame/?sort=reactions', {}),
+            (views.WallOfShameView, '/wall-of-shame/?sort=featured', {}),
+            (views.WallOfShameView, f'/wall-of-shame/?company={COMPANIES[0]}', {}),
+            (views.WorstOffendersView, '/wall-of-shame/worst-offenders/', {}),
+        ]
+        for kind, _ in LeaderboardEntry.KIND_CHOICES:
+            for window, _ in LeaderboardEntry.WINDOW_CHOICES:
+                cases.append((views.HallOfFameView, f'/hall-of-fame/?type={kind}&window={window}', {}))
+
+        for view_class, url, kwargs in cases:
+            view = view_class()
+            view.setup(factory.get(url), **kwargs)
+            paginator = CursorPaginator(view.get_queryset(), view.paginate_by)
+            page = paginator.page()
+            label = f"{view_class.__name__} {url}"
+            yield label, paginator.page_queryset()
+            if page.has_next():
+                yield f"{label} (next page)", paginator.page_queryset(page.next_cursor)
+
+        # The home page sidebar
+        yield "home side-by-sides", SideBySide.objects.filter(is_approved=True)[:5]
+
+    def full_scans(self, plan):
+        """Names of tables the plan reads without an index."""
+        tables = set(connection.introspection.table_names())
+        if connection.vendor == 'postgresql':
+            found = re.findall(r'Seq Scan on (\w+)', plan)
+        else:
+            # "SCAN t" is a full scan; "SCAN t USING [COVERING] INDEX i" walks an index
+            found = re.findall(r'\bSCAN (?:TABLE )?(\w+)\b(?! USING)', plan)
+        return sorted({name for name in found if name in tables})
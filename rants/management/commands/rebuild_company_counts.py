@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from rants.companies import rebuild_company_counts
+
+
+class Command(BaseCommand):
+    help = "Recompute the per-company ghosting story counters from the stories table."
+
+    def handle(self, *args, **options):
+        fixed = rebuild_company_counts()
+        self.stdout.write(f"companies: {fixed} row(s) repaired")
+        self.stdout.write(self.style.SUCCESS("Company counters rebuilt."))
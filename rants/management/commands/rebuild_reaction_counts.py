@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from rants.reactions import COUNTED_MODELS, rebuild_reaction_counts
+
+
+class Command(BaseCommand):
+    help = "Recompute the denormalized reaction counters from the Reaction table."
+
+    def handle(self, *args, **options):
+        for fk_name, model in COUNTED_MODELS.items():
+            fixed = rebuild_reaction_counts(fk_name)
+            self.stdout.write(f"{model._meta.verbose_name_plural}: {fixed} row(s) repaired")
+        self.stdout.write(self.style.SUCCESS("Reaction counters rebuilt."))
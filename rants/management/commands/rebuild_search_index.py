@@ -0,0 +1,63 @@
+from django.core.management.base import BaseCommand
+
+from rants import search
+from rants.models import SearchEntry
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index in place."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Rows to index per transaction (default: 1000)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        # Entries are replaced batch by batch rather than cleared up front,
+        # so search keeps answering from the old rows while this runs.
+        for kind, (model, _, _) in search.SEARCHABLE.items():
+            queryset = model.objects.filter(is_approved=True)
+            total = 0
+            last_pk = None
+            while True:
+                batch = queryset.order_by('pk')
+                if last_pk is not None:
+                    batch = batch.filter(pk__gt=last_pk)
+                batch = list(batch[:batch_size])
+                if not batch:
+                    break
+
+                search.index_objects(kind, batch)
+                total += len(batch)
+                last_pk = batch[-1].pk
+                self.stdout.write(f"{model._meta.verbose_name_plural}: {total} indexed...")
+
+            removed = self.remove_stale(kind, model, batch_size)
+            self.stdout.write(
+                f"{model._meta.verbose_name_plural}: {total} row(s) indexed, {removed} stale removed"
+            )
+
+        self.stdout.write(self.style.SUCCESS("Search index rebuilt."))
+
+    def remove_stale(self, kind, model, batch_size):
+        """Drop entries whose object was deleted or unapproved."""
+        removed = 0
+        last_id = None
+        while True:
+            entries = SearchEntry.objects.filter(kind=kind).order_by('id')
+            if last_id is not None:
+                entries = entries.filter(id__gt=last_id)
+            entries = list(entries.values_list('id', 'object_id')[:batch_size])
+            if not entries:
+                return removed
+
+            object_ids = [object_id for _, object_id in entries]
+            live = set(model.objects.filter(pk__in=object_ids, is_approved=True).values_list('pk', flat=True))
+            stale = [object_id for object_id in object_ids if object_id not in live]
+            if stale:
+                search.remove_objects(kind, stale)
+                removed += len(stale)
+            last_id = entries[-1][0]
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from rants.leaderboards import refresh_all_leaderboards
+
+
+class Command(BaseCommand):
+    help = (
+        "Refresh the precomputed Hall of Fame leaderboards from reactions changed "
+        "since the last run. The scheduler (`run_scheduler`) does this periodically."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all', action='store_true',
+            help='Recompute every leaderboard from scratch',
+        )
+
+    def handle(self, *args, **options):
+        for (kind, window), changes in refresh_all_leaderboards(full=options['all']).items():
+            self.stdout.write(f"{kind}/{window}: {changes} change(s)")
+        self.stdout.write(self.style.SUCCESS("Leaderboards refreshed."))
@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from rants.models import Rant, GhostingStory
+from rants.rendering import RENDERER_VERSION, render_markdown
+
+
+# (model, markdown source field, stored HTML field)
+RENDERED_FIELDS = [
+    (Rant, 'body', 'body_html'),
+    (GhostingStory, 'story', 'story_html'),
+]
+
+
+class Command(BaseCommand):
+    help = "Re-render stored markdown HTML for rows rendered by an older renderer version."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=500,
+            help='Rows to re-render per transaction (default: 500)',
+        )
+        parser.add_argument(
+            '--all', action='store_true',
+            help='Re-render every row, not just outdated ones',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        for model, source, target in RENDERED_FIELDS:
+            queryset = model.objects.all()
+            if not options['all']:
+                queryset = queryset.filter(render_version__lt=RENDERER_VERSION)
+
+            total = 0
+            last_pk = None
+            while True:
+                batch = queryset.order_by('pk').only('pk', source)
+                if last_pk is not None:
+                    batch = batch.filter(pk__gt=last_pk)
+                batch = list(batch[:batch_size])
+                if not batch:
+                    break
+
+                for obj in batch:
+                    setattr(obj, target, render_markdown(getattr(obj, source)))
+                    obj.render_version = RENDERER_VERSION
+                with transaction.atomic():
+                    model.objects.bulk_update(batch, [target, 'render_version'])
+
+                total += len(batch)
+                last_pk = batch[-1].pk
+                self.stdout.write(f"{model._meta.verbose_name_plural}: {total} re-rendered...")
+
+            self.stdout.write(f"{model._meta.verbose_name_plural}: {total} row(s) at version {RENDERER_VERSION}")
+
+        self.stdout.write(self.style.SUCCESS("Stored markdown HTML is up to date."))
@@ -0,0 +1,37 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from rants.rollups import rollup_content_views, prune_content_views
+
+
+class Command(BaseCommand):
+    help = "Roll new ContentView rows into the hourly/daily tables and prune old raw rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size', type=int, default=5000,
+            help='Rows per transaction (default: 5000)',
+        )
+        parser.add_argument(
+            '--lag-minutes', type=int, default=5,
+            help='Leave views younger than this for the next run (default: 5)',
+        )
+        parser.add_argument(
+            '--retention-days', type=int, default=settings.CONTENT_VIEW_RETENTION_DAYS,
+            help='Delete rolled-up raw views older than this; 0 keeps everything',
+        )
+
+    def handle(self, *args, **options):
+        rolled = rollup_content_views(
+            chunk_size=options['chunk_size'],
+            lag=timedelta(minutes=options['lag_minutes']),
+        )
+        self.stdout.write(f"Rolled up {rolled} view(s)")
+
+        if options['retention_days'] > 0:
+            pruned = prune_content_views(options['retention_days'], chunk_size=options['chunk_size'])
+            self.stdout.write(f"Pruned {pruned} raw view(s) older than {options['retention_days']} days")
+
+        self.stdout.write(self.style.SUCCESS("Content view rollup complete."))
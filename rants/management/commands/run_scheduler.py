@@ -0,0 +1,37 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from rants.scheduler import Scheduler
+
+
+class Command(BaseCommand):
+    help = (
+        "Run periodic background work (view rollups and retention, leaderboards, "
+        "trending scores). "
+        "Run exactly one of these processes, e.g. as the Procfile `clock`."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Run every task once and exit',
+        )
+
+    def handle(self, *args, **options):
+        scheduler = Scheduler()
+        while True:
+            for name, summary in scheduler.run_pending():
+                if summary is None:
+                    self.stderr.write(f"{name}: failed")
+                else:
+                    self.stdout.write(f"{name}: {summary}")
+
+            if options['once']:
+                break
+            # Don't hold a DB connection open between runs
+            connection.close()
+            time.sleep(max(1.0, scheduler.seconds_until_due()))
+
+        self.stdout.write(self.style.SUCCESS("Periodic tasks complete."))
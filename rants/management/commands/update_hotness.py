@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from rants.trending import update_recent_hotness
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute trending scores for content with changed reactions or new views. "
+        "The scheduler (`run_scheduler`) does this periodically."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all', action='store_true',
+            help='Recompute every item, not just recently touched ones',
+        )
+
+    def handle(self, *args, **options):
+        for kind, updated in update_recent_hotness(full=options['all']).items():
+            self.stdout.write(f"{kind}: {updated} score(s) updated")
+        self.stdout.write(self.style.SUCCESS("Trending scores updated."))
@@ -0,0 +1,145 @@
+# Generated by Django 4.2.30 on 2026-10-16 22:59
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_reaction_counts(apps, schema_editor):
+    """Populate the new counters from existing reactions."""
+    Reaction = apps.get_model("rants", "Reaction")
+    targets = {
+        "rant": apps.get_model("rants", "Rant"),
+        "sidebyside": apps.get_model("rants", "SideBySide"),
+        "ghosting_story": apps.get_model("rants", "GhostingStory"),
+    }
+
+    for fk_name, model in targets.items():
+        rows = (
+            Reaction.objects.filter(**{f"{fk_name}__isnull": False})
+            .values_list(fk_name, "reaction_type")
+            .annotate(n=Count("id"))
+            .order_by()
+        )
+        counts = {}
+        for object_id, reaction_type, n in rows:
+            counts.setdefault(object_id, {})[f"{reaction_type}_count"] = n
+
+        for object_id, fields in counts.items():
+            fields["reaction_count"] = sum(fields.values())
+            model.objects.filter(pk=object_id).update(**fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("rants", "0004_linkedin_share_flow"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ghostingstory",
+            name="clap_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="ghostingstory",
+            name="dead_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="ghostingstory",
+            name="drink_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="ghostingstory",
+            name="felt_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="ghostingstory",
+            name="peak_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="ghostingstory",
+            name="rage_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="ghostingstory",
+            name="reaction_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="rant",
+            name="clap_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="rant",
+            name="dead_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="rant",
+            name="drink_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="rant",
+            name="felt_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="rant",
+            name="peak_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="rant",
+            name="rage_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="rant",
+            name="reaction_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="sidebyside",
+            name="clap_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="sidebyside",
+            name="dead_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="sidebyside",
+            name="drink_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="sidebyside",
+            name="felt_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="sidebyside",
+            name="peak_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="sidebyside",
+            name="rage_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="sidebyside",
+            name="reaction_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_reaction_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:00
+
+from django.db import migrations, models
+
+from rants.rendering import RENDERER_VERSION, render_markdown
+
+
+def render_existing(apps, schema_editor):
+    """Store rendered HTML for existing rants and ghosting stories."""
+    for model_name, source, target in [
+        ("Rant", "body", "body_html"),
+        ("GhostingStory", "story", "story_html"),
+    ]:
+        model = apps.get_model("rants", model_name)
+        batch = []
+        for obj in model.objects.only("pk", source).iterator(chunk_size=500):
+            setattr(obj, target, render_markdown(getattr(obj, source)))
+            obj.render_version = RENDERER_VERSION
+            batch.append(obj)
+            if len(batch) >= 500:
+                model.objects.bulk_update(batch, [target, "render_version"])
+                batch = []
+        model.objects.bulk_update(batch, [target, "render_version"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("rants", "0005_reaction_counters"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ghostingstory",
+            name="render_version",
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="ghostingstory",
+            name="story_html",
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name="rant",
+            name="body_html",
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name="rant",
+            name="render_version",
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(render_existing, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:02
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("rants", "0006_stored_markdown_html"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="contentview",
+            name="timestamp",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
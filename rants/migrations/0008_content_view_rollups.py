@@ -0,0 +1,199 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:03
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("rants", "0007_buffered_content_views"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Watermark",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=50, unique=True)),
+                ("value", models.BigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="HourlyContentViews",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "referrer",
+                    models.CharField(
+                        choices=[
+                            ("li", "LinkedIn"),
+                            ("tw", "Twitter/X"),
+                            ("fb", "Facebook"),
+                            ("direct", "Direct"),
+                            ("other", "Other"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("views", models.PositiveIntegerField(default=0)),
+                ("hour", models.DateTimeField()),
+                (
+                    "ghosting_story",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)s",
+                        to="rants.ghostingstory",
+                    ),
+                ),
+                (
+                    "rant",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)s",
+                        to="rants.rant",
+                    ),
+                ),
+                (
+                    "sidebyside",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)s",
+                        to="rants.sidebyside",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Hourly Content Views",
+                "verbose_name_plural": "Hourly Content Views",
+                "ordering": ["-hour"],
+            },
+        ),
+        migrations.CreateModel(
+            name="DailyContentViews",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "referrer",
+                    models.CharField(
+                        choices=[
+                            ("li", "LinkedIn"),
+                            ("tw", "Twitter/X"),
+                            ("fb", "Facebook"),
+                            ("direct", "Direct"),
+                            ("other", "Other"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("views", models.PositiveIntegerField(default=0)),
+                ("day", models.DateField()),
+                (
+                    "ghosting_story",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)s",
+                        to="rants.ghostingstory",
+                    ),
+                ),
+                (
+                    "rant",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)s",
+                        to="rants.rant",
+                    ),
+                ),
+                (
+                    "sidebyside",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)s",
+                        to="rants.sidebyside",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Daily Content Views",
+                "verbose_name_plural": "Daily Content Views",
+                "ordering": ["-day"],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="hourlycontentviews",
+            constraint=models.UniqueConstraint(
+                fields=("hour", "rant", "referrer"), name="unique_hourly_rant_views"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="hourlycontentviews",
+            constraint=models.UniqueConstraint(
+                fields=("hour", "sidebyside", "referrer"),
+                name="unique_hourly_sidebyside_views",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="hourlycontentviews",
+            constraint=models.UniqueConstraint(
+                fields=("hour", "ghosting_story", "referrer"),
+                name="unique_hourly_ghosting_views",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="dailycontentviews",
+            constraint=models.UniqueConstraint(
+                fields=("day", "rant", "referrer"), name="unique_daily_rant_views"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="dailycontentviews",
+            constraint=models.UniqueConstraint(
+                fields=("day", "sidebyside", "referrer"),
+                name="unique_daily_sidebyside_views",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="dailycontentviews",
+            constraint=models.UniqueConstraint(
+                fields=("day", "ghosting_story", "referrer"),
+                name="unique_daily_ghosting_views",
+            ),
+        ),
+    ]
@@ -0,0 +1,110 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:04
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("rants", "0008_content_view_rollups"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LeaderboardEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("rant", "Rants"),
+                            ("sidebyside", "Side by Sides"),
+                            ("ghosting", "Ghosting Stories"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "window",
+                    models.CharField(
+                        choices=[
+                            ("week", "This Week"),
+                            ("month", "This Month"),
+                            ("all", "All Time"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("rank", models.PositiveIntegerField()),
+                ("score", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "ghosting_story",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="leaderboard_entries",
+                        to="rants.ghostingstory",
+                    ),
+                ),
+                (
+                    "rant",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="leaderboard_entries",
+                        to="rants.rant",
+                    ),
+                ),
+                (
+                    "sidebyside",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="leaderboard_entries",
+                        to="rants.sidebyside",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "leaderboard entries",
+                "ordering": ["kind", "window", "rank"],
+                "indexes": [
+                    models.Index(
+                        fields=["kind", "window", "rank"], name="leaderboard_rank_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="leaderboardentry",
+            constraint=models.UniqueConstraint(
+                fields=("window", "rant"), name="unique_leaderboard_rant"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="leaderboardentry",
+            constraint=models.UniqueConstraint(
+                fields=("window", "sidebyside"), name="unique_leaderboard_sidebyside"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="leaderboardentry",
+            constraint=models.UniqueConstraint(
+                fields=("window", "ghosting_story"), name="unique_leaderboard_ghosting"
+            ),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("rants", "0009_leaderboards"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ghostingstory",
+            name="hotness",
+            field=models.FloatField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="rant",
+            name="hotness",
+            field=models.FloatField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="sidebyside",
+            name="hotness",
+            field=models.FloatField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="ghostingstory",
+            index=models.Index(
+                fields=["is_approved", "-hotness"], name="ghosting_trending_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rant",
+            index=models.Index(
+                fields=["is_approved", "-hotness"], name="rant_trending_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="sidebyside",
+            index=models.Index(
+                fields=["is_approved", "-hotness"], name="sidebyside_trending_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,169 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("rants", "0010_trending_hotness"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="ghostingstory",
+            name="ghosting_trending_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="rant",
+            name="rant_trending_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="sidebyside",
+            name="sidebyside_trending_idx",
+        ),
+        migrations.AddIndex(
+            model_name="ghostingstory",
+            index=models.Index(
+                condition=models.Q(("is_approved", True)),
+                fields=["-hotness", "-created_at", "-id"],
+                name="ghosting_trending_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ghostingstory",
+            index=models.Index(
+                condition=models.Q(("is_approved", True)),
+                fields=["-created_at", "-id"],
+                name="ghosting_recent_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ghostingstory",
+            index=models.Index(
+                condition=models.Q(("is_approved", True)),
+                fields=["stage", "-created_at", "-id"],
+                name="ghosting_stage_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ghostingstory",
+            index=models.Index(
+                condition=models.Q(("is_approved", True)),
+                fields=["-reaction_count", "-created_at", "-id"],
+                name="ghosting_top_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ghostingstory",
+            index=models.Index(
+                condition=models.Q(("is_approved", True), ("is_featured", True)),
+                fields=["-created_at", "-id"],
+                name="ghosting_featured_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ghostingstory",
+            index=models.Index(
+                condition=models.Q(("is_reported", True)),
+                fields=["-report_count"],
+                name="ghosting_reported_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rant",
+            index=models.Index(
+                condition=models.Q(("is_approved", True)),
+                fields=["-hotness", "-created_at", "-id"],
+                name="rant_trending_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rant",
+            index=models.Index(
+                condition=models.Q(("is_approved", True)),
+                fields=["-created_at", "-id"],
+                name="rant_recent_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rant",
+            index=models.Index(
+                condition=models.Q(("is_approved", True)),
+                fields=["category", "-created_at", "-id"],
+                name="rant_category_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rant",
+            index=models.Index(
+                condition=models.Q(("is_approved", True)),
+                fields=["-reaction_count", "-created_at", "-id"],
+                name="rant_top_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rant",
+            index=models.Index(
+                condition=models.Q(("is_approved", True), ("is_featured", True)),
+                fields=["-created_at", "-id"],
+                name="rant_featured_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rant",
+            index=models.Index(
+                condition=models.Q(("is_reported", True)),
+                fields=["-report_count"],
+                name="rant_reported_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="reaction",
+            index=models.Index(
+                fields=["rant", "reaction_type"], name="reaction_rant_type_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="reaction",
+            index=models.Index(
+                fields=["sidebyside", "reaction_type"],
+                name="reaction_sidebyside_type_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="reaction",
+            index=models.Index(
+                fields=["ghosting_story", "reaction_type"],
+                name="reaction_ghosting_type_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="reaction",
+            index=models.Index(fields=["created_at"], name="reaction_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="sidebyside",
+            index=models.Index(
+                condition=models.Q(("is_approved", True)),
+                fields=["-hotness", "-created_at", "-id"],
+                name="sidebyside_trending_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="sidebyside",
+            index=models.Index(
+                condition=models.Q(("is_approved", True)),
+                fields=["-created_at", "-id"],
+                name="sidebyside_recent_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="sidebyside",
+            index=models.Index(
+                condition=models.Q(("is_reported", True)),
+                fields=["-report_count"],
+                name="sidebyside_reported_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,139 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:10
+
+from django.db import migrations, models
+
+# The search module and models change over time, so the index setup and
+# the backfill are frozen here against the historical models.
+FTS_TABLE = "rants_searchentry_fts"
+TEXT_SEARCH_CONFIG = "english"
+
+# kind -> (model name, heading fields, body fields)
+SEARCHABLE = {
+    "rant": ("Rant", ["title"], ["body"]),
+    "sidebyside": ("SideBySide", ["context"], ["linkedin_version", "reality_version"]),
+    "ghosting": ("GhostingStory", ["company", "recruiter_name"], ["story"]),
+}
+
+
+def create_text_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute("ALTER TABLE rants_searchentry ADD COLUMN document tsvector")
+        schema_editor.execute(
+            "CREATE INDEX rants_searchentry_document_idx ON rants_searchentry USING GIN (document)"
+        )
+    elif vendor == "sqlite":
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+            "heading, body, tokenize = 'porter unicode61')"
+        )
+
+
+def drop_text_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS rants_searchentry_document_idx")
+        schema_editor.execute("ALTER TABLE rants_searchentry DROP COLUMN IF EXISTS document")
+    elif vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+def _index_batch(SearchEntry, connection, kind, heading, body, objects):
+    if not objects:
+        return
+    SearchEntry.objects.using(connection.alias).bulk_create(
+        [SearchEntry(kind=kind, object_id=obj.pk, created_at=obj.created_at) for obj in objects]
+    )
+    entry_ids = dict(
+        SearchEntry.objects.using(connection.alias)
+        .filter(kind=kind, object_id__in=[obj.pk for obj in objects])
+        .values_list("object_id", "id")
+    )
+    rows = [
+        (
+            entry_ids[obj.pk],
+            " ".join(getattr(obj, field) or "" for field in heading),
+            "\n".join(getattr(obj, field) or "" for field in body),
+        )
+        for obj in objects
+    ]
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.executemany(
+                "UPDATE rants_searchentry SET document = "
+                "setweight(to_tsvector(%s::regconfig, %s), 'A') || "
+                "setweight(to_tsvector(%s::regconfig, %s), 'B') "
+                "WHERE id = %s",
+                [
+                    (TEXT_SEARCH_CONFIG, heading_text, TEXT_SEARCH_CONFIG, body_text, entry_id)
+                    for entry_id, heading_text, body_text in rows
+                ],
+            )
+        elif connection.vendor == "sqlite":
+            cursor.executemany(
+                f"INSERT INTO {FTS_TABLE} (rowid, heading, body) VALUES (%s, %s, %s)", rows
+            )
+
+
+def index_existing(apps, schema_editor):
+    """Index all approved content that exists before search was added."""
+    connection = schema_editor.connection
+    SearchEntry = apps.get_model("rants", "SearchEntry")
+    for kind, (model_name, heading, body) in SEARCHABLE.items():
+        model = apps.get_model("rants", model_name)
+        queryset = model.objects.using(connection.alias).filter(is_approved=True)
+        batch = []
+        for obj in queryset.iterator(chunk_size=500):
+            batch.append(obj)
+            if len(batch) >= 500:
+                _index_batch(SearchEntry, connection, kind, heading, body, batch)
+                batch = []
+        _index_batch(SearchEntry, connection, kind, heading, body, batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("rants", "0011_feed_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("rant", "Rants"),
+                            ("sidebyside", "Side by Sides"),
+                            ("ghosting", "Ghosting Stories"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("object_id", models.UUIDField()),
+                ("created_at", models.DateTimeField()),
+            ],
+            options={
+                "verbose_name_plural": "search entries",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="searchentry",
+            constraint=models.UniqueConstraint(
+                fields=("kind", "object_id"), name="unique_search_entry"
+            ),
+        ),
+        migrations.RunPython(create_text_index, drop_text_index),
+        migrations.RunPython(index_existing, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,163 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:13
+
+import hashlib
+import unicodedata
+from collections import Counter
+
+from django.db import migrations, models
+from django.utils.text import slugify
+import django.db.models.deletion
+
+# Frozen copy of rants.companies.canonical_slug() as of this migration
+LEGAL_SUFFIXES = {
+    "inc", "incorporated", "llc", "llp", "lp", "ltd", "limited", "corp",
+    "corporation", "co", "company", "plc", "gmbh", "ag", "sa", "bv", "pty",
+}
+GENERIC_WORDS = LEGAL_SUFFIXES | {"the", "a", "an", "and", "of"}
+
+
+def clean_company_name(name):
+    return " ".join(name.split())
+
+
+def canonical_slug(name):
+    folded = []
+    for char in unicodedata.normalize("NFKC", name):
+        base = "".join(c for c in unicodedata.normalize("NFKD", char) if not unicodedata.combining(c))
+        folded.append(base if base.isascii() else char)
+    words = [word for word in slugify("".join(folded).casefold(), allow_unicode=True).split("-") if word]
+    if not words:
+        digest = hashlib.sha1(clean_company_name(name).casefold().encode()).hexdigest()[:12]
+        return f"company-{digest}"
+    while words[-1] in LEGAL_SUFFIXES and not GENERIC_WORDS.issuperset(words[:-1]):
+        words.pop()
+    return "-".join(words)
+
+
+def link_companies(apps, schema_editor):
+    """Create canonical companies for existing stories and count them."""
+    GhostingStory = apps.get_model("rants", "GhostingStory")
+    Company = apps.get_model("rants", "Company")
+
+    companies = {}
+    counts = {}
+    for story in GhostingStory.objects.only("pk", "company", "stage", "platform", "is_approved").iterator(chunk_size=500):
+        slug = canonical_slug(story.company)[:200]
+        if slug not in companies:
+            companies[slug], _ = Company.objects.get_or_create(
+                slug=slug, defaults={"name": clean_company_name(story.company)[:200]}
+            )
+        company = companies[slug]
+        GhostingStory.objects.filter(pk=story.pk).update(canonical_company=company)
+        if story.is_approved:
+            fields = counts.setdefault(company.pk, Counter())
+            fields["story_count"] += 1
+            fields[f"stage_{story.stage}_count"] += 1
+            fields[f"platform_{story.platform}_count"] += 1
+
+    for company_id, fields in counts.items():
+        Company.objects.filter(pk=company_id).update(**fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("rants", "0012_search"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Company",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=200)),
+                ("slug", models.SlugField(allow_unicode=True, max_length=200, unique=True)),
+                ("story_count", models.PositiveIntegerField(default=0, editable=False)),
+                (
+                    "stage_applied_count",
+                    models.PositiveIntegerField(default=0, editable=False),
+                ),
+                (
+                    "stage_screening_count",
+                    models.PositiveIntegerField(default=0, editable=False),
+                ),
+                (
+                    "stage_interview_count",
+                    models.PositiveIntegerField(default=0, editable=False),
+                ),
+                (
+                    "stage_final_count",
+                    models.PositiveIntegerField(default=0, editable=False),
+                ),
+                (
+                    "stage_offer_count",
+                    models.PositiveIntegerField(default=0, editable=False),
+                ),
+                (
+                    "stage_other_count",
+                    models.PositiveIntegerField(default=0, editable=False),
+                ),
+                (
+                    "platform_linkedin_count",
+                    models.PositiveIntegerField(default=0, editable=False),
+                ),
+                (
+                    "platform_email_count",
+                    models.PositiveIntegerField(default=0, editable=False),
+                ),
+                (
+                    "platform_phone_count",
+                    models.PositiveIntegerField(default=0, editable=False),
+                ),
+                (
+                    "platform_indeed_count",
+                    models.PositiveIntegerField(default=0, editable=False),
+                ),
+                (
+                    "platform_other_count",
+                    models.PositiveIntegerField(default=0, editable=False),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "verbose_name_plural": "companies",
+                "ordering": ["name"],
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("story_count__gt", 0)),
+                        fields=["-story_count", "-id"],
+                        name="company_offenders_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.AddField(
+            model_name="ghostingstory",
+            name="canonical_company",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="stories",
+                to="rants.company",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ghostingstory",
+            index=models.Index(
+                condition=models.Q(("is_approved", True)),
+                fields=["canonical_company", "-created_at", "-id"],
+                name="ghosting_company_idx",
+            ),
+        ),
+        migrations.RunPython(link_companies, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("rants", "0013_companies"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ghostingstory",
+            name="reaction_version",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="rant",
+            name="reaction_version",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="sidebyside",
+            name="reaction_version",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("rants", "0014_reaction_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ghostingstory",
+            name="reacted_at",
+            field=models.DateTimeField(
+                blank=True, db_index=True, editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="rant",
+            name="reacted_at",
+            field=models.DateTimeField(
+                blank=True, db_index=True, editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="sidebyside",
+            name="reacted_at",
+            field=models.DateTimeField(
+                blank=True, db_index=True, editable=False, null=True
+            ),
+        ),
+    ]
@@ -1,10 +1,12 @@
 from django.db import models
 from django.urls import reverse
+from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.text import slugify
 import uuid
 import secrets
-import markdown
-import bleach
+
+from .rendering import RENDERER_VERSION, render_markdown
 
 
 def generate_share_slug():
@@ -31,12 +33,63 @@ class Category(models.Model):
         return reverse('rants:category', kwargs={'slug': self.slug})
 
 
-class Rant(models.Model):
+class ReactionCounters(models.Model):
+    """
+    Denormalized per-type reaction counters.
+
+    ReactView keeps these in sync with F() updates when a reaction is
+    toggled; `manage.py rebuild_reaction_counts` repairs any drift.
+    """
+    reaction_count = models.PositiveIntegerField(default=0, editable=False)
+    drink_count = models.PositiveIntegerField(default=0, editable=False)
+    dead_count = models.PositiveIntegerField(default=0, editable=False)
+    felt_count = models.PositiveIntegerField(default=0, editable=False)
+    rage_count = models.PositiveIntegerField(default=0, editable=False)
+    peak_count = models.PositiveIntegerField(default=0, editable=False)
+    clap_count = models.PositiveIntegerField(default=0, editable=False)
+    # Bumped whenever the counters change; part of the cached card key
+    reaction_version = models.PositiveIntegerField(default=0, editable=False)
+    # Last reaction added or removed; leaderboards and trending recompute
+    # items changed since their previous run
+    reacted_at = models.DateTimeField(null=True, blank=True, editable=False, db_index=True)
+    # Decayed trending score, see rants/trending.py
+    hotness = models.FloatField(default=0, editable=False)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        if self._state.adding and not self.hotness:
+            # Give new posts their time-based score right away
+            from .trending import hotness_score
+            self.hotness = hotness_score(self.reaction_count, 0, timezone.now())
+        super().save(*args, **kwargs)
+
+    def get_reaction_counts(self):
+        """Get counts for each reaction type."""
+        return {
+            code: getattr(self, Reaction.counter_field(code))
+            for code, emoji in Reaction.REACTION_TYPES
+        }
+
+    @cached_property
+    def reaction_counts(self):
+        """Per-type counts, read from the counter columns already loaded with the row."""
+        return self.get_reaction_counts()
+
+    @property
+    def total_reactions(self):
+        return self.reaction_count
+
+
+class Rant(ReactionCounters):
     """Main rant/post submission."""
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     share_slug = models.SlugField(unique=True, max_length=12, default=generate_share_slug)
     title = models.CharField(max_length=200, blank=True)
     body = models.TextField()
+    body_html = models.TextField(blank=True, editable=False)
+    render_version = models.PositiveSmallIntegerField(default=0, editable=False)
     linkedin_version = models.TextField(blank=True, help_text="Optional: The LinkedIn version for sharing")
     category = models.ForeignKey(Category, on_delete=models.PROTECT, related_name='rants')
     is_anonymous = models.BooleanField(default=True)
@@ -51,6 +104,34 @@ class Rant(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        # One partial index per feed ordering. Only approved rows are listed,
+        # and the trailing id matches the keyset pagination tiebreaker.
+        indexes = [
+            models.Index(
+                fields=['-hotness', '-created_at', '-id'], name='rant_trending_idx',
+                condition=models.Q(is_approved=True),
+            ),
+            models.Index(
+                fields=['-created_at', '-id'], name='rant_recent_idx',
+                condition=models.Q(is_approved=True),
+            ),
+            models.Index(
+                fields=['category', '-created_at', '-id'], name='rant_category_idx',
+                condition=models.Q(is_approved=True),
+            ),
+            models.Index(
+                fields=['-reaction_count', '-created_at', '-id'], name='rant_top_idx',
+                condition=models.Q(is_approved=True),
+            ),
+            models.Index(
+                fields=['-created_at', '-id'], name='rant_featured_idx',
+                condition=models.Q(is_approved=True, is_featured=True),
+            ),
+            models.Index(
+                fields=['-report_count'], name='rant_reported_idx',
+                condition=models.Q(is_reported=True),
+            ),
+        ]
 
     def __str__(self):
         return self.title or f"Rant {self.id}"
@@ -68,30 +149,18 @@ class Rant(models.Model):
             return "Anonymous"
         return self.display_name or "Anonymous"
 
-    @property
-    def body_html(self):
-        """Render markdown body to safe HTML."""
-        allowed_tags = [
-            'p', 'br', 'strong', 'em', 'ul', 'ol', 'li', 'blockquote',
-            'code', 'pre', 'h1', 'h2', 'h3', 'a'
-        ]
-        allowed_attrs = {'a': ['href', 'title']}
-        html = markdown.markdown(self.body, extensions=['fenced_code'])
-        return bleach.clean(html, tags=allowed_tags, attributes=allowed_attrs)
-
-    def get_reaction_counts(self):
-        """Get counts for each reaction type."""
-        counts = {}
-        for code, emoji in Reaction.REACTION_TYPES:
-            counts[code] = self.reactions.filter(reaction_type=code).count()
-        return counts
-
-    @property
-    def total_reactions(self):
-        return self.reactions.count()
+    def save(self, *args, **kwargs):
+        # Store the rendered body so page views do no markdown work
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'body' in update_fields:
+            self.body_html = render_markdown(self.body)
+            self.render_version = RENDERER_VERSION
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'body_html', 'render_version'}
+        super().save(*args, **kwargs)
 
 
-class SideBySide(models.Model):
+class SideBySide(ReactionCounters):
     """LinkedIn vs Reality comparison submission."""
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     share_slug = models.SlugField(unique=True, max_length=12, default=generate_share_slug)
@@ -112,6 +181,20 @@ class SideBySide(models.Model):
         verbose_name = "Side by Side"
         verbose_name_plural = "Side by Sides"
         ordering = ['-created_at']
+        indexes = [
+            models.Index(
+                fields=['-hotness', '-created_at', '-id'], name='sidebyside_trending_idx',
+                condition=models.Q(is_approved=True),
+            ),
+            models.Index(
+                fields=['-created_at', '-id'], name='sidebyside_recent_idx',
+                condition=models.Q(is_approved=True),
+            ),
+            models.Index(
+                fields=['-report_count'], name='sidebyside_reported_idx',
+                condition=models.Q(is_reported=True),
+            ),
+        ]
 
     def __str__(self):
         return self.context or f"SideBySide {self.id}"
@@ -129,19 +212,8 @@ class SideBySide(models.Model):
             return "Anonymous"
         return self.display_name or "Anonymous"
 
-    def get_reaction_counts(self):
-        """Get counts for each reaction type."""
-        counts = {}
-        for code, emoji in Reaction.REACTION_TYPES:
-            counts[code] = self.reactions.filter(reaction_type=code).count()
-        return counts
-
-    @property
-    def total_reactions(self):
-        return self.reactions.count()
-
 
-class GhostingStory(models.Model):
+class GhostingStory(ReactionCounters):
     """Wall of Shame - recruiter ghosting stories."""
     PLATFORM_CHOICES = [
         ('linkedin', 'LinkedIn'),
@@ -163,9 +235,16 @@ class GhostingStory(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     recruiter_name = models.CharField(max_length=200, blank=True, help_text="Recruiter's name (optional)")
     company = models.CharField(max_length=200)
+    # Set from `company` on save; see rants/companies.py
+    canonical_company = models.ForeignKey(
+        'Company', on_delete=models.SET_NULL,
+        related_name='stories', null=True, blank=True, editable=False
+    )
     platform = models.CharField(max_length=20, choices=PLATFORM_CHOICES, default='linkedin')
     stage = models.CharField(max_length=20, choices=STAGE_CHOICES, default='applied')
     story = models.TextField(help_text="What happened? How did they ghost you?")
+    story_html = models.TextField(blank=True, editable=False)
+    render_version = models.PositiveSmallIntegerField(default=0, editable=False)
     is_anonymous = models.BooleanField(default=True)
     display_name = models.CharField(max_length=100, blank=True)
     email = models.EmailField(blank=True)
@@ -180,6 +259,36 @@ class GhostingStory(models.Model):
         verbose_name = "Ghosting Story"
         verbose_name_plural = "Ghosting Stories"
         ordering = ['-created_at']
+        indexes = [
+            models.Index(
+                fields=['-hotness', '-created_at', '-id'], name='ghosting_trending_idx',
+                condition=models.Q(is_approved=True),
+            ),
+            models.Index(
+                fields=['-created_at', '-id'], name='ghosting_recent_idx',
+                condition=models.Q(is_approved=True),
+            ),
+            models.Index(
+                fields=['stage', '-created_at', '-id'], name='ghosting_stage_idx',
+                condition=models.Q(is_approved=True),
+            ),
+            models.Index(
+                fields=['canonical_company', '-created_at', '-id'], name='ghosting_company_idx',
+                condition=models.Q(is_approved=True),
+            ),
+            models.Index(
+                fields=['-reaction_count', '-created_at', '-id'], name='ghosting_top_idx',
+                condition=models.Q(is_approved=True),
+            ),
+            models.Index(
+                fields=['-created_at', '-id'], name='ghosting_featured_idx',
+                condition=models.Q(is_approved=True, is_featured=True),
+            ),
+            models.Index(
+                fields=['-report_count'], name='ghosting_reported_idx',
+                condition=models.Q(is_reported=True),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.company} - {self.get_stage_display()}"
@@ -193,27 +302,86 @@ class GhostingStory(models.Model):
             return "Anonymous"
         return self.display_name or "Anonymous"
 
-    @property
-    def story_html(self):
-        """Render markdown body to safe HTML."""
-        allowed_tags = [
-            'p', 'br', 'strong', 'em', 'ul', 'ol', 'li', 'blockquote',
-            'code', 'pre', 'h1', 'h2', 'h3', 'a'
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        # Group the story under its canonical company
+        if update_fields is None or 'company' in update_fields:
+            from .companies import clean_company_name, company_for_name
+            self.company = clean_company_name(self.company)
+            self.canonical_company = company_for_name(self.company)
+            if update_fields is not None:
+                update_fields = kwargs['update_fields'] = {*update_fields, 'canonical_company'}
+
+        # Store the rendered story so page views do no markdown work
+        if update_fields is None or 'story' in update_fields:
+            self.story_html = render_markdown(self.story)
+            self.render_version = RENDERER_VERSION
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'story_html', 'render_version'}
+        super().save(*args, **kwargs)
+
+
+class Company(models.Model):
+    """
+    Canonical employer that ghosting stories are grouped under.
+
+    "Google", "google " and "Google LLC" all map to the same row. The story
+    counters only include approved stories and are kept in sync by
+    rants/signals.py; `manage.py rebuild_company_counts` repairs any drift.
+    """
+    name = models.CharField(max_length=200)  # spelling of the first story seen
+    slug = models.SlugField(unique=True, max_length=200, allow_unicode=True)  # canonical key
+    story_count = models.PositiveIntegerField(default=0, editable=False)
+    stage_applied_count = models.PositiveIntegerField(default=0, editable=False)
+    stage_screening_count = models.PositiveIntegerField(default=0, editable=False)
+    stage_interview_count = models.PositiveIntegerField(default=0, editable=False)
+    stage_final_count = models.PositiveIntegerField(default=0, editable=False)
+    stage_offer_count = models.PositiveIntegerField(default=0, editable=False)
+    stage_other_count = models.PositiveIntegerField(default=0, editable=False)
+    platform_linkedin_count = models.PositiveIntegerField(default=0, editable=False)
+    platform_email_count = models.PositiveIntegerField(default=0, editable=False)
+    platform_phone_count = models.PositiveIntegerField(default=0, editable=False)
+    platform_indeed_count = models.PositiveIntegerField(default=0, editable=False)
+    platform_other_count = models.PositiveIntegerField(default=0, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name_plural = "companies"
+        ordering = ['name']
+        indexes = [
+            # Worst offenders page
+            models.Index(
+                fields=['-story_count', '-id'], name='company_offenders_idx',
+                condition=models.Q(story_count__gt=0),
+            ),
         ]
-        allowed_attrs = {'a': ['href', 'title']}
-        html = markdown.markdown(self.story, extensions=['fenced_code'])
-        return bleach.clean(html, tags=allowed_tags, attributes=allowed_attrs)
 
-    def get_reaction_counts(self):
-        """Get counts for each reaction type."""
-        counts = {}
-        for code, emoji in Reaction.REACTION_TYPES:
-            counts[code] = self.reactions.filter(reaction_type=code).count()
-        return counts
+    def __str__(self):
+        return self.name
 
-    @property
-    def total_reactions(self):
-        return self.reactions.count()
+    @staticmethod
+    def stage_field(code):
+        """Name of the story counter column for a ghosting stage."""
+        return f'stage_{code}_count'
+
+    @staticmethod
+    def platform_field(code):
+        """Name of the story counter column for a platform."""
+        return f'platform_{code}_count'
+
+    def get_stage_counts(self):
+        """[(label, count), ...] in stage order."""
+        return [
+            (label, getattr(self, self.stage_field(code)))
+            for code, label in GhostingStory.STAGE_CHOICES
+        ]
+
+    def get_platform_counts(self):
+        """[(label, count), ...] in platform order."""
+        return [
+            (label, getattr(self, self.platform_field(code)))
+            for code, label in GhostingStory.PLATFORM_CHOICES
+        ]
 
 
 class Reaction(models.Model):
@@ -268,6 +436,14 @@ class Reaction(models.Model):
                 name='unique_ghosting_reaction'
             ),
         ]
+        indexes = [
+            # Per-type counts per content item (rebuild_reaction_counts)
+            models.Index(fields=['rant', 'reaction_type'], name='reaction_rant_type_idx'),
+            models.Index(fields=['sidebyside', 'reaction_type'], name='reaction_sidebyside_type_idx'),
+            models.Index(fields=['ghosting_story', 'reaction_type'], name='reaction_ghosting_type_idx'),
+            # Windowed leaderboards only read recent reactions
+            models.Index(fields=['created_at'], name='reaction_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.get_reaction_type_display()} on {self.rant or self.sidebyside or self.ghosting_story}"
@@ -280,6 +456,11 @@ class Reaction(models.Model):
     def get_label(cls, code):
         return cls.REACTION_LABELS.get(code, '')
 
+    @staticmethod
+    def counter_field(code):
+        """Name of the denormalized counter column for a reaction type."""
+        return f'{code}_count'
+
 
 class ContentView(models.Model):
     """Track views and referral sources for content."""
@@ -304,7 +485,8 @@ class ContentView(models.Model):
         related_name='content_views', null=True, blank=True
     )
     referrer = models.CharField(max_length=20, choices=REFERRER_CHOICES, default='direct')
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # Not auto_now_add: views are buffered, so the time is taken when recorded
+    timestamp = models.DateTimeField(default=timezone.now)
 
     class Meta:
         ordering = ['-timestamp']
@@ -312,3 +494,159 @@ class ContentView(models.Model):
     def __str__(self):
         content = self.rant or self.sidebyside or self.ghosting_story
         return f"View from {self.get_referrer_display()} on {content}"
+
+
+class ContentViewRollup(models.Model):
+    """View counts per content item and referrer, aggregated from ContentView."""
+    rant = models.ForeignKey(
+        Rant, on_delete=models.CASCADE,
+        related_name='%(class)s', null=True, blank=True
+    )
+    sidebyside = models.ForeignKey(
+        SideBySide, on_delete=models.CASCADE,
+        related_name='%(class)s', null=True, blank=True
+    )
+    ghosting_story = models.ForeignKey(
+        GhostingStory, on_delete=models.CASCADE,
+        related_name='%(class)s', null=True, blank=True
+    )
+    referrer = models.CharField(max_length=20, choices=ContentView.REFERRER_CHOICES)
+    views = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        abstract = True
+
+    def __str__(self):
+        content = self.rant or self.sidebyside or self.ghosting_story
+        return f"{self.views} views from {self.get_referrer_display()} on {content}"
+
+
+class HourlyContentViews(ContentViewRollup):
+    """Views per hour; built by `manage.py rollup_content_views`."""
+    hour = models.DateTimeField()
+
+    class Meta:
+        verbose_name = "Hourly Content Views"
+        verbose_name_plural = "Hourly Content Views"
+        ordering = ['-hour']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['hour', 'rant', 'referrer'], name='unique_hourly_rant_views'
+            ),
+            models.UniqueConstraint(
+                fields=['hour', 'sidebyside', 'referrer'], name='unique_hourly_sidebyside_views'
+            ),
+            models.UniqueConstraint(
+                fields=['hour', 'ghosting_story', 'referrer'], name='unique_hourly_ghosting_views'
+            ),
+        ]
+
+
+class DailyContentViews(ContentViewRollup):
+    """Views per day; built by `manage.py rollup_content_views`."""
+    day = models.DateField()
+
+    class Meta:
+        verbose_name = "Daily Content Views"
+        verbose_name_plural = "Daily Content Views"
+        ordering = ['-day']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['day', 'rant', 'referrer'], name='unique_daily_rant_views'
+            ),
+            models.UniqueConstraint(
+                fields=['day', 'sidebyside', 'referrer'], name='unique_daily_sidebyside_views'
+            ),
+            models.UniqueConstraint(
+                fields=['day', 'ghosting_story', 'referrer'], name='unique_daily_ghosting_views'
+            ),
+        ]
+
+
+class Watermark(models.Model):
+    """Named progress marker for incremental background jobs."""
+    name = models.CharField(max_length=50, unique=True)
+    value = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} @ {self.value}"
+
+
+class LeaderboardEntry(models.Model):
+    """
+    Precomputed Hall of Fame ranking for one content item in one time window.
+
+    Kept up to date by the scheduler (rants/leaderboards.py); pages read a
+    range of ranks through the (kind, window, rank) index.
+    """
+    WINDOW_CHOICES = [
+        ('week', 'This Week'),
+        ('month', 'This Month'),
+        ('all', 'All Time'),
+    ]
+
+    KIND_CHOICES = [
+        ('rant', 'Rants'),
+        ('sidebyside', 'Side by Sides'),
+        ('ghosting', 'Ghosting Stories'),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    window = models.CharField(max_length=10, choices=WINDOW_CHOICES)
+    rank = models.PositiveIntegerField()
+    score = models.PositiveIntegerField(default=0)
+    rant = models.ForeignKey(
+        Rant, on_delete=models.CASCADE,
+        related_name='leaderboard_entries', null=True, blank=True
+    )
+    sidebyside = models.ForeignKey(
+        SideBySide, on_delete=models.CASCADE,
+        related_name='leaderboard_entries', null=True, blank=True
+    )
+    ghosting_story = models.ForeignKey(
+        GhostingStory, on_delete=models.CASCADE,
+        related_name='leaderboard_entries', null=True, blank=True
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "leaderboard entries"
+        ordering = ['kind', 'window', 'rank']
+        indexes = [
+            models.Index(fields=['kind', 'window', 'rank'], name='leaderboard_rank_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['window', 'rant'], name='unique_leaderboard_rant'),
+            models.UniqueConstraint(fields=['window', 'sidebyside'], name='unique_leaderboard_sidebyside'),
+            models.UniqueConstraint(fields=['window', 'ghosting_story'], name='unique_leaderboard_ghosting'),
+        ]
+
+    def __str__(self):
+        return f"#{self.rank} {self.get_kind_display()} ({self.get_window_display()}): {self.content}"
+
+    @property
+    def content(self):
+        return self.rant or self.sidebyside or self.ghosting_story
+
+
+class SearchEntry(models.Model):
+    """
+    One approved, searchable content item.
+
+    The text index lives beside this table and differs per database; see
+    rants/search.py.
+    """
+    kind = models.CharField(max_length=20, choices=LeaderboardEntry.KIND_CHOICES)
+    object_id = models.UUIDField()
+    # The content's own created_at, used to break ranking ties
+    created_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name_plural = "search entries"
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'object_id'], name='unique_search_entry'),
+        ]
+
+    def __str__(self):
+        return f"{self.get_kind_display()} {self.object_id}"
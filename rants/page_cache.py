@@ -0,0 +1,116 @@
+"""
+Whole-response cache for the /real/ and /vs/ share pages.
+
+LinkedIn visitors land on these pages without a session, so their
+responses are identical and can be served straight from the cache,
+along with a gzipped copy for clients that accept it. Visitors with a
+session cookie (who may have reacted, or have flash messages) always get
+a fresh render.
+
+Entries are dropped when the content is edited, moderated or deleted
+(rants/signals.py, admin actions) and when a reaction is toggled
+(ReactView). The default cache is per-process, which matches the single
+gunicorn worker this app runs; set REDIS_URL to share the cache, and its
+invalidations, between workers.
+"""
+
+import gzip
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+
+from .view_tracking import normalize_referrer, record_view
+
+KEY_PREFIX = 'share_page'
+
+# ReactView content types that have a share page
+SHARE_KINDS = ('rant', 'sidebyside')
+
+# Query strings that are cached; anything else (utm_* etc.) is rendered
+# normally rather than filling the cache with one entry per variant.
+CACHED_QUERIES = ['', 'ref=li', 'ref=tw', 'ref=fb', 'ref=direct']
+
+MIN_GZIP_SIZE = 512
+
+
+def cache_key(kind, slug, query=''):
+    return f'{KEY_PREFIX}:{kind}:{slug}:{query}'
+
+
+def invalidate(kind, slug):
+    """Drop every cached variant of one share page."""
+    cache.delete_many([cache_key(kind, slug, query) for query in CACHED_QUERIES])
+
+
+def is_cacheable(request):
+    return (
+        request.method == 'GET'
+        and request.META.get('QUERY_STRING', '') in CACHED_QUERIES
+        and settings.SESSION_COOKIE_NAME not in request.COOKIES
+        and 'messages' not in request.COOKIES
+    )
+
+
+def accepts_gzip(request):
+    return 'gzip' in request.META.get('HTTP_ACCEPT_ENCODING', '')
+
+
+def cached_response(entry, request):
+    if entry['gzip'] is not None and accepts_gzip(request):
+        response = HttpResponse(entry['gzip'], content_type=entry['content_type'])
+        response['Content-Encoding'] = 'gzip'
+    else:
+        response = HttpResponse(entry['body'], content_type=entry['content_type'])
+    patch_vary_headers(response, ['Accept-Encoding', 'Cookie'])
+    return response
+
+
+class SharePageCacheMixin:
+    """
+    DetailView mixin that caches anonymous share page responses and
+    records the referrer view on every request, hit or miss.
+
+    Subclasses set `share_kind` (the cache namespace) and `view_field`
+    (the ContentView foreign key for the object).
+    """
+    share_kind = None
+    view_field = None
+
+    def get(self, request, *args, **kwargs):
+        ref = normalize_referrer(request.GET.get('ref', 'direct'))
+        slug = kwargs[self.slug_url_kwarg]
+        query = request.META.get('QUERY_STRING', '')
+        key = cache_key(self.share_kind, slug, query)
+
+        cacheable = is_cacheable(request)
+        if cacheable:
+            entry = cache.get(key)
+            # The page embeds its own absolute URL, so a different host or
+            # scheme (e.g. a Railway preview domain) is a miss
+            if entry is not None and entry['url'] == request.build_absolute_uri():
+                record_view(ref, **{f'{self.view_field}_id': entry['pk']})
+                return cached_response(entry, request)
+
+        response = super().get(request, *args, **kwargs)
+
+        # Track the view with referrer (buffered, written in the background)
+        record_view(ref, **{self.view_field: self.object})
+
+        if cacheable:
+            def store(response):
+                if response.status_code != 200:
+                    return
+                body = response.content
+                cache.set(key, {
+                    'url': request.build_absolute_uri(),
+                    'pk': self.object.pk,
+                    'content_type': response['Content-Type'],
+                    'body': body,
+                    'gzip': gzip.compress(body) if len(body) >= MIN_GZIP_SIZE else None,
+                }, settings.SHARE_PAGE_CACHE_TIMEOUT)
+
+            response.add_post_render_callback(store)
+        patch_vary_headers(response, ['Cookie'])
+        return response
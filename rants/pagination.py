@@ -0,0 +1,169 @@
+"""
+Keyset (cursor) pagination for feeds.
+
+Instead of COUNT(*) plus OFFSET, each page is fetched with a WHERE clause
+on the sort key of the last row seen, e.g. (created_at, id) < (t, pk), so
+deep pages cost the same as the first. Cursors are signed so they can't
+be tampered with, and opaque to the client.
+"""
+
+import datetime
+import uuid
+
+from django.core import signing
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+CURSOR_SALT = 'rants.pagination.cursor'
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+class CursorPage:
+    """One page of results, with the same has_* API as Django's Page."""
+
+    def __init__(self, object_list, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    """
+    Paginate an ordered queryset by its ordering keys.
+
+    The queryset's order_by() fields (plus the primary key as a tiebreaker)
+    form the cursor. They should be backed by an index.
+    """
+
+    def __init__(self, queryset, per_page):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.model = queryset.model
+
+        ordering = list(queryset.query.order_by or self.model._meta.ordering) or ['-pk']
+        if not any(field.lstrip('-') in ('pk', 'id') for field in ordering):
+            ordering.append('-pk' if ordering[-1].startswith('-') else 'pk')
+        self.ordering = ordering
+
+    def page(self, cursor=None):
+        if cursor:
+            values, backwards = self.decode_cursor(cursor)
+        else:
+            values, backwards = None, False
+
+        rows = list(self._page_queryset(values, backwards))
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if backwards:
+            rows.reverse()
+
+        next_cursor = previous_cursor = None
+        if rows:
+            if has_more or backwards:
+                next_cursor = self.encode_cursor(rows[-1], backwards=False)
+            if values is not None and (has_more or not backwards):
+                previous_cursor = self.encode_cursor(rows[0], backwards=True)
+        return CursorPage(rows, next_cursor, previous_cursor)
+
+    def page_queryset(self, cursor=None):
+        """The query page(cursor) runs, without running it (e.g. to EXPLAIN it)."""
+        if cursor:
+            return self._page_queryset(*self.decode_cursor(cursor))
+        return self._page_queryset(None, False)
+
+    def _page_queryset(self, values, backwards):
+        ordering = self.ordering
+        if backwards:
+            ordering = [self._flip(field) for field in ordering]
+
+        queryset = self.queryset.order_by(*ordering)
+        if values is not None:
+            queryset = queryset.filter(self._after(ordering, values))
+        return queryset[:self.per_page + 1]
+
+    def encode_cursor(self, obj, backwards):
+        values = [self._serialize(getattr(obj, field.lstrip('-'))) for field in self.ordering]
+        return signing.dumps(
+            {'o': self.ordering_key, 'v': values, 'b': backwards},
+            salt=CURSOR_SALT, compress=True,
+        )
+
+    @property
+    def ordering_key(self):
+        """Identifies the sort a cursor belongs to, e.g. '-created_at,-pk'."""
+        return ','.join(self.ordering)
+
+    def decode_cursor(self, cursor):
+        try:
+            data = signing.loads(cursor, salt=CURSOR_SALT)
+            # A cursor from another sort (e.g. ?sort=top replayed on
+            # ?sort=new) holds values for different key columns
+            if data['o'] != self.ordering_key or len(data['v']) != len(self.ordering):
+                raise ValueError("Cursor does not match the current ordering")
+            values = [
+                self._get_field(field).to_python(value)
+                for field, value in zip(self.ordering, data['v'])
+            ]
+            return values, bool(data['b'])
+        except (signing.BadSignature, KeyError, TypeError, ValueError, ValidationError) as e:
+            raise InvalidCursor(str(e))
+
+    def _get_field(self, field):
+        name = field.lstrip('-')
+        return self.model._meta.pk if name == 'pk' else self.model._meta.get_field(name)
+
+    def _after(self, ordering, values):
+        """Build (a, b, c) > (x, y, z) as an OR of prefix-equality clauses."""
+        condition = Q()
+        for i, field in enumerate(ordering):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            clause = Q(**{f'{name}__{lookup}': values[i]})
+            for prev_field, prev_value in zip(ordering[:i], values[:i]):
+                clause &= Q(**{prev_field.lstrip('-'): prev_value})
+            condition |= clause
+        return condition
+
+    @staticmethod
+    def _flip(field):
+        return field[1:] if field.startswith('-') else f'-{field}'
+
+    @staticmethod
+    def _serialize(value):
+        if isinstance(value, (datetime.datetime, datetime.date)):
+            return value.isoformat()
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        return value
+
+
+class CursorPaginationMixin:
+    """ListView mixin that swaps Django's Paginator for CursorPaginator."""
+    cursor_kwarg = 'cursor'
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = CursorPaginator(queryset, page_size)
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidCursor:
+            # Tampered, stale or from another sort: start from the first page
+            page = paginator.page()
+        return paginator, page, page.object_list, page.has_other_pages()
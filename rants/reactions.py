@@ -0,0 +1,68 @@
+"""Helpers for the denormalized reaction counters."""
+
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Count
+
+from .models import Rant, SideBySide, GhostingStory, Reaction
+
+
+# Content that can be reacted to or reported, keyed by the URL's content_type:
+# (model, name of its foreign key on Reaction)
+CONTENT_TYPES = {
+    'rant': (Rant, 'rant'),
+    'sidebyside': (SideBySide, 'sidebyside'),
+    'ghosting': (GhostingStory, 'ghosting_story'),
+}
+
+# Content models that carry reaction counters, keyed by their FK on Reaction
+COUNTED_MODELS = {
+    'rant': Rant,
+    'sidebyside': SideBySide,
+    'ghosting_story': GhostingStory,
+}
+
+
+def counter_fields():
+    """All counter columns, per-type first and then the total."""
+    return [Reaction.counter_field(code) for code, _ in Reaction.REACTION_TYPES] + ['reaction_count']
+
+
+def rebuild_reaction_counts(fk_name, batch_size=500):
+    """
+    Recompute the counters for one content model from the Reaction table.
+
+    Returns the number of rows whose counters were out of date.
+    """
+    model = COUNTED_MODELS[fk_name]
+    fields = counter_fields()
+
+    counts = defaultdict(dict)
+    rows = (
+        Reaction.objects.filter(**{f'{fk_name}__isnull': False})
+        .values_list(fk_name, 'reaction_type')
+        .annotate(n=Count('id'))
+        .order_by()
+    )
+    for object_id, reaction_type, n in rows:
+        counts[object_id][Reaction.counter_field(reaction_type)] = n
+
+    stale = []
+    for obj in model.objects.only('pk', 'reaction_version', *fields).iterator(chunk_size=batch_size):
+        expected = counts.get(obj.pk, {})
+        expected['reaction_count'] = sum(expected.values())
+        changed = False
+        for field in fields:
+            value = expected.get(field, 0)
+            if getattr(obj, field) != value:
+                setattr(obj, field, value)
+                changed = True
+        if changed:
+            obj.reaction_version += 1
+            stale.append(obj)
+
+    with transaction.atomic():
+        model.objects.bulk_update(stale, fields + ['reaction_version'], batch_size=batch_size)
+    return len(stale)
+
@@ -0,0 +1,80 @@
+"""
+Markdown rendering for user-submitted content.
+
+Building a Markdown instance and a bleach Cleaner is far more expensive
+than using one, so each thread keeps its own pair (neither is thread-safe)
+and reuses it between calls. Rendered output is memoized in a bounded LRU
+keyed by a hash of the source text, shared by all threads in the process.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import markdown
+from bleach.sanitizer import Cleaner
+
+# Bump this whenever the rendered output changes (e.g. the allowed tags),
+# then run `manage.py rerender_markdown` to refresh the stored HTML.
+RENDERER_VERSION = 1
+
+ALLOWED_TAGS = [
+    'p', 'br', 'strong', 'em', 'ul', 'ol', 'li', 'blockquote',
+    'code', 'pre', 'h1', 'h2', 'h3', 'a'
+]
+ALLOWED_ATTRIBUTES = {'a': ['href', 'title']}
+MARKDOWN_EXTENSIONS = ['fenced_code']
+
+# Maximum number of rendered documents kept in memory per process
+CACHE_SIZE = 1024
+
+_local = threading.local()
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _get_renderer():
+    """Return this thread's (Markdown, Cleaner) pair, building it on first use."""
+    renderer = getattr(_local, 'renderer', None)
+    if renderer is None:
+        renderer = _local.renderer = (
+            markdown.Markdown(extensions=MARKDOWN_EXTENSIONS),
+            Cleaner(tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRIBUTES),
+        )
+    return renderer
+
+
+def render_markdown_uncached(text):
+    """Render markdown to sanitized HTML, bypassing the LRU."""
+    md, cleaner = _get_renderer()
+    try:
+        html = md.convert(text)
+    finally:
+        md.reset()
+    return cleaner.clean(html)
+
+
+def render_markdown(text):
+    """Render markdown to sanitized HTML."""
+    key = hashlib.sha256(text.encode('utf-8')).digest()
+
+    with _cache_lock:
+        html = _cache.get(key)
+        if html is not None:
+            _cache.move_to_end(key)
+            return html
+
+    html = render_markdown_uncached(text)
+
+    with _cache_lock:
+        _cache[key] = html
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return html
+
+
+def clear_cache():
+    """Drop all memoized output (e.g. after changing the allowed tags)."""
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,97 @@
+"""Incremental hourly/daily rollups of ContentView, plus raw-row retention."""
+
+from collections import Counter
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import ContentView, HourlyContentViews, DailyContentViews, Watermark
+
+WATERMARK_NAME = 'content_view_rollup'
+CONTENT_FIELDS = ['rant_id', 'sidebyside_id', 'ghosting_story_id']
+
+
+def _add_views(model, bucket_field, counts):
+    """Add counts to existing rollup rows, creating the missing ones."""
+    for (bucket, rant_id, sidebyside_id, ghosting_story_id, referrer), n in counts.items():
+        key = {
+            bucket_field: bucket,
+            'rant_id': rant_id,
+            'sidebyside_id': sidebyside_id,
+            'ghosting_story_id': ghosting_story_id,
+            'referrer': referrer,
+        }
+        if not model.objects.filter(**key).update(views=F('views') + n):
+            model.objects.create(views=n, **key)
+
+
+def rollup_content_views(chunk_size=5000, lag=timedelta(minutes=5)):
+    """
+    Fold ContentView rows newer than the stored watermark into the rollups.
+
+    Rows are processed in id order and the watermark advances with each
+    chunk, so every row is counted exactly once. Rows younger than `lag`
+    are left for the next run, giving buffered or still-committing inserts
+    with lower ids time to land. Returns the number of rows rolled up.
+    """
+    cutoff = timezone.now() - lag
+    total = 0
+
+    while True:
+        with transaction.atomic():
+            # Locking the watermark keeps concurrent runs from double counting
+            watermark, _ = Watermark.objects.select_for_update().get_or_create(name=WATERMARK_NAME)
+            rows = list(
+                ContentView.objects.filter(id__gt=watermark.value)
+                .order_by('id')
+                .values_list('id', 'timestamp', 'referrer', *CONTENT_FIELDS)[:chunk_size]
+            )
+
+            hourly = Counter()
+            daily = Counter()
+            last_id = None
+            reached_cutoff = False
+            for view_id, timestamp, referrer, *content in rows:
+                if timestamp > cutoff:
+                    reached_cutoff = True
+                    break
+                hour = timestamp.replace(minute=0, second=0, microsecond=0)
+                hourly[(hour, *content, referrer)] += 1
+                daily[(hour.date(), *content, referrer)] += 1
+                last_id = view_id
+
+            if last_id is None:
+                return total
+
+            _add_views(HourlyContentViews, 'hour', hourly)
+            _add_views(DailyContentViews, 'day', daily)
+            watermark.value = last_id
+            watermark.save(update_fields=['value', 'updated_at'])
+
+        total += sum(hourly.values())
+        if reached_cutoff or len(rows) < chunk_size:
+            return total
+
+
+def prune_content_views(retention_days, chunk_size=5000):
+    """
+    Delete raw ContentView rows older than `retention_days` in chunks.
+
+    Only rows already folded into the rollups are removed. Returns the
+    number of rows deleted.
+    """
+    watermark = Watermark.objects.filter(name=WATERMARK_NAME).values_list('value', flat=True).first()
+    if not watermark:
+        return 0
+
+    cutoff = timezone.now() - timedelta(days=retention_days)
+    stale = ContentView.objects.filter(id__lte=watermark, timestamp__lt=cutoff)
+    total = 0
+    while True:
+        ids = list(stale.order_by('id').values_list('id', flat=True)[:chunk_size])
+        if not ids:
+            return total
+        ContentView.objects.filter(id__in=ids).delete()
+        total += len(ids)
@@ -0,0 +1,78 @@
+"""
+Periodic background work, run by the `clock` process (`manage.py run_scheduler`).
+
+Each task runs every `interval` seconds in that one process, so tasks
+never overlap with themselves. A task that raises is logged and retried
+at its next interval; the others keep running.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from django.conf import settings
+
+from .leaderboards import refresh_all_leaderboards
+from .rollups import prune_content_views, rollup_content_views
+from .trending import update_recent_hotness
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PeriodicTask:
+    name: str
+    interval: float
+    func: Callable[[], str]
+
+
+def rollup_views():
+    rolled = rollup_content_views()
+    pruned = 0
+    if settings.CONTENT_VIEW_RETENTION_DAYS > 0:
+        pruned = prune_content_views(settings.CONTENT_VIEW_RETENTION_DAYS)
+    return f"rolled up {rolled} view(s), pruned {pruned}"
+
+
+def refresh_leaderboards():
+    changes = sum(refresh_all_leaderboards().values())
+    return f"{changes} change(s)"
+
+
+def update_hotness():
+    updated = sum(update_recent_hotness().values())
+    return f"{updated} score(s) updated"
+
+
+TASKS = [
+    PeriodicTask('rollup_content_views', settings.CONTENT_VIEW_ROLLUP_INTERVAL, rollup_views),
+    PeriodicTask('refresh_leaderboards', settings.LEADERBOARD_REFRESH_INTERVAL, refresh_leaderboards),
+    PeriodicTask('update_hotness', settings.TRENDING_UPDATE_INTERVAL, update_hotness),
+]
+
+
+class Scheduler:
+    """Tracks when each task is next due; everything is due on the first pass."""
+
+    def __init__(self, tasks=TASKS):
+        self.tasks = tasks
+        self.next_run = {task.name: 0.0 for task in tasks}
+
+    def run_pending(self):
+        """Run every due task. Returns [(task name, summary or None on failure)]."""
+        results = []
+        for task in self.tasks:
+            if time.monotonic() < self.next_run[task.name]:
+                continue
+            try:
+                summary = task.func()
+            except Exception:
+                logger.exception("Periodic task %s failed", task.name)
+                summary = None
+            self.next_run[task.name] = time.monotonic() + task.interval
+            results.append((task.name, summary))
+        return results
+
+    def seconds_until_due(self):
+        return max(0.0, min(self.next_run.values()) - time.monotonic())
@@ -0,0 +1,219 @@
+"""
+Full-text search across rants, side-by-sides and ghosting stories.
+
+Every approved item has one SearchEntry row. The text index sits next to
+it and is database specific, so it is managed with raw SQL here:
+
+- PostgreSQL: a weighted `document` tsvector column on rants_searchentry
+  with a GIN index, ranked with ts_rank_cd().
+- SQLite: an FTS5 table whose rowid is the SearchEntry id, ranked with
+  bm25().
+
+Titles (and company/recruiter names) are weighted above body text. The
+index is kept in sync by the signals in rants/signals.py; `manage.py
+rebuild_search_index` rebuilds it in place.
+"""
+
+import re
+
+from django.db import connection, transaction
+
+from .models import Rant, SideBySide, GhostingStory, SearchEntry
+
+FTS_TABLE = 'rants_searchentry_fts'
+TEXT_SEARCH_CONFIG = 'english'
+
+# kind -> (model, heading fields, body fields)
+SEARCHABLE = {
+    'rant': (Rant, ['title'], ['body']),
+    'sidebyside': (SideBySide, ['context'], ['linkedin_version', 'reality_version']),
+    'ghosting': (GhostingStory, ['company', 'recruiter_name'], ['story']),
+}
+
+# Columns each kind's document is built from; other saves don't reindex
+INDEXED_FIELDS = {
+    kind: {'is_approved', *heading, *body}
+    for kind, (model, heading, body) in SEARCHABLE.items()
+}
+
+
+def kind_for(obj):
+    """The search kind of a content object, or None if it isn't searchable."""
+    for kind, (model, _, _) in SEARCHABLE.items():
+        if isinstance(obj, model):
+            return kind
+    return None
+
+
+def create_index(schema_editor):
+    """Create the vendor-specific text index (used by the migration)."""
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute("ALTER TABLE rants_searchentry ADD COLUMN document tsvector")
+        schema_editor.execute(
+            "CREATE INDEX rants_searchentry_document_idx ON rants_searchentry USING GIN (document)"
+        )
+    elif vendor == 'sqlite':
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+            "heading, body, tokenize = 'porter unicode61')"
+        )
+
+
+def drop_index(schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute("DROP INDEX IF EXISTS rants_searchentry_document_idx")
+        schema_editor.execute("ALTER TABLE rants_searchentry DROP COLUMN IF EXISTS document")
+    elif vendor == 'sqlite':
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+def _document(kind, obj):
+    _, heading, body = SEARCHABLE[kind]
+    return (
+        ' '.join(getattr(obj, field) or '' for field in heading),
+        '\n'.join(getattr(obj, field) or '' for field in body),
+    )
+
+
+def index_objects(kind, objects):
+    """
+    Add or refresh the index rows for a batch of objects of one kind.
+
+    Unapproved objects are removed from the index instead.
+    """
+    objects = list(objects)
+    approved = [obj for obj in objects if obj.is_approved]
+    rejected = [obj.pk for obj in objects if not obj.is_approved]
+
+    with transaction.atomic():
+        if rejected:
+            remove_objects(kind, rejected)
+        if not approved:
+            return
+
+        SearchEntry.objects.bulk_create(
+            [SearchEntry(kind=kind, object_id=obj.pk, created_at=obj.created_at) for obj in approved],
+            update_conflicts=True,
+            unique_fields=['kind', 'object_id'],
+            update_fields=['created_at'],
+        )
+        # bulk_create can't return ids for upserted rows on every backend
+        entry_ids = dict(
+            SearchEntry.objects.filter(kind=kind, object_id__in=[obj.pk for obj in approved])
+            .values_list('object_id', 'id')
+        )
+        rows = [(entry_ids[obj.pk], *_document(kind, obj)) for obj in approved]
+
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.executemany(
+                    "UPDATE rants_searchentry SET document = "
+                    "setweight(to_tsvector(%s::regconfig, %s), 'A') || "
+                    "setweight(to_tsvector(%s::regconfig, %s), 'B') "
+                    "WHERE id = %s",
+                    [
+                        (TEXT_SEARCH_CONFIG, heading, TEXT_SEARCH_CONFIG, body, entry_id)
+                        for entry_id, heading, body in rows
+                    ],
+                )
+            elif connection.vendor == 'sqlite':
+                cursor.executemany(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [(row[0],) for row in rows])
+                cursor.executemany(
+                    f"INSERT INTO {FTS_TABLE} (rowid, heading, body) VALUES (%s, %s, %s)", rows
+                )
+
+
+def remove_objects(kind, object_ids):
+    """Drop the given objects from the index."""
+    entries = SearchEntry.objects.filter(kind=kind, object_id__in=list(object_ids))
+    with transaction.atomic():
+        if connection.vendor == 'sqlite':
+            entry_ids = list(entries.values_list('id', flat=True))
+            if entry_ids:
+                with connection.cursor() as cursor:
+                    cursor.executemany(
+                        f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [(entry_id,) for entry_id in entry_ids]
+                    )
+        entries.delete()
+
+
+def clear_index():
+    with transaction.atomic():
+        if connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        SearchEntry.objects.all().delete()
+
+
+def _terms(query):
+    return re.findall(r'\w+', query.lower())[:16]
+
+
+def search_entries(query, kind=None, limit=50):
+    """
+    Return [(kind, object_id), ...] matching every word of `query`, best first.
+
+    Ties are broken by recency.
+    """
+    terms = _terms(query)
+    if not terms:
+        return []
+
+    params = []
+    if connection.vendor == 'postgresql':
+        sql = (
+            "SELECT e.kind, e.object_id FROM rants_searchentry e, "
+            "plainto_tsquery(%s::regconfig, %s) q WHERE e.document @@ q"
+        )
+        params += [TEXT_SEARCH_CONFIG, ' '.join(terms)]
+        order = "ts_rank_cd(e.document, q) DESC, e.created_at DESC"
+    elif connection.vendor == 'sqlite':
+        sql = (
+            f"SELECT e.kind, e.object_id FROM {FTS_TABLE} f "
+            f"JOIN rants_searchentry e ON e.id = f.rowid WHERE {FTS_TABLE} MATCH %s"
+        )
+        # Quote each word so user input can't use FTS5 query syntax
+        params.append(' '.join(f'"{term}"' for term in terms))
+        order = f"bm25({FTS_TABLE}, 4.0, 1.0), e.created_at DESC"
+    else:
+        raise NotImplementedError(f"Full-text search is not implemented for {connection.vendor}")
+
+    if kind:
+        sql += " AND e.kind = %s"
+        params.append(kind)
+    sql += f" ORDER BY {order} LIMIT %s"
+    params.append(limit)
+
+    to_uuid = SearchEntry._meta.get_field('object_id').to_python
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [(row_kind, to_uuid(object_id)) for row_kind, object_id in cursor.fetchall()]
+
+
+def search(query, kind=None, limit=50):
+    """
+    Ranked content objects for `query` across all searchable kinds.
+
+    Returns [(kind, obj), ...]; objects are loaded with one query per kind.
+    """
+    entries = search_entries(query, kind=kind, limit=limit)
+
+    ids_by_kind = {}
+    for entry_kind, object_id in entries:
+        ids_by_kind.setdefault(entry_kind, []).append(object_id)
+
+    objects = {}
+    for entry_kind, ids in ids_by_kind.items():
+        model = SEARCHABLE[entry_kind][0]
+        queryset = model.objects.filter(pk__in=ids, is_approved=True)
+        if model is Rant:
+            queryset = queryset.select_related('category')
+        objects.update({(entry_kind, obj.pk): obj for obj in queryset})
+
+    return [
+        (entry_kind, objects[entry_kind, object_id])
+        for entry_kind, object_id in entries
+        if (entry_kind, object_id) in objects
+    ]
@@ -0,0 +1,73 @@
+"""Keep the search index, company counters and share page cache in sync with content changes."""
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import companies, page_cache, search
+from .models import Rant, SideBySide, GhostingStory
+
+
+@receiver(post_save, sender=Rant)
+@receiver(post_save, sender=SideBySide)
+@receiver(post_save, sender=GhostingStory)
+def index_content(sender, instance, update_fields=None, raw=False, **kwargs):
+    if raw:
+        return
+    kind = search.kind_for(instance)
+    # Counter and score updates don't change the document
+    if update_fields is not None and not search.INDEXED_FIELDS[kind] & set(update_fields):
+        return
+    search.index_objects(kind, [instance])
+
+
+@receiver(post_delete, sender=Rant)
+@receiver(post_delete, sender=SideBySide)
+@receiver(post_delete, sender=GhostingStory)
+def unindex_content(sender, instance, **kwargs):
+    search.remove_objects(search.kind_for(instance), [instance.pk])
+
+
+# Fields that change what a story contributes to its company's counters
+COMPANY_COUNTED_FIELDS = {'company', 'canonical_company', 'stage', 'platform', 'is_approved'}
+
+
+@receiver(pre_save, sender=GhostingStory)
+def remember_counted_story(sender, instance, update_fields=None, raw=False, **kwargs):
+    instance._counted_before = None
+    if raw or instance._state.adding:
+        return
+    if update_fields is not None and not COMPANY_COUNTED_FIELDS & set(update_fields):
+        instance._counted_before = False  # unchanged, skip post_save
+        return
+    before = (
+        GhostingStory.objects.filter(pk=instance.pk)
+        .values('is_approved', 'canonical_company_id', 'stage', 'platform')
+        .first()
+    )
+    if before:
+        instance._counted_before = companies.counted_key(GhostingStory(**before))
+
+
+@receiver(post_save, sender=GhostingStory)
+def count_story(sender, instance, raw=False, **kwargs):
+    before = getattr(instance, '_counted_before', None)
+    if raw or before is False:
+        return
+    after = companies.counted_key(instance)
+    if before != after:
+        companies.apply_story_changes(removed=[before], added=[after])
+
+
+@receiver(post_delete, sender=GhostingStory)
+def uncount_story(sender, instance, **kwargs):
+    companies.apply_story_changes(removed=[companies.counted_key(instance)])
+
+
+@receiver(post_save, sender=Rant)
+@receiver(post_save, sender=SideBySide)
+@receiver(post_delete, sender=Rant)
+@receiver(post_delete, sender=SideBySide)
+def invalidate_share_page(sender, instance, raw=False, **kwargs):
+    if raw or not instance.share_slug:
+        return
+    page_cache.invalidate(search.kind_for(instance), instance.share_slug)
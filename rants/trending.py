@@ -0,0 +1,101 @@
+"""
+Trending ("hot") ranking.
+
+The score is log10(engagement) plus the item's age expressed in units of
+DECAY_SECONDS, so a post ten times as engaging as another is worth the
+same as one DECAY_SECONDS newer. Because time enters as a constant per
+item, older scores never need rewriting just because time passes; the
+scheduler only recomputes items whose reactions changed (ReactView stamps
+`reacted_at`, so removals count too) or that got new rolled-up views.
+"""
+
+import math
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.db import transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from .models import HourlyContentViews, DailyContentViews, Watermark
+from .reactions import CONTENT_TYPES
+
+EPOCH = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+DECAY_SECONDS = 45000
+VIEW_WEIGHT = 0.1
+WATERMARK_NAME = 'hotness'
+
+
+def hotness_score(reactions, views, created_at):
+    """Compute the stored hotness for one item."""
+    engagement = max(reactions + VIEW_WEIGHT * views, 1)
+    age = (created_at - EPOCH).total_seconds()
+    return round(math.log10(engagement) + age / DECAY_SECONDS, 7)
+
+
+def touched_since(kind, since):
+    """Ids of content with reactions added or removed, or views rolled up, since `since`."""
+    model, fk_name = CONTENT_TYPES[kind]
+    ids = set(model.objects.filter(reacted_at__gte=since).values_list('pk', flat=True))
+    ids.update(
+        HourlyContentViews.objects.filter(hour__gte=since, **{f'{fk_name}__isnull': False})
+        .values_list(fk_name, flat=True)
+    )
+    return ids
+
+
+def update_hotness(kind, ids=None, batch_size=500):
+    """Recompute hotness for the given ids (or every row). Returns rows updated."""
+    model, fk_name = CONTENT_TYPES[kind]
+    queryset = model.objects.only('pk', 'reaction_count', 'created_at', 'hotness')
+    if ids is not None:
+        queryset = queryset.filter(pk__in=ids)
+
+    updated = 0
+    batch = []
+    for obj in queryset.iterator(chunk_size=batch_size):
+        batch.append(obj)
+        if len(batch) >= batch_size:
+            updated += _write_batch(model, fk_name, batch)
+            batch = []
+    if batch:
+        updated += _write_batch(model, fk_name, batch)
+    return updated
+
+
+def _write_batch(model, fk_name, objects):
+    views = dict(
+        DailyContentViews.objects.filter(**{f'{fk_name}__in': [obj.pk for obj in objects]})
+        .values_list(fk_name)
+        .annotate(total=Sum('views'))
+        .order_by()
+    )
+    changed = []
+    for obj in objects:
+        score = hotness_score(obj.reaction_count, views.get(obj.pk, 0), obj.created_at)
+        if score != obj.hotness:
+            obj.hotness = score
+            changed.append(obj)
+    model.objects.bulk_update(changed, ['hotness'])
+    return len(changed)
+
+
+def update_recent_hotness(full=False):
+    """
+    Recompute hotness for items touched since the last run (or all items).
+
+    Returns {kind: rows updated}.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        watermark, _ = Watermark.objects.select_for_update().get_or_create(name=WATERMARK_NAME)
+        # Overlap by an hour so views rolled up late into the current hour count
+        since = datetime.fromtimestamp(watermark.value, tz=dt_timezone.utc) - timedelta(hours=1)
+
+        results = {}
+        for kind in CONTENT_TYPES:
+            ids = None if full or not watermark.value else touched_since(kind, since)
+            results[kind] = update_hotness(kind, ids)
+
+        watermark.value = int(now.timestamp())
+        watermark.save(update_fields=['value', 'updated_at'])
+    return results
@@ -7,6 +7,7 @@ urlpatterns = [
     # Homepage and feed
     path('', views.HomeView.as_view(), name='home'),
     path('hall-of-fame/', views.HallOfFameView.as_view(), name='hall_of_fame'),
+    path('search/', views.SearchView.as_view(), name='search'),
 
     # Rant views
     path('rant/<uuid:pk>/', views.RantDetailView.as_view(), name='detail'),
@@ -23,6 +24,8 @@ urlpatterns = [
 
     # Wall of Shame (ghosting stories)
     path('wall-of-shame/', views.WallOfShameView.as_view(), name='wall_of_shame'),
+    path('wall-of-shame/worst-offenders/', views.WorstOffendersView.as_view(), name='worst_offenders'),
+    path('wall-of-shame/companies/', views.CompanySuggestionsView.as_view(), name='company_suggestions'),
     path('wall-of-shame/<uuid:pk>/', views.GhostingStoryDetailView.as_view(), name='ghosting_detail'),
     path('submit/ghosting/', views.GhostingStoryCreateView.as_view(), name='ghosting_create'),
 
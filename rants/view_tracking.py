@@ -0,0 +1,127 @@
+"""
+Write-behind buffering for ContentView rows.
+
+Share pages call record_view() instead of inserting a ContentView on the
+request path. Views are held in memory and written with bulk_create by a
+background thread once half of CONTENT_VIEW_BUFFER_SIZE views are pending
+or CONTENT_VIEW_FLUSH_INTERVAL seconds have passed, and once more when the
+worker exits.
+
+CONTENT_VIEW_BUFFER_SIZE caps the views held in memory, counting a batch
+that is being written, so at most that many are lost if a worker dies
+without a clean shutdown. A batch whose insert fails goes back into the
+buffer for the next flush. While the buffer is full (e.g. the database is
+slow or down) new views are dropped and counted rather than letting memory
+grow. Set it to 1 to write synchronously.
+"""
+
+import atexit
+import logging
+import threading
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from .models import ContentView
+
+logger = logging.getLogger(__name__)
+
+
+class ContentViewBuffer:
+    """Thread-safe in-process buffer of pending ContentView rows."""
+
+    def __init__(self, max_size, flush_interval):
+        self.max_size = max(1, max_size)
+        self.flush_interval = flush_interval
+        self._dropped = 0
+        self._pending = []
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def add(self, view):
+        """Queue a view. Returns False if it was dropped because the buffer is full."""
+        if self.max_size == 1:
+            return self._write([view])
+
+        with self._lock:
+            if len(self._pending) + self._in_flight >= self.max_size:
+                self._dropped += 1
+                return False
+            self._pending.append(view)
+            # Flush at half capacity so views keep being accepted while
+            # the batch is written
+            flush_soon = len(self._pending) >= max(1, self.max_size // 2)
+
+        self._ensure_thread()
+        if flush_soon:
+            self._wakeup.set()
+        return True
+
+    def flush(self):
+        """Write all pending views. Returns the number written."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._in_flight += len(pending)
+            dropped, self._dropped = self._dropped, 0
+        if dropped:
+            logger.warning("Dropped %d content views while the buffer was full", dropped)
+        if not pending:
+            return 0
+
+        written = self._write(pending)
+        with self._lock:
+            if not written:
+                # In-flight views count towards max_size, so they always fit back
+                self._pending[:0] = pending
+            self._in_flight -= len(pending)
+        return len(pending) if written else 0
+
+    def _write(self, views):
+        try:
+            ContentView.objects.bulk_create(views, batch_size=500)
+        except Exception:
+            logger.exception("Failed to write %d content views", len(views))
+            return False
+        return True
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name='content-view-flusher', daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+            # Don't hold a DB connection open between flushes
+            connection.close()
+
+
+buffer = ContentViewBuffer(
+    max_size=getattr(settings, 'CONTENT_VIEW_BUFFER_SIZE', 100),
+    flush_interval=getattr(settings, 'CONTENT_VIEW_FLUSH_INTERVAL', 5),
+)
+atexit.register(buffer.flush)
+
+
+def normalize_referrer(ref):
+    """Map a ?ref= value onto ContentView.REFERRER_CHOICES."""
+    if ref in ['li', 'tw', 'fb']:
+        return ref
+    return 'direct' if ref == 'direct' else 'other'
+
+
+def record_view(referrer, **content):
+    """
+    Queue a view of a piece of content, e.g. record_view('li', rant=rant).
+    """
+    buffer.add(ContentView(referrer=referrer, timestamp=timezone.now(), **content))
@@ -1,16 +1,24 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.views.generic import ListView, DetailView, CreateView, View
-from django.http import JsonResponse, HttpResponse
-from django.db.models import Count, Q
-from django.core.paginator import Paginator
+from django.http import JsonResponse, HttpResponse, Http404
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
 from django.contrib import messages
 from django.urls import reverse_lazy
+from django.utils import timezone
 
-from .models import Category, Rant, SideBySide, GhostingStory, Reaction, ContentView
+from .autocomplete import company_index
+from .companies import canonical_slug
+from .models import Category, Rant, SideBySide, GhostingStory, Reaction, LeaderboardEntry, Company
 from .forms import RantForm, SideBySideForm, GhostingStoryForm, ReportForm
+from . import page_cache
+from .page_cache import SharePageCacheMixin
+from .pagination import CursorPaginationMixin
+from .reactions import CONTENT_TYPES, counter_fields
+from .search import search
 
 
-class HomeView(ListView):
+class HomeView(CursorPaginationMixin, ListView):
     """Homepage with feed of recent rants."""
     model = Rant
     template_name = 'rants/home.html'
@@ -18,7 +26,7 @@ class HomeView(ListView):
     paginate_by = 10
 
     def get_queryset(self):
-        queryset = Rant.objects.filter(is_approved=True)
+        queryset = Rant.objects.filter(is_approved=True).select_related('category')
 
         # Category filter
         category_slug = self.request.GET.get('category')
@@ -28,9 +36,9 @@ class HomeView(ListView):
         # Sorting
         sort = self.request.GET.get('sort', 'recent')
         if sort == 'reactions':
-            queryset = queryset.annotate(
-                reaction_count=Count('reactions')
-            ).order_by('-reaction_count', '-created_at')
+            queryset = queryset.order_by('-reaction_count', '-created_at')
+        elif sort == 'trending':
+            queryset = queryset.order_by('-hotness', '-created_at')
         elif sort == 'featured':
             queryset = queryset.filter(is_featured=True).order_by('-created_at')
         else:  # recent
@@ -102,32 +110,19 @@ class SideBySideDetailView(DetailView):
         return context
 
 
-class RantShareView(DetailView):
+class RantShareView(SharePageCacheMixin, DetailView):
     """Shareable view for rants - /real/{slug}/ URL for LinkedIn sharing."""
     model = Rant
     template_name = 'rants/rant_share.html'
     context_object_name = 'rant'
     slug_field = 'share_slug'
     slug_url_kwarg = 'slug'
+    share_kind = 'rant'
+    view_field = 'rant'
 
     def get_queryset(self):
         return Rant.objects.filter(is_approved=True)
 
-    def get(self, request, *args, **kwargs):
-        response = super().get(request, *args, **kwargs)
-
-        # Track the view with referrer
-        ref = request.GET.get('ref', 'direct')
-        if ref not in ['li', 'tw', 'fb']:
-            ref = 'direct' if ref == 'direct' else 'other'
-
-        ContentView.objects.create(
-            rant=self.object,
-            referrer=ref
-        )
-
-        return response
-
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['reaction_types'] = Reaction.REACTION_TYPES
@@ -151,32 +146,19 @@ class RantShareView(DetailView):
         return context
 
 
-class SideBySideShareView(DetailView):
+class SideBySideShareView(SharePageCacheMixin, DetailView):
     """Shareable view for side-by-sides - /vs/{slug}/ URL for LinkedIn sharing."""
     model = SideBySide
     template_name = 'rants/sidebyside_share.html'
     context_object_name = 'sidebyside'
     slug_field = 'share_slug'
     slug_url_kwarg = 'slug'
+    share_kind = 'sidebyside'
+    view_field = 'sidebyside'
 
     def get_queryset(self):
         return SideBySide.objects.filter(is_approved=True)
 
-    def get(self, request, *args, **kwargs):
-        response = super().get(request, *args, **kwargs)
-
-        # Track the view with referrer
-        ref = request.GET.get('ref', 'direct')
-        if ref not in ['li', 'tw', 'fb']:
-            ref = 'direct' if ref == 'direct' else 'other'
-
-        ContentView.objects.create(
-            sidebyside=self.object,
-            referrer=ref
-        )
-
-        return response
-
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['reaction_types'] = Reaction.REACTION_TYPES
@@ -256,7 +238,7 @@ class SideBySideCreateView(CreateView):
         return context
 
 
-class CategoryView(ListView):
+class CategoryView(CursorPaginationMixin, ListView):
     """View rants in a specific category."""
     model = Rant
     template_name = 'rants/category.html'
@@ -268,7 +250,7 @@ class CategoryView(ListView):
         return Rant.objects.filter(
             category=self.category,
             is_approved=True
-        ).order_by('-created_at')
+        ).select_related('category').order_by('-created_at')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -294,58 +276,72 @@ class ReactView(View):
         if reaction_type not in valid_types:
             return HttpResponse(status=400)
 
-        # Get content object
-        if content_type == 'rant':
-            content = get_object_or_404(Rant, pk=pk, is_approved=True)
-            existing = Reaction.objects.filter(
-                rant=content,
-                session_key=session_key,
-                reaction_type=reaction_type
-            ).first()
-        elif content_type == 'sidebyside':
-            content = get_object_or_404(SideBySide, pk=pk, is_approved=True)
-            existing = Reaction.objects.filter(
-                sidebyside=content,
-                session_key=session_key,
-                reaction_type=reaction_type
-            ).first()
-        elif content_type == 'ghosting':
-            content = get_object_or_404(GhostingStory, pk=pk, is_approved=True)
-            existing = Reaction.objects.filter(
-                ghosting_story=content,
-                session_key=session_key,
-                reaction_type=reaction_type
-            ).first()
-        else:
+        # Validate content type
+        if content_type not in CONTENT_TYPES:
             return HttpResponse(status=400)
-
-        # Toggle reaction
-        if existing:
-            existing.delete()
-            is_active = False
-        else:
-            if content_type == 'rant':
-                Reaction.objects.create(
-                    rant=content,
-                    session_key=session_key,
-                    reaction_type=reaction_type
-                )
-            elif content_type == 'sidebyside':
-                Reaction.objects.create(
-                    sidebyside=content,
-                    session_key=session_key,
-                    reaction_type=reaction_type
-                )
-            else:  # ghosting
-                Reaction.objects.create(
-                    ghosting_story=content,
-                    session_key=session_key,
-                    reaction_type=reaction_type
-                )
-            is_active = True
-
-        # Get updated counts
-        reaction_counts = content.get_reaction_counts()
+        model, fk_name = CONTENT_TYPES[content_type]
+        content = model(pk=pk)
+
+        lookup = {
+            f'{fk_name}_id': pk,
+            'session_key': session_key,
+            'reaction_type': reaction_type,
+        }
+        counter = Reaction.counter_field(reaction_type)
+        # Share pages are cached whole, so a toggle has to drop the cached copy
+        fields = counter_fields()
+        if content_type in page_cache.SHARE_KINDS:
+            fields.append('share_slug')
+
+        with transaction.atomic():
+            # Lock the content row so concurrent toggles on it are serialized,
+            # and read the counters we will return in the same round trip.
+            reaction_counts = (
+                model.objects.select_for_update()
+                .filter(pk=pk, is_approved=True)
+                .values(*fields)
+                .first()
+            )
+            if reaction_counts is None:
+                raise Http404
+            share_slug = reaction_counts.get('share_slug')
+
+            # Toggle: delete the reaction if it exists, otherwise insert it.
+            # The unique constraints make a racing duplicate insert fail
+            # cleanly instead of double counting.
+            deleted, _ = Reaction.objects.filter(**lookup).delete()
+            if deleted:
+                is_active = False
+                delta = -1
+            else:
+                is_active = True
+                try:
+                    with transaction.atomic():
+                        Reaction.objects.create(**lookup)
+                    delta = 1
+                except IntegrityError:
+                    # A concurrent request already added it; nothing to count
+                    delta = 0
+
+            if delta:
+                model.objects.filter(pk=pk).update(**{
+                    counter: F(counter) + delta,
+                    'reaction_count': F('reaction_count') + delta,
+                    'reaction_version': F('reaction_version') + 1,
+                    'reacted_at': timezone.now(),
+                })
+                reaction_counts[counter] += delta
+                reaction_counts['reaction_count'] += delta
+            else:
+                reaction_counts = model.objects.values(*counter_fields()).get(pk=pk)
+
+        if delta and share_slug:
+            page_cache.invalidate(content_type, share_slug)
+
+        reaction_counts = {
+            code: reaction_counts[Reaction.counter_field(code)]
+            for code, _ in Reaction.REACTION_TYPES
+        }
 
         # Return updated reaction button (HTMX partial)
         if request.htmx:
@@ -368,18 +364,17 @@ class ReportView(View):
     """Handle content reporting."""
 
     def post(self, request, content_type, pk):
-        if content_type == 'rant':
-            content = get_object_or_404(Rant, pk=pk)
-        elif content_type == 'sidebyside':
-            content = get_object_or_404(SideBySide, pk=pk)
-        elif content_type == 'ghosting':
-            content = get_object_or_404(GhostingStory, pk=pk)
-        else:
+        if content_type not in CONTENT_TYPES:
             return HttpResponse(status=400)
+        model, _ = CONTENT_TYPES[content_type]
 
-        content.is_reported = True
-        content.report_count += 1
-        content.save()
+        # Single conditional UPDATE that only touches the report columns
+        updated = model.objects.filter(pk=pk).update(
+            is_reported=True,
+            report_count=F('report_count') + 1,
+        )
+        if not updated:
+            raise Http404
 
         if request.htmx:
             return HttpResponse('<span class="text-gray-400">Reported</span>')
@@ -388,26 +383,74 @@ class ReportView(View):
         return redirect(request.META.get('HTTP_REFERER', '/'))
 
 
-class HallOfFameView(ListView):
-    """Top rants of all time."""
-    model = Rant
+class HallOfFameView(CursorPaginationMixin, ListView):
+    """Top content this week, this month and of all time."""
+    model = LeaderboardEntry
     template_name = 'rants/hall_of_fame.html'
-    context_object_name = 'rants'
+    context_object_name = 'entries'
     paginate_by = 20
 
+    def get_window(self):
+        window = self.request.GET.get('window', 'all')
+        return window if window in dict(LeaderboardEntry.WINDOW_CHOICES) else 'all'
+
+    def get_kind(self):
+        kind = self.request.GET.get('type', 'rant')
+        return kind if kind in dict(LeaderboardEntry.KIND_CHOICES) else 'rant'
+
     def get_queryset(self):
-        return Rant.objects.filter(is_approved=True).annotate(
-            reaction_count=Count('reactions')
-        ).order_by('-reaction_count', '-created_at')
+        # An indexed range read on (kind, window, rank); rankings are
+        # precomputed by the scheduler from reaction changes.
+        kind = self.get_kind()
+        _, fk_name = CONTENT_TYPES[kind]
+        related = [fk_name, 'rant__category'] if kind == 'rant' else [fk_name]
+        return LeaderboardEntry.objects.filter(
+            kind=kind,
+            window=self.get_window(),
+            **{f'{fk_name}__is_approved': True}
+        ).select_related(*related).order_by('rank')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        context['current_window'] = self.get_window()
+        context['current_type'] = self.get_kind()
+        context['window_choices'] = LeaderboardEntry.WINDOW_CHOICES
+        context['type_choices'] = LeaderboardEntry.KIND_CHOICES
         context['reaction_types'] = Reaction.REACTION_TYPES
         context['reaction_labels'] = Reaction.REACTION_LABELS
         return context
 
 
-class WallOfShameView(ListView):
+class SearchView(ListView):
+    """Ranked full-text search across rants, side-by-sides and ghosting stories."""
+    template_name = 'rants/search.html'
+    context_object_name = 'results'
+    max_results = 50
+
+    def get_query(self):
+        return self.request.GET.get('q', '').strip()[:200]
+
+    def get_kind(self):
+        kind = self.request.GET.get('type', '')
+        return kind if kind in CONTENT_TYPES else ''
+
+    def get_queryset(self):
+        query = self.get_query()
+        if not query:
+            return []
+        return search(query, kind=self.get_kind() or None, limit=self.max_results)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['query'] = self.get_query()
+        context['current_type'] = self.get_kind()
+        context['type_choices'] = LeaderboardEntry.KIND_CHOICES
+        context['reaction_types'] = Reaction.REACTION_TYPES
+        context['reaction_labels'] = Reaction.REACTION_LABELS
+        return context
+
+
+class WallOfShameView(CursorPaginationMixin, ListView):
     """Wall of Shame - ghosting recruiters."""
     model = GhostingStory
     template_name = 'rants/wall_of_shame.html'
@@ -417,10 +460,15 @@ class WallOfShameView(ListView):
     def get_queryset(self):
         queryset = GhostingStory.objects.filter(is_approved=True)
 
-        # Filter by company
+        # Filter by company: a known company matches all its spellings,
+        # anything else falls back to a substring match
         company = self.request.GET.get('company')
         if company:
-            queryset = queryset.filter(company__icontains=company)
+            canonical = Company.objects.filter(slug=canonical_slug(company)).first()
+            if canonical:
+                queryset = queryset.filter(canonical_company=canonical)
+            else:
+                queryset = queryset.filter(company__icontains=company)
 
         # Filter by stage
         stage = self.request.GET.get('stage')
@@ -430,9 +478,7 @@ class WallOfShameView(ListView):
         # Sorting
         sort = self.request.GET.get('sort', 'recent')
         if sort == 'reactions':
-            queryset = queryset.annotate(
-                reaction_count=Count('reactions')
-            ).order_by('-reaction_count', '-created_at')
+            queryset = queryset.order_by('-reaction_count', '-created_at')
         elif sort == 'featured':
             queryset = queryset.filter(is_featured=True).order_by('-created_at')
         else:  # recent
@@ -451,6 +497,33 @@ class WallOfShameView(ListView):
         return context
 
 
+class CompanySuggestionsView(View):
+    """HTMX autocomplete for the Wall of Shame company filter, served from memory."""
+
+    def get(self, request):
+        return render(request, 'rants/partials/company_suggestions.html', {
+            'suggestions': company_index.lookup(request.GET.get('company', '')[:100]),
+            'current_stage': request.GET.get('stage', ''),
+            'current_sort': request.GET.get('sort', ''),
+        })
+
+
+class WorstOffendersView(CursorPaginationMixin, ListView):
+    """Companies with the most ghosting stories, read from their precomputed counters."""
+    model = Company
+    template_name = 'rants/worst_offenders.html'
+    context_object_name = 'companies'
+    paginate_by = 25
+
+    def get_queryset(self):
+        return Company.objects.filter(story_count__gt=0).order_by('-story_count')
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['stage_choices'] = GhostingStory.STAGE_CHOICES
+        return context
+
+
 class GhostingStoryDetailView(DetailView):
     """Detail view for a ghosting story."""
     model = GhostingStory
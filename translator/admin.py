@@ -1,5 +1,9 @@
 from django.contrib import admin
-from .models import Translation
+from django.template.response import TemplateResponse
+from django.urls import path
+from .cache import translation_cache
+from .models import Translation, CachedTranslation, TranslationJob
+from .providers import provider_stats
 
 
 @admin.register(Translation)
@@ -9,3 +13,49 @@ class TranslationAdmin(admin.ModelAdmin):
     search_fields = ['original_text', 'translated_text', 'share_slug']
     readonly_fields = ['id', 'share_slug', 'created_at']
     date_hierarchy = 'created_at'
+    change_list_template = 'admin/translator/translation/change_list.html'
+
+    def get_urls(self):
+        return [
+            path('providers/', self.admin_site.admin_view(self.provider_stats_view),
+                 name='translator_provider_stats'),
+        ] + super().get_urls()
+
+    def provider_stats_view(self, request):
+        """Live routing stats of the worker serving this page."""
+        return TemplateResponse(request, 'admin/translator/provider_stats.html', {
+            **self.admin_site.each_context(request),
+            'title': 'Translation provider health',
+            'opts': self.model._meta,
+            'providers': provider_stats(),
+        })
+
+
+@admin.register(CachedTranslation)
+class CachedTranslationAdmin(admin.ModelAdmin):
+    list_display = ['key', 'mode', 'provider_name', 'prompt_version', 'created_at']
+    list_filter = ['mode', 'provider_name', 'prompt_version']
+    search_fields = ['key', 'translated_text']
+    readonly_fields = ['key', 'mode', 'prompt_version', 'provider_name', 'model', 'created_at']
+
+    def changelist_view(self, request, extra_context=None):
+        # Counters are per worker and reset on restart
+        stats = translation_cache.stats
+        extra_context = {
+            'title': (
+                f"Cached translations (this worker: {stats['memory_hits']} memory hits, "
+                f"{stats['db_hits']} database hits, {stats['misses']} misses, "
+                f"{translation_cache.hit_rate():.0%} hit rate)"
+            ),
+            **(extra_context or {}),
+        }
+        return super().changelist_view(request, extra_context=extra_context)
+
+
+@admin.register(TranslationJob)
+class TranslationJobAdmin(admin.ModelAdmin):
+    list_display = ['id', 'mode', 'status', 'provider_name', 'attempts', 'created_at', 'finished_at']
+    list_filter = ['status', 'mode', 'created_at']
+    search_fields = ['id', 'text', 'error']
+    readonly_fields = ['id', 'translation', 'provider_name', 'error', 'attempts', 'created_at', 'started_at', 'finished_at']
+    date_hierarchy = 'created_at'
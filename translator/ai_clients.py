@@ -1,7 +1,18 @@
-"""AI client functions for each translation provider."""
+"""
+AI client functions for each translation provider.
 
-import os
-from dotenv import load_dotenv
+Everything runs on the providers' async SDK clients; sync callers go
+through services.translate(), which runs these on its own event loop.
+"""
+
+import asyncio
+import logging
+import weakref
+from typing import Optional
+
+from .providers import registry
+
+logger = logging.getLogger(__name__)
 
 # System prompts for translation modes
 SYSTEM_PROMPTS = {
@@ -30,82 +41,206 @@ Return ONLY the LinkedIn version, no explanations or preamble.""",
 Return ONLY the reality translation, no explanations or preamble."""
 }
 
+# Retries and timeouts are handled per translation (see deadlines.py), so
+# the SDKs' own retries are turned off.
 
-def translate_anthropic(text: str, mode: str) -> str:
-    """Translate using Anthropic Claude."""
+def _anthropic_async_client(api_key):
     import anthropic
+    return anthropic.AsyncAnthropic(api_key=api_key, max_retries=0)
 
-    load_dotenv(override=True)
-    client = anthropic.Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
 
-    message = client.messages.create(
-        model="claude-3-5-haiku-20241022",
-        max_tokens=512,
-        system=SYSTEM_PROMPTS[mode],
-        messages=[{"role": "user", "content": text}]
-    )
+def _openai_async_client(api_key):
+    import openai
+    return openai.AsyncOpenAI(api_key=api_key, max_retries=0)
 
-    return message.content[0].text.strip()
 
+def _google_async_client(api_key):
+    from google import genai
+    return genai.Client(api_key=api_key).aio
 
-def translate_openai(text: str, mode: str) -> str:
-    """Translate using OpenAI GPT-4."""
-    import openai
 
-    load_dotenv(override=True)
-    client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+def _groq_async_client(api_key):
+    from groq import AsyncGroq
+    return AsyncGroq(api_key=api_key, max_retries=0)
 
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[
+
+ASYNC_CLIENT_FACTORIES = {
+    'anthropic': _anthropic_async_client,
+    'openai': _openai_async_client,
+    'google': _google_async_client,
+    'groq': _groq_async_client,
+}
+
+# event loop -> {name: (registry generation, client)}. SDK clients keep
+# their HTTP connection pool but are tied to the loop they first ran on:
+# under ASGI that is the worker's one loop, and sync callers share the
+# services translator loop. Clients of a loop that goes away go with it.
+_async_clients = weakref.WeakKeyDictionary()
+
+
+# Close tasks for replaced clients, kept so they aren't collected mid-close
+_closing = set()
+
+
+async def _aclose_client(name, client):
+    # The google .aio client exposes aclose(); the other SDKs use close()
+    close = getattr(client, 'aclose', None) or getattr(client, 'close', None)
+    try:
+        if close is not None:
+            await close()
+    except Exception:
+        logger.warning("Closing the replaced %s client failed", name, exc_info=True)
+
+
+def get_async_client(name: str):
+    """The running event loop's long-lived async SDK client for a provider."""
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    cached = clients.get(name)
+    if cached is None or cached[0] != registry.generation:
+        replaced = cached
+        cached = clients[name] = (
+            registry.generation, ASYNC_CLIENT_FACTORIES[name](registry.api_key(name))
+        )
+        if replaced is not None:
+            # A reload rotated the key or model; release the old client's
+            # connection pool on this loop, which it belongs to
+            task = asyncio.ensure_future(_aclose_client(name, replaced[1]))
+            _closing.add(task)
+            task.add_done_callback(_closing.discard)
+    return cached[1]
+
+
+async def awarm_up():
+    """
+    Build every enabled provider's client on the running event loop (under
+    ASGI, the one the views run on) and open its connection with a cheap
+    model listing, so the first translation skips the TLS handshake.
+    Failures are logged; the provider is still tried on demand.
+    """
+    for name, provider in registry.enabled():
+        try:
+            await get_async_client(name).models.list()
+        except Exception:
+            logger.warning("Warm-up failed for %s", provider.name, exc_info=True)
+
+
+# Request parameters per provider, shared by the one-shot and streaming calls
+MAX_TOKENS = 512
+OPENAI_MODEL = "gpt-4o-mini"
+GROQ_MODEL = "llama-3.3-70b-versatile"
+
+
+def _anthropic_params(text: str, mode: str, timeout: Optional[float]) -> dict:
+    return {
+        'model': "claude-3-5-haiku-20241022",
+        'max_tokens': MAX_TOKENS,
+        'system': SYSTEM_PROMPTS[mode],
+        'messages': [{"role": "user", "content": text}],
+        'timeout': timeout,
+    }
+
+
+def _chat_params(model: str, text: str, mode: str, timeout: Optional[float]) -> dict:
+    """An OpenAI-style chat completion (OpenAI and Groq)."""
+    return {
+        'model': model,
+        'messages': [
             {"role": "system", "content": SYSTEM_PROMPTS[mode]},
             {"role": "user", "content": text}
         ],
-        max_tokens=512
-    )
+        'max_tokens': MAX_TOKENS,
+        'timeout': timeout,
+    }
 
-    return response.choices[0].message.content.strip()
 
+def _google_params(text: str, mode: str, timeout: Optional[float]) -> dict:
+    config = None
+    if timeout is not None:
+        from google.genai import types
+
+        # The Gemini SDK takes its timeout in milliseconds
+        config = types.GenerateContentConfig(http_options=types.HttpOptions(timeout=int(timeout * 1000)))
+    return {
+        'model': 'gemini-2.0-flash',
+        'contents': f"{SYSTEM_PROMPTS[mode]}\n\nText to translate:\n{text}",
+        'config': config,
+    }
 
-def translate_google(text: str, mode: str) -> str:
-    """Translate using Google Gemini."""
-    from google import genai
 
-    load_dotenv(override=True)
-    client = genai.Client(api_key=os.getenv('GOOGLE_API_KEY'))
+async def atranslate_anthropic(text: str, mode: str, timeout: Optional[float] = None) -> str:
+    """Translate using Anthropic Claude."""
+    message = await get_async_client('anthropic').messages.create(**_anthropic_params(text, mode, timeout))
+    return message.content[0].text.strip()
+
+
+async def _chat_completion(client, model: str, text: str, mode: str, timeout: Optional[float]) -> str:
+    response = await client.chat.completions.create(**_chat_params(model, text, mode, timeout))
+    return response.choices[0].message.content.strip()
 
-    prompt = f"{SYSTEM_PROMPTS[mode]}\n\nText to translate:\n{text}"
-    response = client.models.generate_content(
-        model='gemini-2.0-flash',
-        contents=prompt
-    )
 
+async def atranslate_openai(text: str, mode: str, timeout: Optional[float] = None) -> str:
+    """Translate using OpenAI GPT-4."""
+    return await _chat_completion(get_async_client('openai'), OPENAI_MODEL, text, mode, timeout)
+
+
+async def atranslate_google(text: str, mode: str, timeout: Optional[float] = None) -> str:
+    """Translate using Google Gemini."""
+    response = await get_async_client('google').models.generate_content(**_google_params(text, mode, timeout))
     return response.text.strip()
 
 
-def translate_groq(text: str, mode: str) -> str:
+async def atranslate_groq(text: str, mode: str, timeout: Optional[float] = None) -> str:
     """Translate using Groq (Llama)."""
-    from groq import Groq
+    return await _chat_completion(get_async_client('groq'), GROQ_MODEL, text, mode, timeout)
 
-    load_dotenv(override=True)
-    client = Groq(api_key=os.getenv('GROQ_API_KEY'))
 
-    response = client.chat.completions.create(
-        model="llama-3.3-70b-versatile",
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPTS[mode]},
-            {"role": "user", "content": text}
-        ],
-        max_tokens=512
-    )
+# Map provider names to translation functions
+ATRANSLATE_FUNCTIONS = {
+    'anthropic': atranslate_anthropic,
+    'openai': atranslate_openai,
+    'google': atranslate_google,
+    'groq': atranslate_groq,
+}
 
-    return response.choices[0].message.content.strip()
 
+async def astream_anthropic(text: str, mode: str, timeout: Optional[float] = None):
+    """Stream a translation from Anthropic Claude, chunk by chunk."""
+    async with get_async_client('anthropic').messages.stream(**_anthropic_params(text, mode, timeout)) as stream:
+        async for chunk in stream.text_stream:
+            yield chunk
 
-# Map provider names to translation functions
-TRANSLATE_FUNCTIONS = {
-    'anthropic': translate_anthropic,
-    'openai': translate_openai,
-    'google': translate_google,
-    'groq': translate_groq,
+
+async def _astream_chat_completion(client, model: str, text: str, mode: str, timeout: Optional[float]):
+    """Chunks of an OpenAI-style streamed chat completion (OpenAI and Groq)."""
+    stream = await client.chat.completions.create(stream=True, **_chat_params(model, text, mode, timeout))
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+
+async def astream_openai(text: str, mode: str, timeout: Optional[float] = None):
+    """Stream a translation from OpenAI GPT-4, chunk by chunk."""
+    async for chunk in _astream_chat_completion(get_async_client('openai'), OPENAI_MODEL, text, mode, timeout):
+        yield chunk
+
+
+async def astream_google(text: str, mode: str, timeout: Optional[float] = None):
+    """Stream a translation from Google Gemini, chunk by chunk."""
+    stream = await get_async_client('google').models.generate_content_stream(**_google_params(text, mode, timeout))
+    async for chunk in stream:
+        if chunk.text:
+            yield chunk.text
+
+
+async def astream_groq(text: str, mode: str, timeout: Optional[float] = None):
+    """Stream a translation from Groq (Llama), chunk by chunk."""
+    async for chunk in _astream_chat_completion(get_async_client('groq'), GROQ_MODEL, text, mode, timeout):
+        yield chunk
+
+
+ASTREAM_FUNCTIONS = {
+    'anthropic': astream_anthropic,
+    'openai': astream_openai,
+    'google': astream_google,
+    'groq': astream_groq,
 }
@@ -0,0 +1,158 @@
+"""
+Exact-match cache for translation results.
+
+The same viral posts get pasted over and over, so results are cached by a
+hash of the normalized text, the mode and the prompt version (a hash of
+the system prompt, so editing a prompt retires its old results). Lookups
+go through a bounded in-process LRU first and the CachedTranslation table
+second; neither touches a provider. Entries older than
+TRANSLATION_CACHE_TTL seconds are ignored, and a TTL of 0 turns the cache
+off.
+
+Hit and miss counts are kept per worker and shown in the admin.
+"""
+
+import hashlib
+import logging
+import threading
+import unicodedata
+from collections import Counter, OrderedDict
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from .ai_clients import SYSTEM_PROMPTS
+from .models import CachedTranslation
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(text):
+    """Unicode-normalize and collapse whitespace within lines, keeping line breaks."""
+    text = unicodedata.normalize('NFC', text)
+    lines = [' '.join(line.split()) for line in text.strip().splitlines()]
+    return '\n'.join(lines)
+
+
+def prompt_version(mode):
+    return hashlib.sha256(SYSTEM_PROMPTS[mode].encode()).hexdigest()[:12]
+
+
+def cache_key(text, mode):
+    raw = f"{mode}\0{prompt_version(mode)}\0{normalize_text(text)}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class TranslationCache:
+    """LRU of recent results in front of the CachedTranslation table."""
+
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (stored_at, result)
+        self._lock = threading.Lock()
+        self.stats = Counter()
+
+    @property
+    def enabled(self):
+        return self.ttl > 0
+
+    async def aget(self, text, mode):
+        """The cached result dict for this input, or None."""
+        if not self.enabled:
+            return None
+        key = cache_key(text, mode)
+        result = self._memory_get(key)
+        if result is not None:
+            return result
+        return self._db_result(key, await self._db_lookup(key).afirst())
+
+    async def aput(self, text, mode, result):
+        """Store a fresh provider result in both tiers."""
+        if not self.enabled:
+            return
+        key = cache_key(text, mode)
+        try:
+            row, _ = await CachedTranslation.objects.aupdate_or_create(
+                key=key, defaults=self._row_fields(mode, result)
+            )
+        except Exception:
+            # A cache write must never fail a translation that succeeded
+            logger.exception("Could not store cached translation %s", key)
+            return
+        self._remember(key, row.created_at, result)
+
+    def _memory_get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, result = entry
+                if timezone.now() - stored_at < timedelta(seconds=self.ttl):
+                    self._entries.move_to_end(key)
+                    self.stats['memory_hits'] += 1
+                    return dict(result)
+                del self._entries[key]
+        return None
+
+    def _db_lookup(self, key):
+        return (
+            CachedTranslation.objects
+            .filter(key=key, created_at__gt=timezone.now() - timedelta(seconds=self.ttl))
+            .values('translated_text', 'provider_name', 'model', 'created_at')
+        )
+
+    def _db_result(self, key, row):
+        if row is None:
+            self.stats['misses'] += 1
+            return None
+
+        result = {
+            'translation': row['translated_text'],
+            'provider_name': row['provider_name'],
+            'model': row['model'],
+        }
+        self._remember(key, row['created_at'], result)
+        self.stats['db_hits'] += 1
+        return dict(result)
+
+    @staticmethod
+    def _row_fields(mode, result):
+        return {
+            'mode': mode,
+            'prompt_version': prompt_version(mode),
+            'translated_text': result['translation'],
+            'provider_name': result['provider_name'],
+            'model': result['model'],
+            'created_at': timezone.now(),
+        }
+
+    def _remember(self, key, stored_at, result):
+        result = {field: result[field] for field in ('translation', 'provider_name', 'model')}
+        with self._lock:
+            self._entries[key] = (stored_at, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def hit_rate(self):
+        hits = self.stats['memory_hits'] + self.stats['db_hits']
+        total = hits + self.stats['misses']
+        return hits / total if total else 0.0
+
+
+def prune_expired():
+    """Delete rows older than the TTL. Returns the number deleted."""
+    cutoff = timezone.now() - timedelta(seconds=translation_cache.ttl)
+    deleted, _ = CachedTranslation.objects.filter(created_at__lte=cutoff).delete()
+    return deleted
+
+
+translation_cache = TranslationCache(
+    max_size=getattr(settings, 'TRANSLATION_CACHE_SIZE', 1000),
+    ttl=getattr(settings, 'TRANSLATION_CACHE_TTL', 7 * 24 * 3600),
+)
@@ -0,0 +1,93 @@
+"""
+Time budgets and retry policy for provider calls.
+
+A translation gets TRANSLATOR_DEADLINE seconds end to end. Every provider
+attempt is given what is left of it (capped at TRANSLATOR_ATTEMPT_TIMEOUT)
+as its SDK timeout, so a hanging provider can never hold a worker past the
+deadline. The SDKs' own retries are switched off (see ai_clients) and
+transient errors are retried here instead: up to TRANSLATOR_RETRIES times
+per provider, with full-jitter exponential backoff, waiting as long as a
+Retry-After header asks when it fits in the budget.
+"""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from django.conf import settings
+
+DEADLINE = getattr(settings, 'TRANSLATOR_DEADLINE', 25)
+ATTEMPT_TIMEOUT = getattr(settings, 'TRANSLATOR_ATTEMPT_TIMEOUT', 10)
+RETRIES = getattr(settings, 'TRANSLATOR_RETRIES', 1)
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 4.0
+
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+class DeadlineExceeded(Exception):
+    """The translation ran out of time."""
+
+
+class Deadline:
+    """A point in time a translation must finish by."""
+
+    def __init__(self, seconds: float = DEADLINE):
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def attempt_timeout(self) -> float:
+        """Timeout for the next provider call."""
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded("Translation deadline exceeded")
+        return min(remaining, ATTEMPT_TIMEOUT)
+
+
+def status_code(exc: Exception) -> Optional[int]:
+    # status_code on the Anthropic/OpenAI/Groq SDK errors, code on Google's
+    code = getattr(exc, 'status_code', None) or getattr(exc, 'code', None)
+    return code if isinstance(code, int) else None
+
+
+def is_retryable(exc: Exception) -> bool:
+    """Rate limits, overload, server errors, timeouts and dropped connections."""
+    code = status_code(exc)
+    if code is not None:
+        return code in RETRYABLE_STATUS
+    name = type(exc).__name__
+    return isinstance(exc, (TimeoutError, ConnectionError)) or 'Timeout' in name or 'Connection' in name
+
+
+def retry_after(exc: Exception) -> Optional[float]:
+    """Seconds the provider asked us to wait, from a Retry-After header."""
+    response = getattr(exc, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+    value = headers.get('retry-after')
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, exc: Exception) -> float:
+    """How long to wait before retry number `attempt` (0-based)."""
+    requested = retry_after(exc)
+    if requested is not None:
+        return requested
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
@@ -0,0 +1,159 @@
+"""
+Durable background translations.
+
+With TRANSLATOR_JOB_MODE on, the translator views only insert a
+TranslationJob and return its ID; `manage.py run_translation_jobs`
+workers claim queued jobs, call the providers and store the result, and
+clients poll the job. Bursts then wait in the table instead of tying up
+web workers.
+
+Claiming is safe with any number of workers. On PostgreSQL a worker locks
+the oldest queued row with SELECT ... FOR UPDATE SKIP LOCKED, so workers
+never wait on each other. SQLite has no row locks; there a worker picks a
+candidate and claims it with a conditional UPDATE that only succeeds while
+the row is still queued, trying the next candidate if another worker won.
+
+A job left running by a worker that died is put back in the queue after
+TRANSLATOR_JOB_STALE_AFTER seconds, up to MAX_ATTEMPTS times. Every claim
+gets a new claim_token and the outcome is only recorded while the job
+still carries it, so a slow worker whose job was requeued and claimed
+again can't finish it a second time. Finished jobs are deleted after
+TRANSLATOR_JOB_RETENTION_DAYS.
+"""
+
+import logging
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Translation, TranslationJob
+from .services import translate
+
+logger = logging.getLogger(__name__)
+
+STALE_AFTER = getattr(settings, 'TRANSLATOR_JOB_STALE_AFTER', 120)
+RETENTION_DAYS = getattr(settings, 'TRANSLATOR_JOB_RETENTION_DAYS', 7)
+MAX_ATTEMPTS = 3
+# Candidates a SQLite worker tries per claim before giving up for this round
+CLAIM_CANDIDATES = 5
+
+
+def enqueue(text, mode):
+    return TranslationJob.objects.create(text=text, mode=mode)
+
+
+async def aenqueue(text, mode):
+    return await TranslationJob.objects.acreate(text=text, mode=mode)
+
+
+def queued():
+    return TranslationJob.objects.filter(status=TranslationJob.STATUS_QUEUED).order_by('created_at')
+
+
+def claim_next():
+    """Mark the oldest queued job as running and return it, or None if the queue is empty."""
+    if connection.features.has_select_for_update_skip_locked:
+        return _claim_skip_locked()
+    return _claim_conditional_update()
+
+
+def _claim_skip_locked():
+    with transaction.atomic():
+        job = queued().select_for_update(skip_locked=True).first()
+        if job is None:
+            return None
+        job.status = TranslationJob.STATUS_RUNNING
+        job.started_at = timezone.now()
+        job.attempts += 1
+        job.claim_token = uuid.uuid4()
+        job.save(update_fields=['status', 'started_at', 'attempts', 'claim_token'])
+    return job
+
+
+def _claim_conditional_update():
+    for pk in queued().values_list('pk', flat=True)[:CLAIM_CANDIDATES]:
+        token = uuid.uuid4()
+        claimed = TranslationJob.objects.filter(pk=pk, status=TranslationJob.STATUS_QUEUED).update(
+            status=TranslationJob.STATUS_RUNNING,
+            started_at=timezone.now(),
+            attempts=F('attempts') + 1,
+            claim_token=token,
+        )
+        if claimed:
+            return TranslationJob.objects.get(pk=pk, claim_token=token)
+    return None
+
+
+class LostClaim(Exception):
+    """The job was requeued (and maybe claimed again) since this worker claimed it."""
+
+
+def run_job(job):
+    """
+    Translate a claimed job and record the outcome. Returns the job, or
+    None if this worker lost its claim in the meantime.
+    """
+    try:
+        result = translate(job.text, job.mode)
+    except Exception as e:
+        logger.warning("Translation job %s failed: %s", job.pk, e)
+        fields = {'status': TranslationJob.STATUS_FAILED, 'error': str(e)}
+        result = None
+    else:
+        fields = {'status': TranslationJob.STATUS_DONE, 'provider_name': result['provider_name']}
+    fields['finished_at'] = timezone.now()
+
+    try:
+        with transaction.atomic():
+            if result is not None:
+                fields['translation'] = Translation.objects.create(
+                    original_text=job.text,
+                    translated_text=result['translation'],
+                    mode=job.mode,
+                )
+            # Only the current claim may finish the job; rolling back
+            # keeps a lost claim from leaving an orphan Translation
+            if not TranslationJob.objects.filter(
+                pk=job.pk, status=TranslationJob.STATUS_RUNNING, claim_token=job.claim_token,
+            ).update(**fields):
+                raise LostClaim
+    except LostClaim:
+        logger.warning("Translation job %s is no longer claimed by this worker; dropping result", job.pk)
+        return None
+
+    for name, value in fields.items():
+        setattr(job, name, value)
+    return job
+
+
+def requeue_stale():
+    """Put jobs abandoned by dead workers back in the queue. Returns (requeued, failed)."""
+    cutoff = timezone.now() - timedelta(seconds=STALE_AFTER)
+    stale = TranslationJob.objects.filter(status=TranslationJob.STATUS_RUNNING, started_at__lt=cutoff)
+    failed = stale.filter(attempts__gte=MAX_ATTEMPTS).update(
+        status=TranslationJob.STATUS_FAILED,
+        error="Translation worker stopped responding",
+        finished_at=timezone.now(),
+    )
+    requeued = stale.update(status=TranslationJob.STATUS_QUEUED, started_at=None, claim_token=None)
+    return requeued, failed
+
+
+def prune_finished(retention_days=RETENTION_DAYS, chunk_size=1000):
+    """Delete done and failed jobs older than `retention_days` in chunks. Returns the number deleted."""
+    cutoff = timezone.now() - timedelta(days=retention_days)
+    old = TranslationJob.objects.filter(
+        status__in=[TranslationJob.STATUS_DONE, TranslationJob.STATUS_FAILED],
+        finished_at__lt=cutoff,
+    )
+    total = 0
+    while True:
+        ids = list(old.order_by('finished_at').values_list('pk', flat=True)[:chunk_size])
+        if not ids:
+            return total
+        TranslationJob.objects.filter(pk__in=ids).delete()
+        total += len(ids)
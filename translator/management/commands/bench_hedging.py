@@ -0,0 +1,96 @@
+import asyncio
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+
+from translator.deadlines import Deadline
+from translator.providers import AIProvider
+from translator.services import atranslate_hedged, atranslate_sequential, run_sync
+
+
+class MockProvider:
+    """
+    Sleeps for a log-normal latency, with a slow tail: `slow_rate` of calls
+    take `slow_factor` times longer, like a provider having a bad minute.
+    """
+
+    def __init__(self, seed, median, slow_rate, slow_factor, error_rate):
+        self.rng = random.Random(seed)
+        self.median = median
+        self.slow_rate = slow_rate
+        self.slow_factor = slow_factor
+        self.error_rate = error_rate
+
+    async def __call__(self, text, mode, timeout=None):
+        latency = self.median * self.rng.lognormvariate(0, 0.3)
+        if self.rng.random() < self.slow_rate:
+            latency *= self.slow_factor
+        fails = self.rng.random() < self.error_rate
+        if timeout is not None and latency > timeout:
+            await asyncio.sleep(timeout)
+            raise TimeoutError("mock provider timed out")
+        await asyncio.sleep(latency)
+        if fails:
+            raise RuntimeError("mock provider error")
+        return text
+
+
+def percentile(samples, p):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+class Command(BaseCommand):
+    help = "Benchmark sequential fallback against hedged requests using mock providers."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help='Translations per mode (default: 200)')
+        parser.add_argument('--median', type=float, default=0.05, help='Median provider latency in seconds (default: 0.05)')
+        parser.add_argument('--slow-rate', type=float, default=0.05, help='Share of slow calls (default: 0.05)')
+        parser.add_argument('--slow-factor', type=float, default=10, help='Slow call multiplier (default: 10)')
+        parser.add_argument('--error-rate', type=float, default=0.02, help='Share of failing calls (default: 0.02)')
+        parser.add_argument('--delay', type=float, default=None,
+                            help='Hedge delay in seconds (default: measured p90 of the sequential run)')
+
+    def handle(self, *args, **options):
+        names = ['mock-a', 'mock-b', 'mock-c']
+        providers = [(name, AIProvider(name=name, model='mock', api_key_env='')) for name in names]
+
+        def functions(seed):
+            return {
+                name: MockProvider(seed + i, options['median'], options['slow_rate'],
+                                   options['slow_factor'], options['error_rate'])
+                for i, name in enumerate(names)
+            }
+
+        sequential = self._run(
+            lambda fns: atranslate_sequential('text', 'to_reality', providers, Deadline(), functions=fns),
+            functions(0), options['requests'],
+        )
+        delay = options['delay'] if options['delay'] is not None else percentile(sequential, 0.9)
+        hedged = self._run(
+            lambda fns: atranslate_hedged('text', 'to_reality', providers, delay, Deadline(), functions=fns),
+            functions(0), options['requests'],
+        )
+
+        self.stdout.write(f"{options['requests']} translations per mode, hedge delay {delay * 1000:.0f} ms\n")
+        self.stdout.write(f"{'':<12} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8} {'mean':>8}")
+        for label, samples in (('sequential', sequential), ('hedged', hedged)):
+            self.stdout.write(
+                f"{label:<12} "
+                + " ".join(f"{percentile(samples, p) * 1000:>6.0f}ms" for p in (0.5, 0.9, 0.99, 1.0))
+                + f" {statistics.mean(samples) * 1000:>6.0f}ms"
+            )
+
+    def _run(self, call, functions, count):
+        samples = []
+        for _ in range(count):
+            start = time.perf_counter()
+            try:
+                run_sync(call(functions))
+            except Exception:
+                pass
+            samples.append(time.perf_counter() - start)
+        return samples
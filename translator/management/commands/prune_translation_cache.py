@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from translator.cache import prune_expired
+
+
+class Command(BaseCommand):
+    help = "Delete cached translations older than TRANSLATION_CACHE_TTL."
+
+    def handle(self, *args, **options):
+        deleted = prune_expired()
+        self.stdout.write(self.style.SUCCESS(f"Pruned {deleted} cached translation(s)."))
@@ -0,0 +1,54 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from translator.jobs import RETENTION_DAYS, claim_next, prune_finished, requeue_stale, run_job
+
+
+class Command(BaseCommand):
+    help = (
+        "Work through queued translation jobs (TRANSLATOR_JOB_MODE). Run as many "
+        "of these processes as you need; each job is claimed by exactly one."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--poll-interval', type=float, default=settings.TRANSLATOR_JOB_POLL_INTERVAL,
+            help='Seconds to wait when the queue is empty',
+        )
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Exit when the queue is empty instead of waiting for more jobs',
+        )
+
+    def handle(self, *args, **options):
+        processed = 0
+        next_stale_check = 0.0
+        while True:
+            if time.monotonic() >= next_stale_check:
+                requeued, failed = requeue_stale()
+                if requeued or failed:
+                    self.stdout.write(f"Requeued {requeued} stale job(s), gave up on {failed}")
+                if RETENTION_DAYS > 0:
+                    pruned = prune_finished()
+                    if pruned:
+                        self.stdout.write(f"Deleted {pruned} finished job(s)")
+                next_stale_check = time.monotonic() + 60
+
+            job = claim_next()
+            if job is not None:
+                pk = job.pk
+                job = run_job(job)
+                processed += 1
+                self.stdout.write(f"{job.status if job else 'lost':<7} {pk}")
+                continue
+
+            if options['once']:
+                break
+            # Don't hold a DB connection open while idle
+            connection.close()
+            time.sleep(options['poll_interval'])
+
+        self.stdout.write(self.style.SUCCESS(f"Processed {processed} translation job(s)."))
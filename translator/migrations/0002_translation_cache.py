@@ -0,0 +1,51 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("translator", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CachedTranslation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.CharField(max_length=64, unique=True)),
+                (
+                    "mode",
+                    models.CharField(
+                        choices=[
+                            ("to_linkedin", "Make it LinkedIn"),
+                            ("to_reality", "Make it Real"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("prompt_version", models.CharField(max_length=12)),
+                ("translated_text", models.TextField()),
+                ("provider_name", models.CharField(max_length=50)),
+                ("model", models.CharField(max_length=100)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["created_at"], name="cached_translation_age_idx"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("translator", "0003_translation_jobs"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="translationjob",
+            name="claim_token",
+            field=models.UUIDField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="translationjob",
+            index=models.Index(
+                condition=models.Q(("status__in", ["done", "failed"])),
+                fields=["finished_at"],
+                name="translation_job_finished_idx",
+            ),
+        ),
+    ]
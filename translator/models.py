@@ -34,3 +34,87 @@ class Translation(models.Model):
             import secrets
             self.share_slug = secrets.token_urlsafe(8)[:12]
         super().save(*args, **kwargs)
+
+
+class CachedTranslation(models.Model):
+    """
+    Persistent tier of the translation cache (see translator/cache.py).
+
+    Keyed on a hash of the normalized input, mode and prompt version, so
+    editing a system prompt leaves old results behind instead of serving them.
+    """
+    key = models.CharField(max_length=64, unique=True)
+    mode = models.CharField(max_length=20, choices=Translation.MODE_CHOICES)
+    prompt_version = models.CharField(max_length=12)
+    translated_text = models.TextField()
+    provider_name = models.CharField(max_length=50)
+    model = models.CharField(max_length=100)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at'], name='cached_translation_age_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.get_mode_display()} via {self.provider_name} ({self.key[:8]})"
+
+
+class TranslationJob(models.Model):
+    """
+    A translation queued for a background worker (see translator/jobs.py).
+
+    Used when TRANSLATOR_JOB_MODE is on: the web request only enqueues,
+    and the client polls the job until it is done or failed.
+    """
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, 'Queued'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_DONE, 'Done'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    text = models.TextField()
+    mode = models.CharField(max_length=20, choices=Translation.MODE_CHOICES)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    translation = models.ForeignKey(Translation, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    provider_name = models.CharField(max_length=50, blank=True)
+    error = models.TextField(blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    # New on every claim; only the worker holding it may record the outcome
+    claim_token = models.UUIDField(null=True, blank=True, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            # Workers claim the oldest queued job; finished jobs stay out of the index
+            models.Index(
+                fields=['created_at'], name='translation_job_queue_idx',
+                condition=models.Q(status='queued'),
+            ),
+            models.Index(
+                fields=['started_at'], name='translation_job_running_idx',
+                condition=models.Q(status='running'),
+            ),
+            # Retention pruning of finished jobs
+            models.Index(
+                fields=['finished_at'], name='translation_job_finished_idx',
+                condition=models.Q(status__in=['done', 'failed']),
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.get_mode_display()} job {self.pk} ({self.status})"
+
+    @property
+    def is_finished(self):
+        return self.status in (self.STATUS_DONE, self.STATUS_FAILED)
@@ -2,8 +2,11 @@
 
 import os
 import random
+import threading
+import time
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+from django.conf import settings
 from dotenv import load_dotenv
 
 
@@ -45,6 +48,70 @@ PROVIDERS = {
 }
 
 
+class ProviderRegistry:
+    """
+    Which providers are enabled and their API keys, read once per worker.
+
+    Reading .env on every call was slow and made every SDK client
+    short-lived; call reload() to pick up changed keys or
+    TRANSLATOR_PROVIDERS. `generation` goes up on every reload so cached
+    clients (see ai_clients.get_async_client) know to rebuild.
+    """
+
+    def __init__(self):
+        self.generation = 0
+        self._enabled = None
+        self._api_keys = {}
+        self._lock = threading.Lock()
+
+    def _load(self):
+        load_dotenv(override=True)
+
+        # Get enabled providers from env, default to just anthropic
+        enabled_names = os.getenv('TRANSLATOR_PROVIDERS', 'anthropic').split(',')
+        enabled = []
+        api_keys = {}
+
+        for name in enabled_names:
+            name = name.strip().lower()
+            if name in PROVIDERS:
+                provider = PROVIDERS[name]
+                api_key = os.getenv(provider.api_key_env, '').strip()
+                if api_key:
+                    enabled.append((name, provider))
+                    api_keys[name] = api_key
+
+        self._api_keys = api_keys
+        self._enabled = enabled
+
+    def _ensure_loaded(self):
+        if self._enabled is None:
+            with self._lock:
+                if self._enabled is None:
+                    self._load()
+
+    def enabled(self) -> List[Tuple[str, AIProvider]]:
+        self._ensure_loaded()
+        return list(self._enabled)
+
+    def api_key(self, name: str) -> Optional[str]:
+        self._ensure_loaded()
+        return self._api_keys.get(name)
+
+    def api_keys(self) -> Dict[str, str]:
+        self._ensure_loaded()
+        return dict(self._api_keys)
+
+    def reload(self):
+        """Re-read .env and the environment; cached clients are rebuilt on next use."""
+        with self._lock:
+            self._load()
+            self.generation += 1
+
+
+registry = ProviderRegistry()
+
+
 def get_enabled_providers() -> List[Tuple[str, AIProvider]]:
     """
     Get list of providers that are enabled and have valid API keys.
@@ -52,26 +119,126 @@ def get_enabled_providers() -> List[Tuple[str, AIProvider]]:
     Returns:
         List of (provider_name, AIProvider) tuples
     """
-    load_dotenv(override=True)
+    return registry.enabled()
+
 
-    # Get enabled providers from env, default to just anthropic
-    enabled_names = os.getenv('TRANSLATOR_PROVIDERS', 'anthropic').split(',')
-    valid = []
+class ProviderHealth:
+    """
+    One provider's recent performance in this worker: EWMA latency and
+    error rate, plus a circuit breaker that stops routing to it for
+    BREAKER_COOLDOWN seconds after BREAKER_THRESHOLD failures in a row.
+    Once the cool-down passes the provider gets traffic again; one more
+    failure re-opens the breaker straight away.
+    """
 
-    for name in enabled_names:
-        name = name.strip().lower()
-        if name in PROVIDERS:
-            provider = PROVIDERS[name]
-            api_key = os.getenv(provider.api_key_env, '').strip()
-            if api_key:
-                valid.append((name, provider))
+    ALPHA = getattr(settings, 'TRANSLATOR_EWMA_ALPHA', 0.2)
+    BREAKER_THRESHOLD = getattr(settings, 'TRANSLATOR_BREAKER_THRESHOLD', 3)
+    BREAKER_COOLDOWN = getattr(settings, 'TRANSLATOR_BREAKER_COOLDOWN', 30)
 
-    return valid
+    def __init__(self):
+        self.latency = None      # seconds, EWMA of successful calls
+        self.error_rate = 0.0    # EWMA of 0 (success) / 1 (failure)
+        self.calls = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self._lock = threading.Lock()
+
+    def record_success(self, latency: float):
+        with self._lock:
+            self.calls += 1
+            self.consecutive_failures = 0
+            self.latency = latency if self.latency is None else (
+                self.ALPHA * latency + (1 - self.ALPHA) * self.latency
+            )
+            self.error_rate = (1 - self.ALPHA) * self.error_rate
+
+    def record_failure(self):
+        with self._lock:
+            self.calls += 1
+            self.failures += 1
+            self.consecutive_failures += 1
+            self.error_rate = self.ALPHA + (1 - self.ALPHA) * self.error_rate
+            if self.consecutive_failures >= self.BREAKER_THRESHOLD:
+                self.open_until = time.monotonic() + self.BREAKER_COOLDOWN
+
+    @property
+    def is_open(self) -> bool:
+        return time.monotonic() < self.open_until
+
+    def weight(self, base_weight: int, default_latency: float) -> float:
+        """The static weight scaled by speed and reliability."""
+        latency = self.latency if self.latency is not None else default_latency
+        return base_weight * (1 - self.error_rate) / max(latency, 0.01)
+
+
+_health: Dict[str, ProviderHealth] = {}
+_health_lock = threading.Lock()
+
+
+def get_health(name: str) -> ProviderHealth:
+    health = _health.get(name)
+    if health is None:
+        with _health_lock:
+            health = _health.setdefault(name, ProviderHealth())
+    return health
+
+
+def dynamic_weights(providers: List[Tuple[str, AIProvider]]) -> List[float]:
+    """Current routing weight of each provider; 0 while its breaker is open."""
+    health = [get_health(name) for name, _ in providers]
+    known = [h.latency for h in health if h.latency is not None]
+    # Untried providers are assumed to be average so they get a fair first go
+    default_latency = sum(known) / len(known) if known else 1.0
+    return [
+        0.0 if h.is_open else h.weight(provider.weight, default_latency)
+        for h, (_, provider) in zip(health, providers)
+    ]
+
+
+def order_providers(providers: List[Tuple[str, AIProvider]]) -> List[Tuple[str, AIProvider]]:
+    """
+    Weighted random order of the providers whose breaker is closed, so the
+    fastest healthy provider usually goes first. If every breaker is open,
+    all providers are returned in random order rather than failing outright.
+    """
+    weights = dynamic_weights(providers)
+    candidates = [(p, w) for p, w in zip(providers, weights) if w > 0]
+    if not candidates:
+        return random.sample(providers, len(providers))
+
+    ordered = []
+    while candidates:
+        index = random.choices(range(len(candidates)), weights=[w for _, w in candidates], k=1)[0]
+        ordered.append(candidates.pop(index)[0])
+    return ordered
+
+
+def provider_stats() -> List[Dict]:
+    """Live per-worker routing stats for every enabled provider (shown in the admin)."""
+    providers = get_enabled_providers()
+    weights = dynamic_weights(providers)
+    total = sum(weights) or 1
+    stats = []
+    for (name, provider), weight in zip(providers, weights):
+        health = get_health(name)
+        stats.append({
+            'name': name,
+            'display_name': provider.name,
+            'base_weight': provider.weight,
+            'share': weight / total,
+            'latency_ms': None if health.latency is None else health.latency * 1000,
+            'error_rate': health.error_rate,
+            'calls': health.calls,
+            'failures': health.failures,
+            'breaker_open': health.is_open,
+        })
+    return stats
 
 
 def select_random_provider() -> Tuple[str, AIProvider]:
     """
-    Select a random provider using weighted selection.
+    Select a random provider, weighted by static weight and live health.
 
     Returns:
         Tuple of (provider_name, AIProvider)
@@ -88,11 +255,7 @@ def select_random_provider() -> Tuple[str, AIProvider]:
     if len(providers) == 1:
         return providers[0]
 
-    names, provider_objs = zip(*providers)
-    weights = [p.weight for p in provider_objs]
-
-    selected_name = random.choices(names, weights=weights, k=1)[0]
-    return selected_name, PROVIDERS[selected_name]
+    return order_providers(providers)[0]
 
 
 def get_provider_by_name(name: str) -> Optional[AIProvider]:
@@ -1,62 +1,333 @@
-"""LinkedIn Translator service with multi-provider support."""
+"""
+LinkedIn Translator service with multi-provider support.
 
-import random
-from typing import Dict, Any
+There is one implementation, on the providers' async clients: the async
+views await atranslate() and astream_translate() directly, and sync code
+(the job worker, management commands) calls translate(), which runs the
+same coroutine on a long-lived event loop thread.
+"""
 
-from .providers import get_enabled_providers, select_random_provider
-from .ai_clients import TRANSLATE_FUNCTIONS
+import asyncio
+import concurrent.futures
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple
 
+from django.conf import settings
 
-def translate(text: str, mode: str) -> Dict[str, Any]:
+from .providers import AIProvider, get_enabled_providers, get_health, order_providers
+from .ai_clients import ASTREAM_FUNCTIONS, ATRANSLATE_FUNCTIONS
+from .cache import translation_cache
+from .deadlines import RETRIES, Deadline, DeadlineExceeded, backoff_delay, is_retryable
+
+# Hedging (TRANSLATOR_HEDGE_DELAY > 0): if the first provider hasn't answered
+# after the delay, a second one is started and the first answer wins.
+HEDGE_DELAY = getattr(settings, 'TRANSLATOR_HEDGE_DELAY', 0)
+# Provider calls in flight at once for one translation (primary + hedges)
+HEDGE_MAX_IN_FLIGHT = 2
+
+# Extra time a sync caller waits past the deadline for the translator loop
+# to hand back the result (or the deadline error) before giving up on it
+SYNC_GRACE = 1.0
+
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """
+    The worker's event loop for sync callers, started on first use.
+
+    async_to_sync would start a new loop per call, and async clients are
+    kept per loop, so every translation would open new connections.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name='translator-loop', daemon=True).start()
+    return _loop
+
+
+def run_sync(coroutine, timeout: Optional[float] = None):
+    """
+    Run a coroutine on the translator loop and wait for its result.
+
+    If `timeout` seconds pass first the coroutine is cancelled and
+    DeadlineExceeded is raised.
+    """
+    future = asyncio.run_coroutine_threadsafe(coroutine, get_loop())
+    try:
+        return future.result(timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise DeadlineExceeded("Translation deadline exceeded") from None
+
+
+def translate(text: str, mode: str, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+    """atranslate() for sync code."""
+    deadline = deadline or Deadline()
+    return run_sync(atranslate(text, mode, deadline), timeout=deadline.remaining() + SYNC_GRACE)
+
+
+async def atranslate(text: str, mode: str, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
     """
     Translate text using a randomly selected AI provider.
-    Falls back to other providers on failure.
+    Falls back to other providers on failure. Repeated inputs are served
+    from the translation cache without calling a provider.
 
     Args:
         text: The text to translate
         mode: 'to_linkedin' or 'to_reality'
+        deadline: Time budget for all attempts (default TRANSLATOR_DEADLINE)
 
     Returns:
         dict with 'translation', 'provider_name', 'model'
 
     Raises:
-        Exception: If all providers fail
+        Exception: If all providers fail or the deadline passes
     """
+    check_mode(mode)
+
+    cached = await translation_cache.aget(text, mode)
+    if cached is not None:
+        return cached
+
+    providers = routed_providers()
+    deadline = deadline or Deadline()
+
+    if HEDGE_DELAY > 0 and len(providers) > 1:
+        result = await atranslate_hedged(text, mode, providers, HEDGE_DELAY, deadline)
+    else:
+        result = await atranslate_sequential(text, mode, providers, deadline)
+
+    await translation_cache.aput(text, mode, result)
+    return result
+
+
+def check_mode(mode: str):
     if mode not in ['to_linkedin', 'to_reality']:
         raise ValueError(f"Invalid mode: {mode}")
 
+
+def routed_providers() -> List[Tuple[str, AIProvider]]:
+    """
+    Enabled providers in a weighted random order favouring fast, healthy
+    ones; providers with an open circuit breaker are skipped.
+    """
     providers = get_enabled_providers()
 
     if not providers:
         raise ValueError("No valid AI providers configured")
 
-    # Shuffle for random fallback order
-    random.shuffle(providers)
+    return order_providers(providers)
+
+
+def translation_result(provider: AIProvider, translation: str) -> Dict[str, Any]:
+    return {
+        'translation': translation,
+        'provider_name': provider.name,
+        'model': provider.model,
+    }
+
+
+def raise_all_failed(last_error: Optional[Exception]):
+    error_msg = str(last_error) if last_error else "All translation providers failed"
+    raise Exception(f"Translation failed: {error_msg}")
+
+
+async def acall_provider(name: str, translate_func, text: str, mode: str, deadline: Deadline) -> str:
+    """
+    Call one provider, recording its latency or failure for routing.
+
+    The call is cut off at the attempt timeout even if the SDK doesn't honour
+    its own timeout (e.g. a server trickling bytes), and DeadlineExceeded is
+    raised if that was the end of the translation's budget.
+    """
+    timeout = deadline.attempt_timeout()
+    health = get_health(name)
+    start = time.monotonic()
+    try:
+        translation = await asyncio.wait_for(translate_func(text, mode, timeout=timeout), timeout)
+    except asyncio.CancelledError:
+        raise  # lost a hedge race; says nothing about the provider
+    except Exception as e:
+        if deadline.expired:
+            # Cut short by the budget; says nothing about the provider
+            raise DeadlineExceeded("Translation deadline exceeded") from e
+        health.record_failure()
+        raise
+    health.record_success(time.monotonic() - start)
+    return translation
+
+
+async def aattempt_provider(name: str, translate_func, text: str, mode: str, deadline: Deadline) -> str:
+    """Call one provider, retrying transient errors while the deadline allows."""
+    for attempt in range(RETRIES + 1):
+        try:
+            return await acall_provider(name, translate_func, text, mode, deadline)
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            if attempt == RETRIES or not is_retryable(e):
+                raise
+            delay = backoff_delay(attempt, e)
+            if delay >= deadline.remaining():
+                raise  # waiting would use up the budget; move on to the next provider
+            await asyncio.sleep(delay)
+
 
+async def atranslate_sequential(text: str, mode: str, providers: List[Tuple[str, AIProvider]],
+                                deadline: Deadline, functions=ATRANSLATE_FUNCTIONS) -> Dict[str, Any]:
+    """Try providers in order until one succeeds or the deadline passes."""
     last_error = None
 
     for name, provider in providers:
+        translate_func = functions.get(name)
+        if not translate_func:
+            continue
         try:
-            translate_func = TRANSLATE_FUNCTIONS.get(name)
+            translation = await aattempt_provider(name, translate_func, text, mode, deadline)
+        except DeadlineExceeded as e:
+            last_error = e
+            break
+        except Exception as e:
+            last_error = e
+            continue
 
-            if not translate_func:
+        return translation_result(provider, translation)
+
+    raise_all_failed(last_error)
+
+
+async def atranslate_hedged(text: str, mode: str, providers: List[Tuple[str, AIProvider]],
+                            delay: float, deadline: Deadline, functions=ATRANSLATE_FUNCTIONS) -> Dict[str, Any]:
+    """
+    Start the first provider, and the next one whenever `delay` seconds pass
+    without an answer (up to HEDGE_MAX_IN_FLIGHT at once) or a call fails.
+    Returns the first success, or gives up when the deadline passes.
+    Calls that lose the race are cancelled.
+    """
+    queue = [(name, provider) for name, provider in providers if name in functions]
+    in_flight = {}
+    last_error = None
+
+    def launch():
+        name, provider = queue.pop(0)
+        task = asyncio.ensure_future(aattempt_provider(name, functions[name], text, mode, deadline))
+        in_flight[task] = provider
+
+    try:
+        if queue:
+            launch()
+        while in_flight:
+            can_hedge = bool(queue) and len(in_flight) < HEDGE_MAX_IN_FLIGHT
+            timeout = min(delay, deadline.remaining()) if can_hedge else deadline.remaining()
+            done, _ = await asyncio.wait(in_flight, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                if deadline.expired:
+                    last_error = DeadlineExceeded("Translation deadline exceeded")
+                    break
+                launch()  # no answer yet; hedge with the next provider
                 continue
 
-            translation = translate_func(text, mode)
+            for task in done:
+                provider = in_flight.pop(task)
+                try:
+                    translation = task.result()
+                except Exception as e:
+                    last_error = e
+                    if queue and not deadline.expired:
+                        launch()  # fall back right away
+                    continue
+                return translation_result(provider, translation)
+    finally:
+        for task in in_flight:
+            task.cancel()
 
-            return {
-                'translation': translation,
-                'provider_name': provider.name,
-                'model': provider.model,
-            }
+    raise_all_failed(last_error)
 
+
+async def anext_before(stream, deadline: Deadline):
+    """
+    The stream's next chunk, or DeadlineExceeded if it doesn't arrive in
+    time. The SDK timeout only bounds each network read, so a provider that
+    keeps trickling tokens would otherwise outlive the deadline.
+    """
+    remaining = deadline.remaining()
+    if remaining <= 0:
+        raise DeadlineExceeded("Translation deadline exceeded")
+    try:
+        return await asyncio.wait_for(stream.__anext__(), remaining)
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded("Translation deadline exceeded") from None
+
+
+async def astream_translate(text: str, mode: str, deadline: Optional[Deadline] = None,
+                            functions=ASTREAM_FUNCTIONS):
+    """
+    Stream a translation as ('token', text) events followed by a single
+    ('done', result) event, where result is what translate() returns.
+
+    A cached result arrives as one token. Providers are tried in order until
+    one produces its first token. After that a failure ends the stream with
+    an exception, since text already sent can't be taken back, so there are
+    no per-provider retries here.
+    """
+    check_mode(mode)
+
+    cached = await translation_cache.aget(text, mode)
+    if cached is not None:
+        yield 'token', cached['translation']
+        yield 'done', cached
+        return
+
+    providers = routed_providers()
+    deadline = deadline or Deadline()
+    last_error = None
+
+    for name, provider in providers:
+        stream_func = functions.get(name)
+        if not stream_func:
+            continue
+
+        timeout = deadline.attempt_timeout()
+        health = get_health(name)
+        start = time.monotonic()
+        chunks = []
+        stream = stream_func(text, mode, timeout=timeout)
+        try:
+            while True:
+                try:
+                    chunk = await anext_before(stream, deadline)
+                except StopAsyncIteration:
+                    break
+                if not chunks:
+                    # Match translate(), which strips the finished text
+                    chunk = chunk.lstrip()
+                    if not chunk:
+                        continue
+                chunks.append(chunk)
+                yield 'token', chunk
+        except DeadlineExceeded as e:
+            # The budget ran out; says nothing about the provider's health
+            raise Exception(f"Translation failed: {e}") from e
         except Exception as e:
+            health.record_failure()
+            if chunks:
+                raise Exception(f"Translation failed: {e}") from e
             last_error = e
-            continue  # Try next provider
+            continue  # nothing sent yet; try the next provider
+        finally:
+            await stream.aclose()
+        health.record_success(time.monotonic() - start)
 
-    # All providers failed
-    error_msg = str(last_error) if last_error else "All translation providers failed"
-    raise Exception(f"Translation failed: {error_msg}")
+        result = translation_result(provider, ''.join(chunks).strip())
+        await translation_cache.aput(text, mode, result)
+        yield 'done', result
+        return
+
+    raise_all_failed(last_error)
 
 
 def translate_simple(text: str, mode: str) -> str:
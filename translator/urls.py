@@ -6,5 +6,7 @@ app_name = 'translator'
 urlpatterns = [
     path('', views.TranslatorView.as_view(), name='translate'),
     path('api/', views.TranslateAPIView.as_view(), name='api'),
+    path('stream/', views.TranslateStreamView.as_view(), name='stream'),
+    path('jobs/<uuid:pk>/', views.JobStatusView.as_view(), name='job'),
     path('share/<slug:slug>/', views.ShareView.as_view(), name='share'),
 ]
@@ -0,0 +1,74 @@
+"""
+Share-page view counting for translations.
+
+By default every view is an immediate `UPDATE ... SET view_count =
+view_count + 1`. With TRANSLATION_VIEW_COUNT_FLUSH_INTERVAL > 0, views are
+coalesced per translation in memory and a background thread writes one
+UPDATE per translation every interval (and once more at worker exit).
+"""
+
+import atexit
+import logging
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import F
+
+from .models import Translation
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCountBatcher:
+    """Coalesces view count increments and flushes them periodically."""
+
+    def __init__(self, flush_interval):
+        self.flush_interval = flush_interval
+        self._pending = Counter()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def add(self, pk):
+        with self._lock:
+            self._pending[pk] += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='translation-view-counts', daemon=True
+                )
+                self._thread.start()
+
+    def flush(self):
+        """Write all pending increments. Returns the number of views written."""
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+
+        written = 0
+        for pk, n in pending.items():
+            try:
+                Translation.objects.filter(pk=pk).update(view_count=F('view_count') + n)
+                written += n
+            except Exception:
+                logger.exception("Dropped %d view(s) for translation %s", n, pk)
+        return written
+
+    def _run(self):
+        stop = threading.Event()
+        while not stop.wait(self.flush_interval):
+            self.flush()
+            connection.close()
+
+
+FLUSH_INTERVAL = getattr(settings, 'TRANSLATION_VIEW_COUNT_FLUSH_INTERVAL', 0)
+batcher = ViewCountBatcher(FLUSH_INTERVAL) if FLUSH_INTERVAL > 0 else None
+if batcher:
+    atexit.register(batcher.flush)
+
+
+def increment_view_count(translation):
+    """Count a view of a shared translation, touching only view_count."""
+    if batcher:
+        batcher.add(translation.pk)
+    else:
+        Translation.objects.filter(pk=translation.pk).update(view_count=F('view_count') + 1)
@@ -1,46 +1,88 @@
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.shortcuts import render, get_object_or_404
 from django.views.generic import View, DetailView
-from django.http import JsonResponse
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.urls import reverse
 
-from .models import Translation
-from .services import translate
+from .jobs import aenqueue
+from .models import Translation, TranslationJob
+from .services import astream_translate, atranslate
 from .providers import get_enabled_providers
+from .view_counts import increment_view_count
+
+arender = sync_to_async(render)
+
+# Enqueue translations for run_translation_jobs instead of calling providers
+# in the request (see jobs.py)
+JOB_MODE = getattr(settings, 'TRANSLATOR_JOB_MODE', False)
 
 
 class TranslatorView(View):
-    """Main translator tool page."""
+    """
+    Main translator tool page.
+
+    Async so that, under ASGI, a worker isn't tied up for the LLM round
+    trip; template rendering may touch the session (flash messages), so it
+    runs in a thread.
+    """
 
-    def get(self, request):
+    async def render_page(self, request, template, context):
+        # Job mode pages poll for results instead of streaming them
+        context['job_mode'] = JOB_MODE
+        return await arender(request, template, context)
+
+    async def get(self, request):
         providers = get_enabled_providers()
-        return render(request, 'translator/translate.html', {
+        return await self.render_page(request, 'translator/translate.html', {
             'has_api_key': len(providers) > 0,
         })
 
-    def post(self, request):
+    async def post(self, request):
         text = request.POST.get('text', '').strip()
         mode = request.POST.get('mode', 'to_linkedin')
         providers = get_enabled_providers()
 
         if not text:
-            return render(request, 'translator/translate.html', {
+            return await self.render_page(request, 'translator/translate.html', {
                 'error': 'Please enter some text to translate.',
                 'has_api_key': len(providers) > 0,
             })
 
         if not providers:
-            return render(request, 'translator/translate.html', {
+            return await self.render_page(request, 'translator/translate.html', {
                 'error': 'No AI providers configured. Translation unavailable.',
                 'has_api_key': False,
             })
 
+        if JOB_MODE:
+            context = {
+                'original_text': text,
+                'mode': mode,
+                'mode_display': 'Make it LinkedIn' if mode == 'to_linkedin' else 'Make it Real',
+                'has_api_key': True,
+                'job': await aenqueue(text, mode),
+            }
+        else:
+            context = await self.translate_now(text, mode)
+
+        # For HTMX requests, return just the result partial
+        if request.htmx:
+            return await self.render_page(request, 'translator/partials/result.html', context)
+
+        return await self.render_page(request, 'translator/translate.html', context)
+
+    async def translate_now(self, text, mode):
         try:
             # Perform translation - now returns a dict
-            result = translate(text, mode)
+            result = await atranslate(text, mode)
             translated_text = result['translation']
             provider_name = result['provider_name']
 
             # Save translation for sharing
-            translation = Translation.objects.create(
+            translation = await Translation.objects.acreate(
                 original_text=text,
                 translated_text=translated_text,
                 mode=mode,
@@ -65,19 +107,13 @@ class TranslatorView(View):
                 'error': str(e),
             }
 
-        # For HTMX requests, return just the result partial
-        if request.htmx:
-            return render(request, 'translator/partials/result.html', context)
-
-        return render(request, 'translator/translate.html', context)
+        return context
 
 
 class TranslateAPIView(View):
     """API endpoint for translations."""
 
-    def post(self, request):
-        import json
-
+    async def post(self, request):
         try:
             data = json.loads(request.body)
             text = data.get('text', '').strip()
@@ -92,11 +128,15 @@ class TranslateAPIView(View):
         if not providers:
             return JsonResponse({'error': 'No AI providers configured'}, status=503)
 
+        if JOB_MODE:
+            job = await aenqueue(text, mode)
+            return JsonResponse(job_payload(request, job), status=202)
+
         try:
-            result = translate(text, mode)
+            result = await atranslate(text, mode)
 
             # Save for sharing
-            translation = Translation.objects.create(
+            translation = await Translation.objects.acreate(
                 original_text=text,
                 translated_text=result['translation'],
                 mode=mode,
@@ -114,6 +154,100 @@ class TranslateAPIView(View):
             return JsonResponse({'error': str(e)}, status=500)
 
 
+class TranslateStreamView(View):
+    """
+    Streams a translation to the browser as server-sent events while the
+    provider generates it: `token` events with text chunks, then a `done`
+    event with the share URL once the Translation is saved, or an `error`
+    event. Takes the same form fields as TranslatorView.
+    """
+
+    async def post(self, request):
+        text = request.POST.get('text', '').strip()
+        mode = request.POST.get('mode', 'to_linkedin')
+
+        if not text:
+            return JsonResponse({'error': 'Text is required'}, status=400)
+
+        if not get_enabled_providers():
+            return JsonResponse({'error': 'No AI providers configured'}, status=503)
+
+        response = StreamingHttpResponse(self.events(request, text, mode), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        # Stop nginx-style proxies from buffering the stream
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    async def events(self, request, text, mode):
+        try:
+            async for kind, value in astream_translate(text, mode):
+                if kind == 'token':
+                    yield sse('token', {'text': value})
+                    continue
+
+                # Save translation for sharing
+                translation = await Translation.objects.acreate(
+                    original_text=text,
+                    translated_text=value['translation'],
+                    mode=mode,
+                )
+                yield sse('done', {
+                    'translation': value['translation'],
+                    'powered_by': value['provider_name'],
+                    'share_url': translation.get_absolute_url(),
+                })
+        except Exception as e:
+            yield sse('error', {'error': str(e)})
+
+
+def sse(event, data):
+    """One server-sent event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+class JobStatusView(View):
+    """
+    Poll a translation job: JSON for API clients, or for HTMX the job's
+    status partial, which keeps polling until the job finishes.
+    """
+
+    async def get(self, request, pk):
+        try:
+            job = await TranslationJob.objects.select_related('translation').aget(pk=pk)
+        except TranslationJob.DoesNotExist:
+            raise Http404
+
+        if request.htmx:
+            return await arender(request, 'translator/partials/job_status.html', {'job': job})
+        return JsonResponse(job_payload(request, job))
+
+
+def job_payload(request, job):
+    data = {
+        'job_id': str(job.pk),
+        'status': job.status,
+        'mode': job.mode,
+        'status_url': request.build_absolute_uri(reverse('translator:job', kwargs={'pk': job.pk})),
+    }
+    if job.status == TranslationJob.STATUS_DONE and job.translation is None:
+        # The translation was deleted after the job finished (the foreign
+        # key is SET_NULL), so there is nothing left to show
+        data.update({
+            'status': TranslationJob.STATUS_FAILED,
+            'error': 'This translation is no longer available.',
+        })
+    elif job.status == TranslationJob.STATUS_DONE:
+        data.update({
+            'original': job.text,
+            'translated': job.translation.translated_text,
+            'powered_by': job.provider_name,
+            'share_url': request.build_absolute_uri(job.translation.get_absolute_url()),
+        })
+    elif job.status == TranslationJob.STATUS_FAILED:
+        data['error'] = job.error
+    return data
+
+
 class ShareView(DetailView):
     """View a shared translation."""
     model = Translation
@@ -124,9 +258,10 @@ class ShareView(DetailView):
 
     def get_object(self, queryset=None):
         obj = super().get_object(queryset)
-        # Increment view count
+        # Increment view count atomically (or batched, see view_counts.py);
+        # the page shows the count including this view.
+        increment_view_count(obj)
         obj.view_count += 1
-        obj.save(update_fields=['view_count'])
         return obj
 
     def get_context_data(self, **kwargs):